@@ -0,0 +1,34 @@
+import asyncio
+import random
+
+from tulip_api.asyncio import TulipAPI, TulipTable, TulipTablePipeline
+
+table_id = "y8rPN23g67yxdLiqT"
+
+
+# This adds a number between 0.0 and 100.0 to the value in column `afgga_d`
+# for each record that the `id` contains the phrase `ab`.
+# Records are read, transformed and updated at the same time.
+def transform(record):
+    return {"afgga_d": record["afgga_d"] + random.random() * 100.0}
+
+
+async def main():
+    async with TulipAPI("abc.tulip.co", concurrency=20) as api:
+        stats = await TulipTablePipeline(
+            TulipTable(api, table_id),
+            transform,
+            filters=[
+                {
+                    "field": "id",
+                    "functionType": "contains",
+                    "arg": "ab",
+                },
+            ],
+        ).execute()
+        for stage in stats.values():
+            print(stage)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,7 +10,7 @@ table_id = "PT929bpqB3s84bbTf"
 
 async def main():
     start_time = time.time()
-    with TulipAPI(
+    async with TulipAPI(
         "abc.tulip.co",
         concurrency=concurrency,
     ) as api:
@@ -0,0 +1,104 @@
+"""
+Measures `import tulip_api` startup time with `python -X importtime`, and checks that
+HTTP libraries are only imported by the client that needs them.
+
+Exits with a non-zero status if a check fails, so it can be run in CI.
+
+Usage: python scripts/benchmark_import_time.py [--repeat 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (statement, modules that must not be imported by it)
+IMPORT_CHECKS: List[Tuple[str, List[str]]] = [
+    ("import tulip_api", ["requests", "aiohttp"]),
+    ("import tulip_api.asyncio", ["requests", "aiohttp"]),
+    ("import tulip_api.exceptions", ["requests", "aiohttp"]),
+    ("from tulip_api import TulipAPI, TulipTable", ["aiohttp"]),
+    ("from tulip_api.asyncio import TulipAPI, TulipTable", ["requests"]),
+    ("from tulip_api import TulipMachine", ["requests", "aiohttp"]),
+    ("from tulip_api.asyncio import TulipMachine", ["requests", "aiohttp"]),
+]
+
+
+def run_python(arguments: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *arguments],
+        cwd=REPOSITORY_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_time(statement: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Returns the import time of `statement` in microseconds,
+    and the cumulative import time of each top level package it imported.
+    """
+    stderr = run_python(["-X", "importtime", "-c", statement]).stderr
+    total = 0
+    packages: Dict[str, int] = {}
+    started = False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented by two spaces per level.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        started = started or name.startswith("tulip_api")
+        if not started:
+            continue
+        if depth == 0:
+            total += int(cumulative)
+        package = name.split(".")[0]
+        packages[package] = max(packages.get(package, 0), int(cumulative))
+    return total, packages
+
+
+def imported_modules(statement: str, modules: List[str]) -> List[str]:
+    stdout = run_python(
+        [
+            "-c",
+            f"import sys\n{statement}\nprint(' '.join(m for m in {modules!r} if m in sys.modules))",
+        ]
+    ).stdout
+    return stdout.split()
+
+
+def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--repeat", type=int, default=5)
+    arguments = argument_parser.parse_args()
+
+    failed = False
+    print(f"{'statement':<55}{'best import time':>18}")
+    for statement, forbidden_modules in IMPORT_CHECKS:
+        best_time, packages = min(
+            (import_time(statement) for _ in range(arguments.repeat)),
+            key=lambda result: result[0],
+        )
+        print(f"{statement:<55}{best_time / 1000:>15.1f} ms")
+        slowest = sorted(
+            [item for item in packages.items() if item[0] != "tulip_api"],
+            key=lambda item: -item[1],
+        )[:3]
+        print("    " + ", ".join(f"{name} {us / 1000:.1f} ms" for name, us in slowest))
+
+        unexpected = imported_modules(statement, forbidden_modules)
+        if len(unexpected) > 0:
+            failed = True
+            print(f"    FAIL: `{statement}` imported {', '.join(unexpected)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
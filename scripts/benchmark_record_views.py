@@ -0,0 +1,119 @@
+"""
+Compares lazy `TulipTableRecord` views with eagerly converting every field of every record,
+when a consumer reads one field, a few fields, or every field of each record (each field read twice).
+The speedup is of attribute access over eager conversion.
+
+Usage: python scripts/benchmark_record_views.py [--records 200000]
+"""
+
+import argparse
+import time
+from operator import attrgetter
+from typing import Callable, Dict, List
+
+from tulip_api.tulip_table_record import TulipTableRecord, _converters
+
+TABLE_COLUMNS = [
+    {"name": "id", "dataType": {"type": "string"}},
+    {"name": "_createdAt", "dataType": {"type": "timestamp"}},
+    {"name": "_updatedAt", "dataType": {"type": "timestamp"}},
+    {"name": "afgga_d", "dataType": {"type": "float"}},
+    {"name": "bqwkz_count", "dataType": {"type": "integer"}},
+    {"name": "cnsda_active", "dataType": {"type": "boolean"}},
+    {"name": "dhzuq_label", "dataType": {"type": "string"}},
+    {"name": "eoxlp_started", "dataType": {"type": "timestamp"}},
+    {"name": "fpqrs_finished", "dataType": {"type": "timestamp"}},
+]
+
+
+def make_record(index: int) -> dict:
+    return {
+        "id": f"record-{index:08d}",
+        "_createdAt": "2023-03-01T12:00:00.000Z",
+        "_updatedAt": "2023-03-01T12:30:00.000Z",
+        "afgga_d": index * 1.5,
+        "bqwkz_count": index % 97,
+        "cnsda_active": index % 2 == 0,
+        "dhzuq_label": f"Work order {index}",
+        "eoxlp_started": "2023-03-01T12:05:00.000Z",
+        "fpqrs_finished": "2023-03-01T12:25:00.000Z",
+    }
+
+
+def eager_convert(record: dict, column_types: Dict[str, str]) -> dict:
+    """
+    What a consumer does without record views: converts every field of the record up front.
+    """
+    converted = {}
+    for field, value in record.items():
+        convert = _converters.get(column_types.get(field, "string"))
+        converted[field] = value if value is None or convert is None else convert(value)
+    return converted
+
+
+def time_it(function: Callable[[], None], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--records", type=int, default=200000)
+    arguments = argument_parser.parse_args()
+
+    records = [make_record(index) for index in range(arguments.records)]
+    column_types = {
+        column["name"]: column["dataType"]["type"] for column in TABLE_COLUMNS
+    }
+    Record = TulipTableRecord.record_type(TABLE_COLUMNS)
+    reads: Dict[str, List[str]] = {
+        "1 field": ["_updatedAt"],
+        "3 fields": ["_updatedAt", "bqwkz_count", "dhzuq_label"],
+        "all fields": [column["name"] for column in TABLE_COLUMNS],
+    }
+
+    print(
+        f"{'reads':<14}{'eager':>14}{'view[field]':>14}{'view.field':>14}{'speedup':>10}"
+    )
+    for label, fields in reads.items():
+        getters = [attrgetter(field) for field in fields]
+
+        def eager():
+            for record in records:
+                converted = eager_convert(record, column_types)
+                for _ in range(2):
+                    for field in fields:
+                        converted[field]
+
+        def lazy_items():
+            for record in records:
+                view = Record(record)
+                for _ in range(2):
+                    for field in fields:
+                        view[field]
+
+        def lazy_attributes():
+            for record in records:
+                view = Record(record)
+                for _ in range(2):
+                    for getter in getters:
+                        getter(view)
+
+        eager_seconds = time_it(eager)
+        items_seconds = time_it(lazy_items)
+        attributes_seconds = time_it(lazy_attributes)
+        print(
+            f"{label:<14}"
+            f"{len(records) / eager_seconds:>10.0f} r/s"
+            f"{len(records) / items_seconds:>10.0f} r/s"
+            f"{len(records) / attributes_seconds:>10.0f} r/s"
+            f"{eager_seconds / attributes_seconds:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compares the available serializers on the two hot paths of the TulipAPI clients:
+decoding 100 record pages (`stream_records`) and encoding record bodies (`create_records`).
+
+Usage: python scripts/benchmark_serializers.py [--pages 2000]
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from tulip_api.exceptions import TulipAPIOptionalDependencyMissing
+from tulip_api.serializers import JSONSerializer, ORJSONSerializer
+
+
+def make_record(index: int) -> dict:
+    return {
+        "id": f"record-{index:08d}",
+        "_createdAt": "2023-03-01T12:00:00.000Z",
+        "_updatedAt": "2023-03-01T12:30:00.000Z",
+        "_sequenceNumber": index,
+        "afgga_d": index * 1.5,
+        "bqwkz_count": index % 97,
+        "cnsda_active": index % 2 == 0,
+        "dhzuq_label": f"Work order {index}",
+        "eoxlp_station": {"id": "station-1", "name": "Station 1"},
+    }
+
+
+def time_it(function: Callable[[], None], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--pages", type=int, default=2000)
+    arguments = argument_parser.parse_args()
+
+    serializers: List[JSONSerializer] = [JSONSerializer()]
+    try:
+        serializers.append(ORJSONSerializer())
+    except TulipAPIOptionalDependencyMissing:
+        print("orjson is not installed, only benchmarking the json module.")
+
+    page = [make_record(index) for index in range(100)]
+    page_bytes = JSONSerializer().dumps(page)
+    records = page * arguments.pages
+
+    print(f"{'serializer':<20}{'page decode':>16}{'create encode':>18}")
+    for serializer in serializers:
+        decode_seconds = time_it(
+            lambda: [serializer.loads(page_bytes) for _ in range(arguments.pages)]
+        )
+        encode_seconds = time_it(
+            lambda: [serializer.dumps(record) for record in records]
+        )
+        print(
+            f"{type(serializer).__name__:<20}"
+            f"{arguments.pages / decode_seconds:>10.0f} pg/s"
+            f"{len(records) / encode_seconds:>12.0f} rec/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
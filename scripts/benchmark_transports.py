@@ -0,0 +1,147 @@
+"""
+Compares the HTTP transports of both TulipAPI clients by fetching record pages with `concurrency` requests in flight.
+
+By default it runs against a local HTTP/1.1 server and also reports the # of connections each transport opened.
+HTTP/2 is only negotiated over TLS, so pass `--url` (with `--auth` and `--table`) to compare against a Tulip instance,
+where the `httpx` transports multiplex their requests over a single connection.
+
+Usage: python scripts/benchmark_transports.py [--requests 2000] [--concurrency 20] [--url https://abc.tulip.co --auth ... --table ...]
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Set, Tuple
+
+from tulip_api.asyncio.tulip_api import TulipAPI as AsyncTulipAPI
+from tulip_api.asyncio.tulip_table import TulipTable as AsyncTulipTable
+from tulip_api.exceptions import TulipAPIOptionalDependencyMissing
+from tulip_api.tulip_api import TulipAPI
+from tulip_api.tulip_table import TulipTable
+
+PAGE = json.dumps(
+    [
+        {
+            "id": f"record-{index:08d}",
+            "_createdAt": "2023-03-01T12:00:00.000Z",
+            "_updatedAt": "2023-03-01T12:30:00.000Z",
+            "afgga_d": index * 1.5,
+            "dhzuq_label": f"Work order {index}",
+        }
+        for index in range(100)
+    ]
+).encode("utf-8")
+
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+    + f"Content-Length: {len(PAGE)}\r\n\r\n".encode("utf-8")
+    + PAGE
+)
+
+# The (host, port) of every client connection the local server accepted.
+connections: Set[Tuple[str, int]] = set()
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        connections.add(self.client_address)
+        # Written with a single send, so Nagle's algorithm doesn't delay the body behind the headers.
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *_):
+        pass
+
+
+def start_local_server() -> str:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def benchmark_sync(
+    url: str, auth: str, table_id: str, transport: str, requests: int, concurrency: int
+) -> float:
+    api = TulipAPI(url, auth=auth, use_full_url=True, transport=transport)
+    api.host = f"{url}/api/v3/"
+    table = TulipTable(api, table_id)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda _: table.get_records(), range(requests)))
+    elapsed = time.perf_counter() - start
+    api.close()
+    return elapsed
+
+
+async def benchmark_async(
+    url: str, auth: str, table_id: str, transport: str, requests: int, concurrency: int
+) -> float:
+    async with AsyncTulipAPI(
+        url, concurrency=concurrency, auth=auth, use_full_url=True, transport=transport
+    ) as api:
+        api.host = f"{url}/api/v3/"
+        table = AsyncTulipTable(api, table_id)
+        start = time.perf_counter()
+        await asyncio.gather(*[table.get_records() for _ in range(requests)])
+        return time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--requests", type=int, default=2000)
+    argument_parser.add_argument("--concurrency", type=int, default=20)
+    argument_parser.add_argument("--url", default=None)
+    argument_parser.add_argument("--auth", default="benchmark")
+    argument_parser.add_argument("--table", default="benchmark")
+    arguments = argument_parser.parse_args()
+
+    local = arguments.url is None
+    url = start_local_server() if local else arguments.url
+    benchmarks: List[Tuple[str, str]] = [
+        ("sync", "requests"),
+        ("sync", "httpx"),
+        ("asyncio", "aiohttp"),
+        ("asyncio", "httpx"),
+    ]
+
+    print(f"{'client':<10}{'transport':<12}{'requests/s':>12}{'connections':>14}")
+    for client, transport in benchmarks:
+        connections.clear()
+        try:
+            if client == "sync":
+                elapsed = benchmark_sync(
+                    url,
+                    arguments.auth,
+                    arguments.table,
+                    transport,
+                    arguments.requests,
+                    arguments.concurrency,
+                )
+            else:
+                elapsed = asyncio.run(
+                    benchmark_async(
+                        url,
+                        arguments.auth,
+                        arguments.table,
+                        transport,
+                        arguments.requests,
+                        arguments.concurrency,
+                    )
+                )
+        except TulipAPIOptionalDependencyMissing as e:
+            print(f"{client:<10}{transport:<12}  skipped: {e.message}")
+            continue
+        print(
+            f"{client:<10}{transport:<12}{arguments.requests / elapsed:>12.0f}"
+            f"{len(connections) if local else '-':>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,12 @@ setup(
     package_data={"tulip_api": ["py.typed"], "tulip_api.asyncio": ["py.typed"]},
     include_package_data=True,
     install_requires=["requests", "aiohttp", "python-dateutil"],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "dataframe": ["numpy", "pandas"],
+        "fast": ["orjson"],
+        "http2": ["httpx[http2]"],
+    },
     long_description=read("README.md"),
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -0,0 +1,79 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+
+class FakeTulipServer(ThreadingHTTPServer):
+    """
+    A minimal in-process Tulip instance serving a single table's records.
+
+    `records` backs GET `/tables/{tableId}/records`, created records are collected in `created`,
+    and every request is logged in `requests` as `(method, path)`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        super().__init__(("127.0.0.1", 0), FakeTulipHandler)
+        self.records = records
+        self.created: List[Dict[str, Any]] = []
+        self.requests: List[Tuple[str, str]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeTulipHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeTulipServer
+
+    def log_message(self, *_):
+        pass
+
+    def _respond(self, status_code: int, body: Any = None):
+        content = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _handle(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        with self.server.lock:
+            self.server.requests.append((self.command, url.path))
+
+        if url.path.endswith("/records") and self.command == "GET":
+            offset = int(query.get("offset", 0))
+            limit = int(query.get("limit", 100))
+            return self._respond(200, self.server.records[offset : offset + limit])
+        if url.path.endswith("/count"):
+            return self._respond(200, {"count": len(self.server.records)})
+        if url.path.endswith("/records") and self.command == "POST":
+            with self.server.lock:
+                self.server.created.append(body)
+            return self._respond(201, body)
+        return self._respond(204)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+
+@pytest.fixture
+def tulip_server():
+    server = FakeTulipServer(
+        [{"id": str(i), "value": i} for i in range(350)],
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+import requests
+
+from tulip_api.exceptions import (
+    TulipAPIConnectionError,
+    TulipAPIInternalError,
+    TulipAPIMalformedRequestError,
+    TulipAPINotFoundError,
+    TulipApiTableRecordCreateMustIncludeID,
+    TulipAPIUnknownResponse,
+    is_retryable,
+)
+
+
+def response(status_code: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        status_code=status_code,
+        content=b"",
+        request_body=None,
+        method="POST",
+        url="http://tulip",
+    )
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        TulipAPIUnknownResponse(response(429)),
+        TulipAPIInternalError(response(500)),
+        TulipAPIInternalError(response(503)),
+        TulipAPIConnectionError(),
+        ConnectionError(),
+        TimeoutError(),
+        asyncio.TimeoutError(),
+        requests.ConnectionError(),
+        requests.Timeout(),
+        aiohttp.ServerDisconnectedError(),
+    ],
+)
+def test_transient_failures_are_retryable(exception: Exception):
+    assert is_retryable(exception)
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        TulipAPIMalformedRequestError(response(400)),
+        TulipAPINotFoundError(response(404)),
+        TulipAPIUnknownResponse(response(409)),
+        TulipApiTableRecordCreateMustIncludeID(),
+        requests.HTTPError(),
+        ValueError(),
+        TypeError(),
+    ],
+)
+def test_other_failures_are_not_retryable(exception: Exception):
+    assert not is_retryable(exception)
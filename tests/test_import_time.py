@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_modules(statement: str, modules: List[str]) -> List[str]:
+    """
+    Runs `statement` in a fresh interpreter, and returns which of `modules` it imported.
+    """
+    stdout = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{statement}\nprint(' '.join(m for m in {modules!r} if m in sys.modules))",
+        ],
+        cwd=REPOSITORY_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return stdout.split()
+
+
+@pytest.mark.parametrize(
+    "statement, forbidden_modules",
+    [
+        ("import tulip_api", ["requests", "aiohttp", "httpx"]),
+        ("import tulip_api.asyncio", ["requests", "aiohttp", "httpx"]),
+        ("import tulip_api.exceptions", ["requests", "aiohttp", "asyncio"]),
+        ("from tulip_api import TulipAPI, TulipTable", ["aiohttp"]),
+        ("from tulip_api.asyncio import TulipAPI, TulipTable", ["requests"]),
+        ("from tulip_api import TulipMachine", ["requests", "aiohttp"]),
+        ("from tulip_api.asyncio import TulipMachine", ["requests", "aiohttp"]),
+    ],
+)
+def test_heavy_dependencies_are_imported_lazily(
+    statement: str, forbidden_modules: List[str]
+):
+    assert imported_modules(statement, forbidden_modules) == []
+
+
+def test_import_time_is_measurable():
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import tulip_api"],
+        cwd=REPOSITORY_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    imported = [
+        line.split("|")[-1].strip()
+        for line in stderr.splitlines()
+        if line.startswith("import time:")
+    ]
+    assert "tulip_api" in imported
+    assert not any(name.split(".")[0] in ("requests", "aiohttp") for name in imported)
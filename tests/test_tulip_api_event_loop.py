@@ -0,0 +1,46 @@
+import threading
+
+from tulip_api import TulipAPI, TulipTable
+
+
+def bulk_client(url: str) -> TulipAPI:
+    tulip_api = TulipAPI(url, auth="token", use_full_url=True, bulk_concurrency=4)
+    tulip_api.host = f"{url}/api/v3/"
+    return tulip_api
+
+
+def test_bulk_copy_between_tables(tulip_server):
+    tulip_api = bulk_client(tulip_server.url)
+    source = TulipTable(tulip_api, "source")
+    destination = TulipTable(tulip_api, "destination")
+    created = []
+
+    # Both calls run on the same background event loop, so the copy runs on a thread to catch a deadlock.
+    copy = threading.Thread(
+        target=lambda: created.append(
+            destination.create_records(source.stream_records())
+        ),
+        daemon=True,
+    )
+    copy.start()
+    copy.join(timeout=30)
+
+    assert not copy.is_alive(), "copying between tables deadlocked"
+    assert created == [350]
+    assert sorted(record["id"] for record in tulip_server.created) == sorted(
+        record["id"] for record in tulip_server.records
+    )
+
+
+def test_bulk_create_reads_records_on_the_calling_thread(tulip_server):
+    tulip_api = bulk_client(tulip_server.url)
+    destination = TulipTable(tulip_api, "destination")
+    threads = set()
+
+    def records():
+        for i in range(10):
+            threads.add(threading.get_ident())
+            yield {"id": str(i)}
+
+    assert destination.create_records(records()) == 10
+    assert threads == {threading.get_ident()}
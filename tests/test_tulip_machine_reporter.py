@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from tulip_api.exceptions import TulipAPIConnectionError, TulipAPIMalformedRequestError
+from tulip_api.tulip_machine_event_spool import TulipMachineEventSpool
+from tulip_api.tulip_machine_reporter import TulipMachineReporter
+
+
+class FakeTulipAPI:
+    """
+    Records the attributes of every report, and raises `failure` instead while it is set.
+    """
+
+    def __init__(self):
+        self.reports: List[List[Dict[str, Any]]] = []
+        self.failure: Optional[Exception] = None
+
+    def make_request_expect_nothing(self, path: str, method: str, json: Dict):
+        assert (path, method) == (TulipMachineReporter.attributes_report_path, "POST")
+        if self.failure is not None:
+            raise self.failure
+        self.reports.append(json["attributes"])
+
+
+def attribute(value: int) -> Dict[str, Any]:
+    return {"machineId": "m", "attributeId": "a", "value": value}
+
+
+@pytest.fixture
+def spool(tmp_path) -> TulipMachineEventSpool:
+    return TulipMachineEventSpool(str(tmp_path / "spool"))
+
+
+def test_unreachable_batches_are_spooled_and_replayed_in_order(spool):
+    tulip_api = FakeTulipAPI()
+    with TulipMachineReporter(
+        tulip_api, max_batch_size=2, flush_interval=60, spool=spool
+    ) as reporter:
+        tulip_api.failure = TulipAPIConnectionError()
+        reporter.queue_attributes([attribute(1), attribute(2), attribute(3)])
+        assert reporter.flush() == 0
+        reporter.queue_attributes([attribute(4)])
+        assert reporter.flush() == 0
+        assert not spool.is_empty()
+        assert tulip_api.reports == []
+
+        tulip_api.failure = None
+        reporter.queue_attributes([attribute(5)])
+        assert reporter.flush() == 3
+
+    assert spool.is_empty()
+    assert [[a["value"] for a in report] for report in tulip_api.reports] == [
+        [1, 2],
+        [3, 4],
+        [5],
+    ]
+
+
+def test_replayed_batches_are_acknowledged(tmp_path, spool):
+    tulip_api = FakeTulipAPI()
+    tulip_api.failure = TulipAPIConnectionError()
+    with TulipMachineReporter(
+        tulip_api, max_batch_size=2, flush_interval=60, spool=spool
+    ) as reporter:
+        reporter.queue_attributes([attribute(1), attribute(2)])
+        reporter.flush()
+        tulip_api.failure = None
+
+    # A restarted reporter doesn't replay batches that were already sent.
+    reopened_spool = TulipMachineEventSpool(str(tmp_path / "spool"))
+    assert reopened_spool.is_empty()
+    with TulipMachineReporter(
+        tulip_api, flush_interval=60, spool=reopened_spool
+    ) as reporter:
+        assert reporter.flush() == 0
+    assert len(tulip_api.reports) == 1
+
+
+def test_rejected_spooled_batches_are_dropped(spool, capsys):
+    spool.append([attribute(1)])
+    spool.append([attribute(2)])
+    tulip_api = FakeTulipAPI()
+    tulip_api.failure = TulipAPIMalformedRequestError(
+        SimpleNamespace(
+            status_code=400,
+            content=b"",
+            request_body=None,
+            method="POST",
+            url="http://tulip",
+        )
+    )
+    with TulipMachineReporter(
+        tulip_api, max_batch_size=1, flush_interval=60, spool=spool
+    ) as reporter:
+        assert reporter.flush() == 0
+    assert spool.is_empty()
+    assert "Dropping spooled machine attributes that were rejected" in (
+        capsys.readouterr().out
+    )
+
+
+def test_unreachable_replay_keeps_the_spool(spool):
+    spool.append([attribute(1)])
+    tulip_api = FakeTulipAPI()
+    tulip_api.failure = TulipAPIConnectionError()
+    reporter = TulipMachineReporter(tulip_api, flush_interval=60, spool=spool)
+    reporter.queue_attributes([attribute(2)])
+    assert reporter.flush() == 0
+
+    tulip_api.failure = None
+    reporter.close()
+    assert spool.is_empty()
+    assert [[a["value"] for a in report] for report in tulip_api.reports] == [[1, 2]]
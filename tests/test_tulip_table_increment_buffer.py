@@ -0,0 +1,120 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from tulip_api.asyncio.tulip_table_increment_buffer import (
+    TulipTableIncrementBuffer as AsyncTulipTableIncrementBuffer,
+)
+from tulip_api.exceptions import (
+    TulipAPIConnectionError,
+    TulipAPIInternalError,
+    TulipAPINotFoundError,
+)
+from tulip_api.tulip_table_increment_buffer import TulipTableIncrementBuffer
+
+
+def response(status_code: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        status_code=status_code,
+        content=b"",
+        request_body=None,
+        method="PATCH",
+        url="http://tulip",
+    )
+
+
+class FakeTulipTable:
+    """
+    Records every increment, and raises the exception set for a record in `failures` instead.
+    """
+
+    def __init__(self):
+        self.increments: List[Tuple[str, str, int]] = []
+        self.failures: Dict[str, Optional[Exception]] = {}
+
+    def increment_record_column(self, record_id: str, column_id: str, value: int):
+        exception = self.failures.get(record_id)
+        if exception is not None:
+            raise exception
+        self.increments.append((record_id, column_id, value))
+
+
+class FakeAsyncTulipTable(FakeTulipTable):
+    async def increment_record_column(self, record_id: str, column_id: str, value: int):
+        super().increment_record_column(record_id, column_id, value)
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [TulipAPIConnectionError(), TulipAPIInternalError(response(503))],
+)
+def test_retryable_failures_are_requeued(exception: Exception):
+    table = FakeTulipTable()
+    with TulipTableIncrementBuffer(table, flush_interval=60) as buffer:
+        buffer.increment_record_column("a", "count", 1)
+        buffer.increment_record_column("a", "count", 2)
+        buffer.increment_record_column("b", "count", 5)
+        table.failures["a"] = exception
+
+        with pytest.raises(type(exception)):
+            buffer.flush()
+        assert table.increments == [("b", "count", 5)]
+
+        buffer.increment_record_column("a", "count", 4)
+        table.failures["a"] = None
+        assert buffer.flush() == 1
+    assert table.increments == [("b", "count", 5), ("a", "count", 7)]
+
+
+def test_rejected_increments_are_dropped(capsys):
+    table = FakeTulipTable()
+    with TulipTableIncrementBuffer(table, flush_interval=60) as buffer:
+        buffer.increment_record_column("deleted", "count", 1)
+        buffer.increment_record_column("b", "count", 5)
+        table.failures["deleted"] = TulipAPINotFoundError(response(404))
+
+        assert buffer.flush() == 2
+        assert buffer.flush() == 0
+    assert table.increments == [("b", "count", 5)]
+    assert "Dropped the increment of count of record deleted by 1" in (
+        capsys.readouterr().out
+    )
+
+
+def test_close_keeps_increments_when_the_final_flush_fails():
+    table = FakeTulipTable()
+    buffer = TulipTableIncrementBuffer(table, flush_interval=60)
+    buffer.increment_record_column("a", "count", 3)
+    table.failures["a"] = TulipAPIConnectionError()
+
+    with pytest.raises(TulipAPIConnectionError):
+        buffer.close()
+
+    table.failures["a"] = None
+    buffer.close()
+    assert table.increments == [("a", "count", 3)]
+
+
+def test_async_retryable_failures_are_requeued_and_rejected_ones_dropped():
+    table = FakeAsyncTulipTable()
+
+    async def run():
+        async with AsyncTulipTableIncrementBuffer(table, flush_interval=60) as buffer:
+            buffer.increment_record_column("a", "count", 1)
+            buffer.increment_record_column("deleted", "count", 1)
+            buffer.increment_record_column("b", "count", 5)
+            table.failures["a"] = TulipAPIConnectionError()
+            table.failures["deleted"] = TulipAPINotFoundError(response(404))
+
+            with pytest.raises(TulipAPIConnectionError):
+                await buffer.flush()
+            assert table.increments == [("b", "count", 5)]
+
+            buffer.increment_record_column("a", "count", 2)
+            table.failures["a"] = None
+            assert await buffer.flush() == 1
+
+    asyncio.run(run())
+    assert table.increments == [("b", "count", 5), ("a", "count", 3)]
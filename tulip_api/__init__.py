@@ -1,6 +1,95 @@
-from tulip_api.cached_tulip_table import CachedTulipTable
-from tulip_api.tulip_api import TulipAPI
-from tulip_api.tulip_machine import TulipMachine
-from tulip_api.tulip_table import TulipTable
-from tulip_api.tulip_table_csv_upload import TulipTableCSVUploader
-from tulip_api.tulip_table_link import TulipTableLink
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tulip_api.cached_tulip_table import CachedTulipTable
+    from tulip_api.transport import HTTPXTransport, RequestsTransport, TulipAPITransport
+    from tulip_api.tulip_api import TulipAPI
+    from tulip_api.tulip_api_budget import TulipAPIBudget
+    from tulip_api.tulip_machine import TulipMachine
+    from tulip_api.tulip_machine_attribute_filter import TulipMachineAttributeFilter
+    from tulip_api.tulip_machine_event_spool import TulipMachineEventSpool
+    from tulip_api.tulip_machine_reporter import TulipMachineReporter
+    from tulip_api.tulip_table import TulipTable
+    from tulip_api.tulip_table_csv_upload import TulipTableCSVUploader
+    from tulip_api.tulip_table_dead_letter import (
+        NDJSONDeadLetterSink,
+        TulipTableDeadLetter,
+        TulipTableDeadLetterSink,
+        read_dead_letters,
+    )
+    from tulip_api.tulip_table_increment_buffer import TulipTableIncrementBuffer
+    from tulip_api.tulip_table_link import TulipTableLink
+    from tulip_api.tulip_table_link_bulk_result import TulipTableLinkBulkResult
+    from tulip_api.tulip_table_partitioned_scan import (
+        TulipTablePartition,
+        TulipTablePartitionedScan,
+    )
+    from tulip_api.tulip_table_progress import (
+        ConsoleProgressReporter,
+        TulipTableProgress,
+        TulipTableProgressReporter,
+    )
+    from tulip_api.tulip_table_record import TulipTableRecord
+    from tulip_api.tulip_table_upload import TulipTableUploader
+    from tulip_api.tulip_table_upload_source import (
+        ArrowSource,
+        CSVSource,
+        DataFrameSource,
+        IterableSource,
+        NDJSONSource,
+        ParquetSource,
+        TulipTableUploadSource,
+    )
+    from tulip_api.tulip_table_watermark import TulipTableWatermark
+# Classes are imported on first access, so `import tulip_api` doesn't import `requests` or `aiohttp`.
+_lazy_imports = {
+    "CachedTulipTable": "tulip_api.cached_tulip_table",
+    "TulipAPI": "tulip_api.tulip_api",
+    "TulipMachine": "tulip_api.tulip_machine",
+    "TulipMachineAttributeFilter": "tulip_api.tulip_machine_attribute_filter",
+    "TulipMachineEventSpool": "tulip_api.tulip_machine_event_spool",
+    "TulipMachineReporter": "tulip_api.tulip_machine_reporter",
+    "TulipTable": "tulip_api.tulip_table",
+    "TulipTableCSVUploader": "tulip_api.tulip_table_csv_upload",
+    "TulipTableIncrementBuffer": "tulip_api.tulip_table_increment_buffer",
+    "TulipTableLink": "tulip_api.tulip_table_link",
+    "TulipTableLinkBulkResult": "tulip_api.tulip_table_link_bulk_result",
+    "TulipTablePartition": "tulip_api.tulip_table_partitioned_scan",
+    "TulipTablePartitionedScan": "tulip_api.tulip_table_partitioned_scan",
+    "TulipTableWatermark": "tulip_api.tulip_table_watermark",
+    "HTTPXTransport": "tulip_api.transport",
+    "RequestsTransport": "tulip_api.transport",
+    "TulipAPITransport": "tulip_api.transport",
+    "TulipTableUploader": "tulip_api.tulip_table_upload",
+    "ArrowSource": "tulip_api.tulip_table_upload_source",
+    "CSVSource": "tulip_api.tulip_table_upload_source",
+    "DataFrameSource": "tulip_api.tulip_table_upload_source",
+    "IterableSource": "tulip_api.tulip_table_upload_source",
+    "NDJSONSource": "tulip_api.tulip_table_upload_source",
+    "ParquetSource": "tulip_api.tulip_table_upload_source",
+    "TulipTableUploadSource": "tulip_api.tulip_table_upload_source",
+    "TulipAPIBudget": "tulip_api.tulip_api_budget",
+    "TulipTableRecord": "tulip_api.tulip_table_record",
+    "TulipTableDeadLetter": "tulip_api.tulip_table_dead_letter",
+    "TulipTableDeadLetterSink": "tulip_api.tulip_table_dead_letter",
+    "NDJSONDeadLetterSink": "tulip_api.tulip_table_dead_letter",
+    "read_dead_letters": "tulip_api.tulip_table_dead_letter",
+    "TulipTableProgress": "tulip_api.tulip_table_progress",
+    "TulipTableProgressReporter": "tulip_api.tulip_table_progress",
+    "ConsoleProgressReporter": "tulip_api.tulip_table_progress",
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name: str):
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazy_imports[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
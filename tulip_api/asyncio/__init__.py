@@ -1,3 +1,101 @@
-from tulip_api.asyncio.tulip_api import TulipAPI
-from tulip_api.asyncio.tulip_table import TulipTable
-from tulip_api.asyncio.tulip_table_csv_upload import TulipTableCSVUploader
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tulip_api.asyncio.cached_tulip_table import CachedTulipTable
+    from tulip_api.asyncio.cached_tulip_table_loader import CachedTulipTableLoader
+    from tulip_api.asyncio.transport import (
+        AIOHTTPTransport,
+        AsyncHTTPXTransport,
+        TulipAPIAsyncTransport,
+    )
+    from tulip_api.asyncio.tulip_api import TulipAPI
+    from tulip_api.asyncio.tulip_api_scheduler import TulipAPIRequestScheduler
+    from tulip_api.asyncio.tulip_machine import TulipMachine
+    from tulip_api.asyncio.tulip_machine_reporter import TulipMachineReporter
+    from tulip_api.asyncio.tulip_table import TulipTable
+    from tulip_api.asyncio.tulip_table_csv_upload import TulipTableCSVUploader
+    from tulip_api.asyncio.tulip_table_increment_buffer import TulipTableIncrementBuffer
+    from tulip_api.asyncio.tulip_table_link import TulipTableLink
+    from tulip_api.asyncio.tulip_table_pipeline import (
+        TulipTablePipeline,
+        TulipTablePipelineStageStats,
+    )
+    from tulip_api.asyncio.tulip_table_upload import TulipTableUploader
+    from tulip_api.tulip_api_budget import TulipAPIBudget
+    from tulip_api.tulip_machine_attribute_filter import TulipMachineAttributeFilter
+    from tulip_api.tulip_machine_event_spool import TulipMachineEventSpool
+    from tulip_api.tulip_table_dead_letter import (
+        NDJSONDeadLetterSink,
+        TulipTableDeadLetter,
+        TulipTableDeadLetterSink,
+        read_dead_letters,
+    )
+    from tulip_api.tulip_table_progress import (
+        ConsoleProgressReporter,
+        TulipTableProgress,
+        TulipTableProgressReporter,
+    )
+    from tulip_api.tulip_table_record import TulipTableRecord
+    from tulip_api.tulip_table_upload_source import (
+        ArrowSource,
+        CSVSource,
+        DataFrameSource,
+        IterableSource,
+        NDJSONSource,
+        ParquetSource,
+        TulipTableUploadSource,
+    )
+    from tulip_api.tulip_table_watermark import TulipTableWatermark
+# Classes are imported on first access, so `import tulip_api.asyncio` doesn't import `aiohttp` until a client class is used.
+_lazy_imports = {
+    "CachedTulipTable": "tulip_api.asyncio.cached_tulip_table",
+    "CachedTulipTableLoader": "tulip_api.asyncio.cached_tulip_table_loader",
+    "TulipAPI": "tulip_api.asyncio.tulip_api",
+    "TulipAPIRequestScheduler": "tulip_api.asyncio.tulip_api_scheduler",
+    "TulipMachine": "tulip_api.asyncio.tulip_machine",
+    "TulipMachineReporter": "tulip_api.asyncio.tulip_machine_reporter",
+    "TulipTable": "tulip_api.asyncio.tulip_table",
+    "TulipTableCSVUploader": "tulip_api.asyncio.tulip_table_csv_upload",
+    "TulipTableIncrementBuffer": "tulip_api.asyncio.tulip_table_increment_buffer",
+    "TulipTableLink": "tulip_api.asyncio.tulip_table_link",
+    "TulipTablePipeline": "tulip_api.asyncio.tulip_table_pipeline",
+    "TulipTablePipelineStageStats": "tulip_api.asyncio.tulip_table_pipeline",
+    "TulipMachineAttributeFilter": "tulip_api.tulip_machine_attribute_filter",
+    "TulipMachineEventSpool": "tulip_api.tulip_machine_event_spool",
+    "TulipTableWatermark": "tulip_api.tulip_table_watermark",
+    "AIOHTTPTransport": "tulip_api.asyncio.transport",
+    "AsyncHTTPXTransport": "tulip_api.asyncio.transport",
+    "TulipAPIAsyncTransport": "tulip_api.asyncio.transport",
+    "TulipTableUploader": "tulip_api.asyncio.tulip_table_upload",
+    "ArrowSource": "tulip_api.tulip_table_upload_source",
+    "CSVSource": "tulip_api.tulip_table_upload_source",
+    "DataFrameSource": "tulip_api.tulip_table_upload_source",
+    "IterableSource": "tulip_api.tulip_table_upload_source",
+    "NDJSONSource": "tulip_api.tulip_table_upload_source",
+    "ParquetSource": "tulip_api.tulip_table_upload_source",
+    "TulipTableUploadSource": "tulip_api.tulip_table_upload_source",
+    "TulipAPIBudget": "tulip_api.tulip_api_budget",
+    "TulipTableRecord": "tulip_api.tulip_table_record",
+    "TulipTableDeadLetter": "tulip_api.tulip_table_dead_letter",
+    "TulipTableDeadLetterSink": "tulip_api.tulip_table_dead_letter",
+    "NDJSONDeadLetterSink": "tulip_api.tulip_table_dead_letter",
+    "read_dead_letters": "tulip_api.tulip_table_dead_letter",
+    "TulipTableProgress": "tulip_api.tulip_table_progress",
+    "TulipTableProgressReporter": "tulip_api.tulip_table_progress",
+    "ConsoleProgressReporter": "tulip_api.tulip_table_progress",
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name: str):
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazy_imports[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,151 @@
+import asyncio
+import math
+from typing import Callable, Dict, List, Optional, Set
+
+from tulip_api.asyncio.tulip_api import TulipAPI
+from tulip_api.asyncio.tulip_table import TulipTable
+from tulip_api.exceptions import (
+    TulipAPICachedTableDuplicateIDFound,
+    TulipAPICachedTableNotLoaded,
+    TulipApiCachedTableRecordNotFound,
+)
+
+
+class CachedTulipTableSnapshot:
+    """
+    An immutable, indexed copy of a table's records.
+    """
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+        self.index: Dict[str, Dict] = {}
+        self.duplicate_ids: Set[str] = set()
+        for record in records:
+            record_id = record["id"]
+            if record_id in self.index:
+                self.duplicate_ids.add(record_id)
+            self.index[record_id] = record
+
+    def get_record(self, record_id: str) -> Dict:
+        if record_id in self.duplicate_ids:
+            raise TulipAPICachedTableDuplicateIDFound(record_id)
+        if record_id not in self.index:
+            raise TulipApiCachedTableRecordNotFound(record_id)
+        return self.index[record_id]
+
+
+class CachedTulipTable:
+    """
+    Asyncio enabled
+
+    Pulls a given table/filter into memory. Call `load` before reading, then reference the List `.records`
+    or use the `get_record` method to get a specific record by it's ID.
+
+    Pages are fetched concurrently through the TulipAPI's connection pool. Reads are served from an indexed snapshot,
+    and `refresh` swaps in the new snapshot only once it is fully loaded, so readers never see a half-loaded table.
+
+    Use with caution and only with small tables.
+    """
+
+    def __init__(
+        self,
+        tulip_api: TulipAPI,
+        table_id: str,
+        filters: List = [],
+        concurrency: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ):
+        """
+        concurrency: the maximum # of pages fetched at a time. Defaults to the TulipAPI's concurrency.
+        columns: only cache these columns of each record, to save memory with wide tables. `id` is always cached.
+        """
+        self.tulip_api = tulip_api
+        self.table_id = table_id
+        self.filters = filters
+        self.concurrency = concurrency
+        self.columns = (
+            columns if columns is None or "id" in columns else ["id"] + columns
+        )
+        self.tulip_table = TulipTable(self.tulip_api, self.table_id)
+        self._snapshot: Optional[CachedTulipTableSnapshot] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def records(self) -> List[Dict]:
+        return self._get_snapshot().records
+
+    async def load(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        on_page: Optional[Callable[[int], None]] = None,
+        total_records: Optional[int] = None,
+    ):
+        """
+        Loads the table, if it hasn't been loaded yet. See `refresh`.
+        """
+        if self._snapshot is None:
+            await self.refresh(
+                semaphore=semaphore, on_page=on_page, total_records=total_records
+            )
+
+    async def refresh(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        on_page: Optional[Callable[[int], None]] = None,
+        total_records: Optional[int] = None,
+    ):
+        """
+        Reloads the table and atomically replaces the current snapshot.
+
+        `semaphore`: if given, every page request also holds the semaphore, to share a concurrency budget with other loads.
+
+        `on_page`: called with the # of records in each page as it is loaded.
+
+        `total_records`: the table's record count, if known. Caps the # of page requests in flight at the # of pages,
+        so a small table doesn't fire requests for empty pages.
+        """
+        self._snapshot = CachedTulipTableSnapshot(
+            await self._fetch_data(semaphore, on_page, total_records)
+        )
+
+    async def update_data(self):
+        """
+        Alias of `refresh`, matching the sync `CachedTulipTable`.
+        """
+        await self.refresh()
+
+    def get_record(self, record_id: str) -> Dict:
+        return self._get_snapshot().get_record(record_id)
+
+    async def _fetch_data(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        on_page: Optional[Callable[[int], None]] = None,
+        total_records: Optional[int] = None,
+    ) -> List:
+        records: List = []
+        concurrency = self.concurrency or self.tulip_api.concurrency
+        if total_records is not None:
+            concurrency = min(concurrency, max(1, math.ceil(total_records / 100)))
+        # Sorted by creation so concurrent offset pages stay stable while records are updated.
+        async for page in self.tulip_table._stream_pages_concurrently(
+            concurrency,
+            100,
+            semaphore=semaphore,
+            filters=self.filters,
+            sort_by="_createdAt",
+            sort_asc=True,
+            columns=self.columns,
+        ):
+            records += page
+            if on_page is not None:
+                on_page(len(page))
+        return records
+
+    def _get_snapshot(self) -> CachedTulipTableSnapshot:
+        if self._snapshot is None:
+            raise TulipAPICachedTableNotLoaded(self.table_id)
+        return self._snapshot
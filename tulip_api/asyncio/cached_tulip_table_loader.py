@@ -0,0 +1,135 @@
+import asyncio
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from tulip_api.asyncio.cached_tulip_table import CachedTulipTable
+from tulip_api.asyncio.tulip_api import TulipAPI
+
+
+class CachedTulipTableLoadProgress:
+    """
+    The load progress of a single table.
+
+    `total_records` is None until the table's record count is known.
+    """
+
+    def __init__(self, table_id: str):
+        self.table_id = table_id
+        self.loaded_records = 0
+        self.total_records: Optional[int] = None
+        self.done = False
+        self.exception: Optional[BaseException] = None
+
+    def __repr__(self):
+        return (
+            f"CachedTulipTableLoadProgress(table_id={self.table_id!r}, "
+            f"loaded_records={self.loaded_records}, total_records={self.total_records}, done={self.done})"
+        )
+
+
+class CachedTulipTableLoader:
+    """
+    Asyncio enabled
+
+    Loads many `CachedTulipTable`s concurrently.
+
+    All tables share the TulipAPI's connection pool and a single budget of `concurrency` in-flight page requests.
+    Tables are loaded smallest first, so they become ready while larger tables are still loading.
+    `tables` holds every `CachedTulipTable` from the start, and each one's `loaded` flag shows when it can be read.
+    """
+
+    def __init__(
+        self,
+        tulip_api: TulipAPI,
+        tables: Union[Dict[str, List], Iterable[str]],
+        concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[CachedTulipTableLoadProgress], None]] = None,
+        on_table_loaded: Optional[Callable[[CachedTulipTable], None]] = None,
+    ):
+        """
+        tables: a dict of table_id to filters, or an iterable of table_ids to load unfiltered.
+        concurrency: the total # of page requests in flight across all tables. Defaults to the TulipAPI's concurrency.
+        on_progress: called with a table's progress after each loaded page, and once the table is done.
+        on_table_loaded: called with each table as soon as it is loaded.
+        """
+        self.tulip_api = tulip_api
+        self.concurrency = concurrency or tulip_api.concurrency
+        self.on_progress = on_progress
+        self.on_table_loaded = on_table_loaded
+
+        table_filters = tables if isinstance(tables, dict) else {t: [] for t in tables}
+        self.tables: Dict[str, CachedTulipTable] = {
+            table_id: CachedTulipTable(
+                tulip_api, table_id, filters=filters, concurrency=self.concurrency
+            )
+            for table_id, filters in table_filters.items()
+        }
+        self.progress: Dict[str, CachedTulipTableLoadProgress] = {
+            table_id: CachedTulipTableLoadProgress(table_id) for table_id in self.tables
+        }
+
+    async def load(self) -> Dict[str, CachedTulipTable]:
+        """
+        Loads every table and returns them by table_id.
+
+        If a table fails to load, the remaining tables are still loaded and the first exception is raised at the end.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        table_ids = await self._order_by_size(semaphore)
+
+        # Tasks start in order, so the pages of smaller tables queue for the semaphore first.
+        results = await asyncio.gather(
+            *[self._load_table(table_id, semaphore) for table_id in table_ids],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return self.tables
+
+    async def _order_by_size(self, semaphore: asyncio.Semaphore) -> List[str]:
+        async def count(table_id: str):
+            table = self.tables[table_id]
+            async with semaphore:
+                try:
+                    self.progress[table_id].total_records = (
+                        await table.tulip_table.get_record_count(filters=table.filters)
+                    )
+                except Exception:
+                    # Ordering is only an optimization, a table without a count is loaded last.
+                    pass
+
+        await asyncio.gather(*[count(table_id) for table_id in self.tables])
+        return sorted(
+            self.tables,
+            key=lambda table_id: (
+                self.progress[table_id].total_records is None,
+                self.progress[table_id].total_records or 0,
+            ),
+        )
+
+    async def _load_table(self, table_id: str, semaphore: asyncio.Semaphore):
+        progress = self.progress[table_id]
+
+        def on_page(records: int):
+            progress.loaded_records += records
+            self._report_progress(progress)
+
+        try:
+            await self.tables[table_id].refresh(
+                semaphore=semaphore,
+                on_page=on_page,
+                total_records=progress.total_records,
+            )
+        except BaseException as e:
+            progress.exception = e
+            raise e
+        finally:
+            progress.done = True
+            self._report_progress(progress)
+
+        if self.on_table_loaded is not None:
+            self.on_table_loaded(self.tables[table_id])
+
+    def _report_progress(self, progress: CachedTulipTableLoadProgress):
+        if self.on_progress is not None:
+            self.on_progress(progress)
@@ -0,0 +1,147 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from tulip_api.exceptions import (
+    TulipAPIConnectionError,
+    TulipAPIOptionalDependencyMissing,
+)
+from tulip_api.transport import TulipAPIResponse
+
+
+class TulipAPIAsyncTransport(ABC):
+    """
+    Asyncio enabled
+
+    Sends the HTTP requests of the asyncio `TulipAPI`.
+
+    `open` is called when the `TulipAPI` is entered, and `close` when it exits.
+    Subclass it and implement `open` and `request` (and `close`, if the transport holds connections) to use another HTTP library.
+    """
+
+    @abstractmethod
+    def open(self, concurrency: int, request_timeout: Optional[float]):
+        """
+        concurrency: the maximum # of requests in flight.
+        """
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> TulipAPIResponse:
+        """
+        Sends a request, and returns its response whatever its status code.
+        """
+
+    async def close(self):
+        pass
+
+
+class AIOHTTPTransport(TulipAPIAsyncTransport):
+    """
+    Asyncio enabled
+
+    Sends requests with an `aiohttp.ClientSession`, holding up to `concurrency` HTTP/1.1 connections.
+
+    Connection errors are raised as `aiohttp` exceptions.
+    """
+
+    def open(self, concurrency: int, request_timeout: Optional[float]):
+        import aiohttp
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=concurrency),
+            timeout=aiohttp.ClientTimeout(total=request_timeout),
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> TulipAPIResponse:
+        async with self.session.request(
+            method, url, params=params, data=data, headers=headers
+        ) as response:
+            return TulipAPIResponse(
+                method, str(response.url), response.status, await response.read(), data
+            )
+
+    async def close(self):
+        await self.session.close()
+
+
+class AsyncHTTPXTransport(TulipAPIAsyncTransport):
+    """
+    Asyncio enabled
+
+    Sends requests with an `httpx.AsyncClient`. Requires `httpx`.
+
+    With `http2` (requires the `h2` package), up to `concurrency` requests are multiplexed as streams
+    over a single connection per host, instead of opening a connection per request in flight.
+
+    Connection errors are raised as `TulipAPIConnectionError`.
+    """
+
+    def __init__(self, http2: bool = True):
+        try:
+            import httpx
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("httpx", "http2")
+        self._httpx = httpx
+        self.http2 = http2
+
+    def open(self, concurrency: int, request_timeout: Optional[float]):
+        httpx = self._httpx
+        try:
+            self.client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(max_connections=concurrency),
+                timeout=request_timeout,
+            )
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("h2", "http2")
+        # httpx's pool slows down as its queue of waiting requests grows, so requests wait here instead.
+        self._slots = asyncio.Semaphore(concurrency)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> TulipAPIResponse:
+        try:
+            async with self._slots:
+                response = await self.client.request(
+                    method, url, params=params, content=data, headers=headers
+                )
+        except self._httpx.TransportError as e:
+            raise TulipAPIConnectionError(str(e)) from e
+        return TulipAPIResponse(
+            method, str(response.url), response.status_code, response.content, data
+        )
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def create_async_transport(transport: str) -> TulipAPIAsyncTransport:
+    """
+    Returns a new transport by name: `aiohttp` or `httpx`.
+    """
+    if transport == "aiohttp":
+        return AIOHTTPTransport()
+    if transport == "httpx":
+        return AsyncHTTPXTransport()
+    raise ValueError(
+        f"Unsupported transport: {transport}. Must be one of ['aiohttp', 'httpx']."
+    )
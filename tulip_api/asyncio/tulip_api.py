@@ -1,9 +1,19 @@
+import asyncio
 import os
 from base64 import b64encode
-from typing import Any, Optional
-
-import aiohttp
+from contextlib import contextmanager
+from typing import Any, Generator, Optional, Set, Union
 
+from tulip_api.asyncio.transport import (
+    TulipAPIAsyncTransport,
+    create_async_transport,
+)
+from tulip_api.asyncio.tulip_api_scheduler import (
+    PRIORITIES,
+    TulipAPIRequestScheduler,
+    _request_priority,
+    request_priority,
+)
 from tulip_api.exceptions import (
     TulipAPIAsyncAuthorizationError,
     TulipAPIAsyncInternalError,
@@ -12,14 +22,23 @@ from tulip_api.exceptions import (
     TulipAPIAsyncUnknownResponse,
     TulipAPINoCredentialsFound,
 )
-from tulip_api.tulip_api import TulipAPIResponseCodes
+from tulip_api.response_codes import TulipAPIResponseCodes
+from tulip_api.serializers import JSONSerializer, default_serializer
+from tulip_api.transport import TulipAPIResponse
+from tulip_api.tulip_api_budget import TulipAPIBudget
+
+# The closes started by a plain `with` exit, kept so they aren't garbage collected before they finish.
+_closing: Set["asyncio.Task"] = set()
 
 
 class TulipAPI:
     """
     Asynio enabled
 
-    Wraps the `aiohttp.request` function with authentication, response processing, and base url construction.
+    Wraps the HTTP transport (`aiohttp` by default) with authentication, response processing, and base url construction.
+
+    The transport's connections are opened when the `async with` block is entered, and closed when it exits.
+    A plain `with` block can't wait for them to close, so prefer `async with`.
     """
 
     def __init__(
@@ -31,12 +50,26 @@ class TulipAPI:
         auth: Optional[str] = None,
         use_full_url: bool = False,
         request_timeout: Optional[int] = 60,
+        serializer: Optional[JSONSerializer] = None,
+        transport: Union[str, TulipAPIAsyncTransport] = "aiohttp",
+        reserved_concurrency: int = 0,
+        budget: Optional[TulipAPIBudget] = None,
     ):
         """
         use_full_url: if set to true, the tulip_url must include `http://` or `https://` as well as the fqdn. For example `https://abc.tulip.co`
-        request_timeout: timeout for the underlying aiohttp request. Defaults to 60s. Set to None to disable the timeout.
+        request_timeout: timeout for each request. Defaults to 60s. Set to None to disable the timeout.
+        serializer: encodes request bodies and decodes responses. Defaults to `orjson` when it is installed, and the standard library `json` module otherwise.
+        transport: sends the HTTP requests. `aiohttp` (default), `httpx` for HTTP/2 (requires `httpx` and `h2`), or a `TulipAPIAsyncTransport`.
+        reserved_concurrency: the # of request slots kept free for `interactive` requests. `bulk` requests share the rest.
+        budget: a request rate and concurrency budget shared with other `TulipAPI`s, including those in other processes.
         """
         self.timeout = request_timeout
+        self.transport = (
+            create_async_transport(transport)
+            if isinstance(transport, str)
+            else transport
+        )
+        self.serializer = serializer if serializer is not None else default_serializer()
         self.host = self._construct_base_url(tulip_url, use_full_url)
 
         self.auth = TulipAPI._provide_api_credentials(
@@ -44,14 +77,80 @@ class TulipAPI:
         )
 
         self.headers = self._construct_headers()
+        self.json_headers = {
+            **self.headers,
+            "Content-Type": self.serializer.content_type,
+        }
         self.concurrency = concurrency
+        self.scheduler = TulipAPIRequestScheduler(concurrency, reserved_concurrency)
+        self.budget = budget
 
     def __enter__(self):
-        self.connector = aiohttp.TCPConnector(limit=self.concurrency)
+        self.transport.open(self.concurrency, self.timeout)
         return self
 
     def __exit__(self, _, __, ___):
-        self.connector.close()
+        # A plain `with` can't wait for the connections to close, so they are closed in a task.
+        task = asyncio.ensure_future(self.transport.close())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, _, __, ___):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the transport's connections.
+        """
+        await self.transport.close()
+
+    @contextmanager
+    def priority(self, priority: str) -> Generator[None, None, None]:
+        """
+        Requests made inside the block (and in tasks created inside it) use the `priority` lane: `interactive` or `bulk`.
+
+        Requests are `interactive` by default, while bulk operations such as `create_records` or `stream_records`
+        use the `bulk` lane, unless they are called inside this block.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(
+                f"Unsupported priority: {priority}. Must be one of {list(PRIORITIES)}."
+            )
+        token = _request_priority.set(priority)
+        try:
+            yield
+        finally:
+            _request_priority.reset(token)
+
+    async def _make_request(
+        self,
+        path: str,
+        method: str,
+        params: Optional[dict] = None,
+        json: Any = None,
+    ) -> TulipAPIResponse:
+        data = None if json is None else self.serializer.dumps(json)
+        await self.scheduler.acquire(request_priority())
+        try:
+            if self.budget is not None:
+                await self.budget.acquire_async()
+            try:
+                response = await self.transport.request(
+                    method,
+                    self._construct_url(path),
+                    params=params,
+                    data=data,
+                    headers=self.headers if json is None else self.json_headers,
+                )
+            finally:
+                if self.budget is not None:
+                    await self.budget.release_async()
+        finally:
+            self.scheduler.release()
+        return self._handle_api_response(response)
 
     async def make_request(
         self,
@@ -63,16 +162,9 @@ class TulipAPI:
         """
         Makes a request against the Tulip API. Parses and returns JSON returned from the Tulip API.
         """
-        async with aiohttp.request(
-            method,
-            self._construct_url(path),
-            params=params,
-            json=json,
-            headers=self.headers,
-            connector=self.connector,
-            timeout=self.timeout,
-        ) as response:
-            return await self._handle_api_response(response).json()
+        return self.serializer.loads(
+            (await self._make_request(path, method, params=params, json=json)).content
+        )
 
     async def make_request_expect_nothing(
         self,
@@ -84,14 +176,7 @@ class TulipAPI:
         """
         Makes a request against the Tulip API. Returns nothing.
         """
-        async with aiohttp.request(
-            method,
-            self._construct_url(path),
-            params=params,
-            json=json,
-            headers=self.headers,
-        ) as response:
-            self._handle_api_response(response)
+        await self._make_request(path, method, params=params, json=json)
 
     @staticmethod
     def _provide_api_credentials(
@@ -122,15 +207,15 @@ class TulipAPI:
     def _construct_headers(self):
         return {"Authorization": f"Basic {self.auth}"}
 
-    def _handle_api_response(self, response: aiohttp.ClientResponse):
-        if response.status in TulipAPIResponseCodes.SUCCESS_CODES:
+    def _handle_api_response(self, response: TulipAPIResponse):
+        if response.status_code in TulipAPIResponseCodes.SUCCESS_CODES:
             return response
-        if response.status in TulipAPIResponseCodes.MALFORMED_CODES:
+        if response.status_code in TulipAPIResponseCodes.MALFORMED_CODES:
             raise TulipAPIAsyncMalformedRequestError(response)
-        if response.status in TulipAPIResponseCodes.NOT_FOUND_CODES:
+        if response.status_code in TulipAPIResponseCodes.NOT_FOUND_CODES:
             raise TulipAPIAsyncNotFoundError(response)
-        if response.status in TulipAPIResponseCodes.UNAUTHENTICATED_CODES:
+        if response.status_code in TulipAPIResponseCodes.UNAUTHENTICATED_CODES:
             raise TulipAPIAsyncAuthorizationError(response)
-        if response.status in TulipAPIResponseCodes.UNEXCPECTED_ERROR_CODES:
+        if response.status_code in TulipAPIResponseCodes.UNEXCPECTED_ERROR_CODES:
             raise TulipAPIAsyncInternalError(response)
         raise TulipAPIAsyncUnknownResponse(response)
@@ -0,0 +1,108 @@
+import asyncio
+import contextvars
+from collections import deque
+from typing import Awaitable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+# The priority of the requests made by the current task. Unset means `interactive`, except in bulk operations.
+_request_priority: "contextvars.ContextVar[Optional[str]]" = contextvars.ContextVar(
+    "tulip_api_request_priority", default=None
+)
+
+
+class TulipAPIRequestScheduler:
+    """
+    Asyncio enabled
+
+    Hands out the `TulipAPI`'s `concurrency` request slots to two lanes: `interactive` and `bulk`.
+
+    Waiting `interactive` requests always get the next free slot before any waiting `bulk` request.
+    `bulk` requests may only use `concurrency - reserved_concurrency` slots, so up to `reserved_concurrency`
+    slots are always kept free for `interactive` requests, even while a bulk job has thousands of requests queued.
+    """
+
+    def __init__(self, concurrency: int, reserved_concurrency: int = 0):
+        if not 0 <= reserved_concurrency < concurrency:
+            raise ValueError(
+                "reserved_concurrency must be at least 0, and less than concurrency."
+            )
+        self.concurrency = concurrency
+        self.reserved_concurrency = reserved_concurrency
+        self.in_flight = 0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {
+            priority: deque() for priority in PRIORITIES
+        }
+
+    def waiting(self, priority: str) -> int:
+        """
+        Returns the # of requests waiting for a slot in a lane.
+        """
+        return len(self._waiters[priority])
+
+    async def acquire(self, priority: str):
+        """
+        Waits for a free slot in the `priority` lane. Each `acquire` must be followed by a `release`.
+        """
+        if self._can_start(priority) and all(
+            len(self._waiters[waiting]) == 0
+            for waiting in PRIORITIES[: PRIORITIES.index(priority) + 1]
+        ):
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the request was cancelled.
+                self.release()
+            elif waiter in self._waiters[priority]:
+                self._waiters[priority].remove(waiter)
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        for priority in PRIORITIES:
+            waiters = self._waiters[priority]
+            while len(waiters) > 0 and self._can_start(priority):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    # Cancelled, its request no longer needs the slot.
+                    continue
+                self.in_flight += 1
+                waiter.set_result(None)
+            # Lower priority lanes wait until this one is empty.
+            if len(waiters) > 0:
+                return
+
+    def _can_start(self, priority: str) -> bool:
+        if priority == INTERACTIVE:
+            return self.in_flight < self.concurrency
+        return self.in_flight < self.concurrency - self.reserved_concurrency
+
+
+def request_priority() -> str:
+    """
+    Returns the priority of requests made by the current task.
+    """
+    return _request_priority.get() or INTERACTIVE
+
+
+def create_bulk_task(coroutine: Awaitable[T]) -> "asyncio.Future[T]":
+    """
+    Schedules a coroutine of a bulk operation, such as `create_records`.
+
+    Its requests use the `bulk` lane, unless the caller chose a priority with `TulipAPI.priority`.
+    """
+    context = contextvars.copy_context()
+    if context.get(_request_priority) is None:
+        context.run(_request_priority.set, BULK)
+    # The task copies the context it is created in.
+    return context.run(asyncio.ensure_future, coroutine)
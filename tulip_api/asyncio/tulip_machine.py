@@ -1,6 +1,7 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from tulip_api.asyncio.tulip_api import TulipAPI
+from tulip_api.asyncio.tulip_machine_reporter import TulipMachineReporter
 
 
 class TulipMachine:
@@ -10,9 +11,18 @@ class TulipMachine:
 
     attributes_report_path: str = "attributes/report"
 
-    def __init__(self, tulip_api: TulipAPI, machine_id: str):
+    def __init__(
+        self,
+        tulip_api: TulipAPI,
+        machine_id: str,
+        reporter: Optional[TulipMachineReporter] = None,
+    ):
+        """
+        reporter: if given, events are queued on the reporter and sent in batches with other machines' events.
+        """
         self.tulip_api = tulip_api
         self.machine_id = machine_id
+        self.reporter = reporter
 
     async def send_event(self, attributes: Dict[str, Any]):
         """
@@ -26,6 +36,11 @@ class TulipMachine:
         }
         ```
         """
+        if self.reporter is not None:
+            self.reporter.queue_attributes(
+                self._construct_attributes(attributes)["attributes"]
+            )
+            return
         await self.tulip_api.make_request_expect_nothing(
             TulipMachine.attributes_report_path,
             "POST",
@@ -0,0 +1,203 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from tulip_api.asyncio.tulip_api import TulipAPI
+from tulip_api.exceptions import TulipAPIMachineEventSpoolFull, is_retryable
+from tulip_api.tulip_machine_attribute_filter import TulipMachineAttributeFilter
+from tulip_api.tulip_machine_event_spool import TulipMachineEventSpool
+
+
+class TulipMachineReporter:
+    """
+    Asyncio enabled
+
+    Queues machine attribute reports from many `TulipMachine`s and sends them together.
+
+    Queued attributes are packed into a single `/attributes/report` request per flush.
+    A flush happens every `flush_interval` seconds, or as soon as `max_batch_size` attributes are queued.
+    Use as an `async with` block (or call `start`/`close`) so queued attributes are flushed on shutdown.
+    """
+
+    attributes_report_path: str = "attributes/report"
+
+    def __init__(
+        self,
+        tulip_api: TulipAPI,
+        max_batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        attribute_filter: Optional[TulipMachineAttributeFilter] = None,
+        spool: Optional[TulipMachineEventSpool] = None,
+        replay_requests_per_flush: int = 10,
+    ):
+        """
+        max_batch_size: the maximum # of attributes sent in a single request.
+        flush_interval: seconds between background flushes.
+        attribute_filter: if given, only attributes passing the filter are queued. See `TulipMachineAttributeFilter`.
+        spool: if given, batches that can't be sent because the Tulip instance is unreachable are stored in the spool, and replayed in order once it is reachable again. See `TulipMachineEventSpool`.
+        replay_requests_per_flush: the maximum # of requests used to replay spooled batches per flush.
+        """
+        self.tulip_api = tulip_api
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.attribute_filter = attribute_filter
+        self.spool = spool
+        self.replay_requests_per_flush = replay_requests_per_flush
+
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Created on first use, on the running event loop.
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, _, __, ___):
+        await self.close()
+
+    def start(self):
+        """
+        Starts the background flush task. Must be called from within a running event loop.
+        """
+        if self._flush_task is None:
+            self._flush_requested = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def queue_event(self, machine_id: str, attributes: Dict[str, Any]):
+        """
+        Queues a machine event.
+
+        `attributes`: A dict with attributeId: value pairs.
+        """
+        self.queue_attributes(
+            [
+                {"machineId": machine_id, "attributeId": key, "value": value}
+                for key, value in attributes.items()
+            ]
+        )
+
+    def queue_attributes(self, attributes: List[Dict[str, Any]]):
+        """
+        Queues already constructed `{"machineId", "attributeId", "value"}` entries.
+        """
+        if self.attribute_filter is not None:
+            attributes = self.attribute_filter.filter_attributes(attributes)
+        self._queue.extend(attributes)
+        if (
+            len(self._queue) >= self.max_batch_size
+            and self._flush_requested is not None
+        ):
+            self._flush_requested.set()
+
+    async def flush(self) -> int:
+        """
+        POST `/attributes/report`
+
+        Sends every queued attribute, `max_batch_size` attributes per request. Returns the # of requests made.
+        If a request fails, its attributes are put back at the front of the queue and the exception is raised.
+
+        With a spool, spooled batches are replayed first. While the spool isn't empty, or once the Tulip instance
+        turns out to be unreachable, queued batches are appended to the spool instead of being sent.
+        Spool file I/O runs in the default executor. Concurrent flushes run one at a time.
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            return await self._flush()
+
+    async def _flush(self) -> int:
+        loop = asyncio.get_running_loop()
+        requests_made = 0
+        reachable = True
+        if self.spool is not None:
+            replay_requests, reachable = await self._replay_spool(self.spool)
+            requests_made += replay_requests
+        while len(self._queue) > 0:
+            batch_size = min(self.max_batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(batch_size)]
+            if self.spool is not None and (
+                not reachable
+                or not await loop.run_in_executor(None, self.spool.is_empty)
+            ):
+                await self._spool_batch(self.spool, batch)
+                continue
+            try:
+                await self._send_batch(batch)
+            except BaseException as exception:
+                if self.spool is not None and is_retryable(exception):
+                    await self._spool_batch(self.spool, batch)
+                    reachable = False
+                    continue
+                self._queue.extendleft(reversed(batch))
+                raise exception
+            requests_made += 1
+        return requests_made
+
+    async def _spool_batch(self, spool: TulipMachineEventSpool, batch: List[Dict]):
+        """
+        Appends a taken batch to the spool. If the spool is full, the batch is put back at the front of the queue.
+        """
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, spool.append, batch)
+        except TulipAPIMachineEventSpoolFull:
+            self._queue.extendleft(reversed(batch))
+            raise
+
+    async def close(self):
+        """
+        Stops the background flush task and flushes all queued attributes.
+        """
+        self._closed = True
+        if self._flush_task is not None and self._flush_requested is not None:
+            self._flush_requested.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    async def _replay_spool(self, spool: TulipMachineEventSpool) -> Tuple[int, bool]:
+        loop = asyncio.get_running_loop()
+        requests_made = 0
+        while requests_made < self.replay_requests_per_flush:
+            attributes, position = await loop.run_in_executor(
+                None, spool.read, self.max_batch_size
+            )
+            if position is None:
+                break
+            if len(attributes) > 0:
+                try:
+                    await self._send_batch(attributes)
+                    requests_made += 1
+                except Exception as e:
+                    if is_retryable(e):
+                        return requests_made, False
+                    print(
+                        f"Dropping spooled machine attributes that were rejected\n{e}"
+                    )
+            await loop.run_in_executor(None, spool.acknowledge, position)
+        return requests_made, True
+
+    async def _send_batch(self, batch: List[Dict[str, Any]]):
+        await self.tulip_api.make_request_expect_nothing(
+            TulipMachineReporter.attributes_report_path,
+            "POST",
+            json={"attributes": batch},
+        )
+
+    async def _flush_loop(self):
+        flush_requested = self._flush_requested
+        assert flush_requested is not None
+        while not self._closed:
+            try:
+                await asyncio.wait_for(flush_requested.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            flush_requested.clear()
+            if self._closed:
+                return
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"There was an issue reporting machine attributes\n{e}")
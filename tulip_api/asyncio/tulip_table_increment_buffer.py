@@ -0,0 +1,112 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from tulip_api.asyncio.tulip_table import TulipTable
+from tulip_api.exceptions import is_retryable
+
+
+class TulipTableIncrementBuffer:
+    """
+    Asyncio enabled
+
+    Aggregates `increment_record_column` calls in memory and flushes the summed values on an interval.
+
+    Every (record_id, column_id) pair costs one PATCH per flush interval, no matter how many times it was incremented.
+    Use as an `async with` block (or call `start`/`close`) so pending increments are flushed on shutdown.
+    """
+
+    def __init__(self, tulip_table: TulipTable, flush_interval: float = 1.0):
+        """
+        flush_interval: seconds between background flushes.
+        """
+        self.tulip_table = tulip_table
+        self.flush_interval = flush_interval
+
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._closed: Optional[asyncio.Event] = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, _, __, ___):
+        await self.close()
+
+    def start(self):
+        """
+        Starts the background flush task. Must be called from within a running event loop.
+        """
+        if self._flush_task is None:
+            self._closed = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def increment_record_column(self, record_id: str, column_id: str, value: int):
+        """
+        Adds `value` to the pending increment for the given record/column.
+        """
+        key = (record_id, column_id)
+        self._pending[key] = self._pending.get(key, 0) + value
+
+    async def flush(self) -> int:
+        """
+        PATCH `/tables/{tableId}/records/{recordId}/increment`
+
+        Sends every pending increment concurrently. Returns the # of PATCH requests made.
+        Increments that failed with a connection error, a timeout, a 429 or a 5xx response are kept for the next flush,
+        and the first such exception is raised. Other failures, such as a 4xx response, are dropped and reported.
+        """
+        pending = [item for item in self._pending.items() if item[1] != 0]
+        self._pending = {}
+
+        results = await asyncio.gather(
+            *[
+                self.tulip_table.increment_record_column(record_id, column_id, value)
+                for (record_id, column_id), value in pending
+            ],
+            return_exceptions=True,
+        )
+
+        failed: List[Tuple[Tuple[str, str], int]] = []
+        exception: Optional[BaseException] = None
+        for increment, result in zip(pending, results):
+            if not isinstance(result, BaseException):
+                continue
+            if not is_retryable(result):
+                (record_id, column_id), value = increment
+                print(
+                    f"Dropped the increment of {column_id} of record {record_id} by {value}\n{result}"
+                )
+                continue
+            failed.append(increment)
+            exception = exception or result
+        for key, value in failed:
+            self._pending[key] = self._pending.get(key, 0) + value
+
+        if exception is not None:
+            raise exception
+        return len(pending)
+
+    async def close(self):
+        """
+        Stops the background flush task and flushes all pending increments.
+        """
+        if self._flush_task is not None and self._closed is not None:
+            self._closed.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        closed = self._closed
+        assert closed is not None
+        while True:
+            try:
+                await asyncio.wait_for(closed.wait(), self.flush_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"There was an issue flushing record increments\n{e}")
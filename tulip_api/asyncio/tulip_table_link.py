@@ -0,0 +1,110 @@
+import asyncio
+from typing import Iterable, Iterator, Optional, Tuple
+
+from tulip_api.asyncio.tulip_api import TulipAPI
+from tulip_api.asyncio.tulip_api_scheduler import create_bulk_task
+from tulip_api.tulip_table_link_bulk_result import TulipTableLinkBulkResult
+
+
+class TulipTableLink:
+    """
+    An interface with Tulip Table Links.
+    """
+
+    def __init__(self, tulip_api: TulipAPI, link_id: str):
+        self.tulip_api = tulip_api
+        self.link_id = link_id
+
+    async def get_details(self):
+        """
+        GET `/tableLinks/{linkId}`
+
+        Returns the metadata of a Tulip Table Link.
+        """
+        return await self.tulip_api.make_request(
+            self._construct_base_table_link_path(), "GET"
+        )
+
+    async def link_records(self, left_record_id: str, right_record_id: str):
+        """
+        PUT `/tableLinks/{linkId}/link`
+
+        Links the given records.
+        """
+        await self.tulip_api.make_request_expect_nothing(
+            self._construct_link_path(),
+            "PUT",
+            json={"leftRecord": left_record_id, "rightRecord": right_record_id},
+        )
+
+    async def unlink_records(self, left_record_id: str, right_record_id: str):
+        """
+        PUT `/tableLinks/{linkId}/unlink`
+
+        Unlinks the given records.
+        """
+        await self.tulip_api.make_request_expect_nothing(
+            self._construct_unlink_path(),
+            "PUT",
+            json={"leftRecord": left_record_id, "rightRecord": right_record_id},
+        )
+
+    async def link_many(
+        self, pairs: Iterable[Tuple[str, str]], concurrency: Optional[int] = None
+    ) -> TulipTableLinkBulkResult:
+        """
+        PUT `/tableLinks/{linkId}/link`
+
+        Links every (left_record_id, right_record_id) pair, using up to `concurrency` requests at a time.
+        `concurrency` defaults to the TulipAPI's concurrency. Repeated pairs are only linked once.
+
+        Failures don't stop the other pairs, they are collected in the returned result.
+        """
+        return await self._bulk(self.link_records, pairs, concurrency)
+
+    async def unlink_many(
+        self, pairs: Iterable[Tuple[str, str]], concurrency: Optional[int] = None
+    ) -> TulipTableLinkBulkResult:
+        """
+        PUT `/tableLinks/{linkId}/unlink`
+
+        Unlinks every (left_record_id, right_record_id) pair, using up to `concurrency` requests at a time.
+        `concurrency` defaults to the TulipAPI's concurrency. Repeated pairs are only unlinked once.
+
+        Failures don't stop the other pairs, they are collected in the returned result.
+        """
+        return await self._bulk(self.unlink_records, pairs, concurrency)
+
+    async def _bulk(
+        self,
+        operation,
+        pairs: Iterable[Tuple[str, str]],
+        concurrency: Optional[int],
+    ) -> TulipTableLinkBulkResult:
+        result = TulipTableLinkBulkResult()
+        unique_pairs = iter(TulipTableLinkBulkResult.deduplicate_pairs(pairs, result))
+
+        async def worker(pairs: Iterator[Tuple[str, str]]):
+            for pair in pairs:
+                try:
+                    await operation(pair[0], pair[1])
+                    result.succeeded.append(pair)
+                except Exception as e:
+                    result.failed[pair] = e
+
+        await asyncio.gather(
+            *[
+                create_bulk_task(worker(unique_pairs))
+                for _ in range(concurrency or self.tulip_api.concurrency)
+            ]
+        )
+        return result
+
+    def _construct_base_table_link_path(self):
+        return f"tableLinks/{self.link_id}"
+
+    def _construct_link_path(self):
+        return f"{self._construct_base_table_link_path()}/link"
+
+    def _construct_unlink_path(self):
+        return f"{self._construct_base_table_link_path()}/unlink"
@@ -0,0 +1,343 @@
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
+
+from tulip_api.asyncio.tulip_api_scheduler import create_bulk_task
+from tulip_api.asyncio.tulip_table import TulipTable
+
+Transform = Callable[[Dict], Union[Optional[Dict], Awaitable[Optional[Dict]]]]
+
+# Marks the end of a stage's input.
+_DONE = object()
+
+
+class TulipTablePipelineStageStats:
+    """
+    Throughput of one pipeline stage.
+
+    `idle_seconds`: time the stage's workers spent waiting for input, summed across workers.
+
+    `blocked_seconds`: time the stage's workers spent waiting for room in the next stage's queue (backpressure),
+    summed across workers.
+
+    The slowest stage has the lowest `records_per_second`, while the stages before it show high `blocked_seconds`.
+    """
+
+    def __init__(self, name: str, concurrency: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.records = 0
+        self.failed = 0
+        self.idle_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        elapsed_seconds = self.elapsed_seconds
+        if elapsed_seconds == 0:
+            return 0.0
+        return self.records / elapsed_seconds
+
+    def __repr__(self):
+        return (
+            f"TulipTablePipelineStageStats(name={self.name!r}, records={self.records}, failed={self.failed}, "
+            f"records_per_second={self.records_per_second:.1f}, idle_seconds={self.idle_seconds:.2f}, "
+            f"blocked_seconds={self.blocked_seconds:.2f})"
+        )
+
+
+class TulipTablePipeline:
+    """
+    Asyncio enabled
+
+    Reads records from a Tulip Table, transforms them, and writes the results back to the same table or to another one.
+
+    The `read`, `transform` and `write` stages run at the same time, joined by queues of up to `queue_size` records.
+    Each stage has its own concurrency, and a stage waits when the next stage's queue is full,
+    so a slow writer throttles the reader instead of buffering the whole table in memory.
+
+    `transform` is called with each record and returns the record to write, or None to skip it.
+    It may be a plain function or a coroutine function. Plain functions run on the event loop, so keep them fast.
+
+    In `update` mode, each result updates the record with the result's `id`, defaulting to the source record's `id`.
+    In `create` mode, each result is created as a new record in the destination table.
+
+    Records are read in pages by offset. When a pipeline updates its source table, a write to a column used in `filters`
+    or `sort_by` (for example a status going from pending to done) shifts the records after it, so a single pass
+    skips records. See `rescan`.
+    """
+
+    modes = {"update", "create"}
+
+    def __init__(
+        self,
+        source: TulipTable,
+        transform: Transform,
+        destination: Optional[TulipTable] = None,
+        mode: str = "update",
+        filters: List = [],
+        sort_by: str = "_createdAt",
+        sort_asc: bool = True,
+        filter_aggregator: str = "all",
+        read_concurrency: int = 4,
+        transform_concurrency: int = 1,
+        write_concurrency: Optional[int] = None,
+        queue_size: int = 1000,
+        create_random_id: bool = False,
+        warn_on_failure: bool = False,
+        rescan: Optional[bool] = None,
+    ):
+        """
+        destination: the table to write to. Defaults to `source`.
+
+        sort_by: the read order. Pages are read by offset, so don't sort by a column the pipeline writes to the source table,
+            `_updatedAt` included, unless `rescan` is set.
+
+        read_concurrency: the # of pages read at a time.
+
+        transform_concurrency: the # of records transformed at a time. Only useful for coroutine transforms.
+
+        write_concurrency: the # of records written at a time. Defaults to the TulipAPI's concurrency.
+
+        warn_on_failure: set to True to count and print failed writes and transforms, and continue with the rest of the records.
+
+        rescan: once every record read has been written, read the source again from the start, skipping records already seen,
+            until a pass finds no new records. This picks up the records skipped because writes shifted the pages.
+            Defaults to True in `update` mode on the source table with `filters`, where the pipeline may write filtered columns.
+        """
+        if mode not in TulipTablePipeline.modes:
+            raise ValueError(
+                f"Unsupported pipeline mode: {mode}. Must be one of {sorted(TulipTablePipeline.modes)}."
+            )
+        self.source = source
+        self.transform = transform
+        self.destination = destination if destination is not None else source
+        self.mode = mode
+        self.filters = filters
+        self.sort_by = sort_by
+        self.sort_asc = sort_asc
+        self.filter_aggregator = filter_aggregator
+        self.queue_size = queue_size
+        self.create_random_id = create_random_id
+        self.warn_on_failure = warn_on_failure
+        self.rescan = (
+            rescan
+            if rescan is not None
+            else mode == "update"
+            and self.destination.table_id == source.table_id
+            and len(filters) > 0
+        )
+        self.concurrency = {
+            "read": read_concurrency,
+            "transform": transform_concurrency,
+            "write": write_concurrency or self.destination.tulip_api.concurrency,
+        }
+        self.stats = self._new_stats()
+        # The # of records read that haven't been written or dropped yet, see `_settle`.
+        self._unsettled = 0
+        self._settled: Optional[asyncio.Event] = None
+
+    def _new_stats(self) -> Dict[str, TulipTablePipelineStageStats]:
+        return {
+            name: TulipTablePipelineStageStats(name, concurrency)
+            for name, concurrency in self.concurrency.items()
+        }
+
+    async def execute(self) -> Dict[str, TulipTablePipelineStageStats]:
+        """
+        Runs the pipeline until every record has been read and written. Returns the stats of each stage.
+
+        Unless `warn_on_failure` is set, the first failure stops the pipeline and is raised.
+        """
+        self.stats = self._new_stats()
+        self._unsettled = 0
+        self._settled = asyncio.Event()
+        self._settled.set()
+        transform_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        tasks = [create_bulk_task(self._read(transform_queue))]
+        transform_workers = [
+            create_bulk_task(self._transform_worker(transform_queue, write_queue))
+            for _ in range(self.stats["transform"].concurrency)
+        ]
+        write_workers = [
+            create_bulk_task(self._write_worker(write_queue))
+            for _ in range(self.stats["write"].concurrency)
+        ]
+        tasks += transform_workers + write_workers
+        tasks.append(
+            asyncio.ensure_future(
+                self._close_stage(
+                    "transform", transform_workers, write_queue, len(write_workers)
+                )
+            )
+        )
+        tasks.append(asyncio.ensure_future(self._close_stage("write", write_workers)))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self.stats
+
+    async def _read(self, transform_queue: asyncio.Queue):
+        stats = self.stats["read"]
+        stats.started_at = time.monotonic()
+        seen: Optional[Set[str]] = set() if self.rescan else None
+        while True:
+            new_records = await self._read_pass(transform_queue, stats, seen)
+            if seen is None or new_records == 0:
+                break
+            # Once the writes are done, the pages no longer shift, so the next pass finds every record that was skipped.
+            assert self._settled is not None
+            await self._settled.wait()
+        stats.finished_at = time.monotonic()
+        for _ in range(self.stats["transform"].concurrency):
+            await transform_queue.put(_DONE)
+
+    async def _read_pass(
+        self,
+        transform_queue: asyncio.Queue,
+        stats: TulipTablePipelineStageStats,
+        seen: Optional[Set[str]],
+    ) -> int:
+        """
+        Reads the source once and queues its records, skipping those in `seen`. Returns the # of records queued.
+        """
+        new_records = 0
+        pages = self.source._stream_pages_concurrently(
+            stats.concurrency,
+            100,
+            filters=self.filters,
+            sort_by=self.sort_by,
+            sort_asc=self.sort_asc,
+            filter_aggregator=self.filter_aggregator,
+        )
+        try:
+            while True:
+                waited_at = time.monotonic()
+                try:
+                    records = await pages.__anext__()
+                except StopAsyncIteration:
+                    break
+                stats.idle_seconds += time.monotonic() - waited_at
+                for record in records:
+                    if seen is not None:
+                        if record["id"] in seen:
+                            continue
+                        seen.add(record["id"])
+                    self._unsettled += 1
+                    assert self._settled is not None
+                    self._settled.clear()
+                    await self._put(transform_queue, record, stats)
+                    new_records += 1
+        finally:
+            await pages.aclose()
+        stats.records += new_records
+        return new_records
+
+    async def _transform_worker(
+        self, transform_queue: asyncio.Queue, write_queue: asyncio.Queue
+    ):
+        stats = self.stats["transform"]
+        if stats.started_at is None:
+            stats.started_at = time.monotonic()
+        while True:
+            record = await self._get(transform_queue, stats)
+            if record is _DONE:
+                return
+            try:
+                result = self.transform(record)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as e:
+                self._settle()
+                self._on_failure(stats, e)
+                continue
+            stats.records += 1
+            if result is None:
+                self._settle()
+            else:
+                await self._put(write_queue, (record, result), stats)
+
+    async def _write_worker(self, write_queue: asyncio.Queue):
+        stats = self.stats["write"]
+        if stats.started_at is None:
+            stats.started_at = time.monotonic()
+        while True:
+            item = await self._get(write_queue, stats)
+            if item is _DONE:
+                return
+            record, result = item
+            try:
+                if self.mode == "create":
+                    await self.destination.create_record(
+                        result, create_random_id=self.create_random_id
+                    )
+                else:
+                    await self.destination.update_record(
+                        result.get("id", record["id"]),
+                        {key: value for key, value in result.items() if key != "id"},
+                    )
+            except Exception as e:
+                self._settle()
+                self._on_failure(stats, e)
+                continue
+            self._settle()
+            stats.records += 1
+
+    async def _close_stage(
+        self,
+        name: str,
+        workers: List[asyncio.Future],
+        next_queue: Optional[asyncio.Queue] = None,
+        next_workers: int = 0,
+    ):
+        """
+        Waits for a stage's workers to finish, then signals the end of input to the next stage.
+        """
+        await asyncio.gather(*workers)
+        self.stats[name].finished_at = time.monotonic()
+        if next_queue is not None:
+            for _ in range(next_workers):
+                await next_queue.put(_DONE)
+
+    def _settle(self):
+        """
+        Marks a record read as done: written, skipped by the transform, or failed.
+        """
+        self._unsettled -= 1
+        if self._unsettled == 0:
+            assert self._settled is not None
+            self._settled.set()
+
+    def _on_failure(self, stats: TulipTablePipelineStageStats, exception: Exception):
+        stats.failed += 1
+        print(f"There was an issue in the {stats.name} stage of a record\n{exception}")
+        if not self.warn_on_failure:
+            raise exception
+
+    @staticmethod
+    async def _get(queue: asyncio.Queue, stats: TulipTablePipelineStageStats) -> Any:
+        waited_at = time.monotonic()
+        item = await queue.get()
+        stats.idle_seconds += time.monotonic() - waited_at
+        return item
+
+    @staticmethod
+    async def _put(
+        queue: asyncio.Queue, item: Any, stats: TulipTablePipelineStageStats
+    ):
+        waited_at = time.monotonic()
+        await queue.put(item)
+        stats.blocked_seconds += time.monotonic() - waited_at
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+from typing import Dict, Optional
+
+from tulip_api.asyncio.tulip_api_scheduler import create_bulk_task
+from tulip_api.asyncio.tulip_table import TulipTable
+from tulip_api.tulip_table_dead_letter import (
+    DeadLetters,
+    TulipTableDeadLetter,
+    TulipTableDeadLetterSink,
+)
+from tulip_api.tulip_table_progress import ProgressReporting, TulipTableProgress
+from tulip_api.tulip_table_upload_source import TulipTableUploadSource
+
+# Marks the end of the source's batches.
+_DONE = object()
+
+
+class TulipTableUploader:
+    """
+    Asyncio enabled
+
+    Creates a record in a Tulip Table for every record of a `TulipTableUploadSource`.
+
+    The source is read (and untyped values are coerced to the table's column types) in a worker thread,
+    so the event loop only sends requests. Batches of records are passed to the request workers
+    through a queue of at most `queue_size` batches, so memory stays bounded for sources of any size.
+    """
+
+    tulip_table: TulipTable
+
+    def __init__(
+        self,
+        tulip_table: TulipTable,
+        source: TulipTableUploadSource,
+        batch_size: int = 100,
+        queue_size: int = 16,
+        concurrency: Optional[int] = None,
+    ):
+        """
+        batch_size: the # of records the worker thread reads before handing them to the request workers.
+        queue_size: the # of batches buffered ahead of the request workers. The worker thread waits while it is full.
+        concurrency: the # of create requests in flight. Defaults to the `TulipAPI`'s concurrency.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1.")
+        self.tulip_table = tulip_table
+        self.source = source
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.concurrency = concurrency or tulip_table.tulip_api.concurrency
+
+    async def execute(
+        self,
+        create_random_id=False,
+        warn_on_failure=False,
+        dead_letters: DeadLetters = None,
+        progress: ProgressReporting = None,
+    ) -> int:
+        """
+        Returns the # of successfully created records.
+
+        `warn_on_failure`: set to True if you want to continue with creating the rest of the records
+        , despite a malformed request.
+
+        `dead_letters`: receives each record that failed. See `TulipTable.create_records`.
+
+        `progress`: reports the progress. See `TulipTable.create_records`. The ETA is based on the source's `total`.
+        """
+        loop = asyncio.get_running_loop()
+        column_types = None
+        if not self.source.typed:
+            column_types = {
+                column["name"]: column["dataType"]["type"]
+                for column in (await self.tulip_table.get_details())["columns"]
+            }
+            await loop.run_in_executor(None, self.source.validate, column_types)
+
+        sink = (
+            None
+            if dead_letters is None
+            else TulipTableDeadLetterSink.open(dead_letters)
+        )
+        tracker = TulipTableProgress.track(
+            progress,
+            "upload",
+            (
+                None
+                if progress is None
+                else await loop.run_in_executor(None, self.source.total)
+            ),
+            lambda: self.tulip_table.tulip_api.scheduler.in_flight,
+        )
+        batches: asyncio.Queue = asyncio.Queue(self.queue_size)
+        stopped = threading.Event()
+        reader = loop.run_in_executor(
+            None, self._read_batches, loop, batches, stopped, column_types
+        )
+        workers = [
+            create_bulk_task(
+                self._upload_worker(
+                    batches, create_random_id, warn_on_failure, sink, tracker
+                )
+            )
+            for _ in range(self.concurrency)
+        ]
+        try:
+            pending = {reader, *workers}
+            while not reader.done():
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Workers only finish early by failing, which stops the upload.
+                for task in done:
+                    task.result()
+            reader.result()
+            for _ in workers:
+                await batches.put(_DONE)
+            results = await asyncio.gather(*workers)
+        finally:
+            stopped.set()
+            for worker in workers:
+                worker.cancel()
+            # Frees the queue for a put the reader already started. It checks `stopped` before the next one.
+            while not batches.empty():
+                batches.get_nowait()
+            await asyncio.wait({reader})
+            if sink is not None and sink is not dead_letters:
+                sink.close()
+            if tracker is not None and tracker is not progress:
+                tracker.finish()
+
+        created_records = sum(created for created, _ in results)
+        failed_records = sum(failed for _, failed in results)
+        if (warn_on_failure or sink is not None) and failed_records > 0:
+            print(f"Failed to create {failed_records} records.")
+        return created_records
+
+    def _read_batches(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batches: asyncio.Queue,
+        stopped: threading.Event,
+        column_types: Optional[Dict[str, str]],
+    ):
+        """
+        Runs in a worker thread. Reads (and coerces) batches of records from the source, and puts them on `batches`.
+        """
+        for batch in self.source.batches(self.batch_size):
+            if column_types is not None:
+                batch = self.source.coerce(batch, column_types)
+            if stopped.is_set():
+                return
+            asyncio.run_coroutine_threadsafe(batches.put(batch), loop).result()
+
+    async def _upload_worker(
+        self,
+        batches: asyncio.Queue,
+        create_random_id: bool,
+        warn_on_failure: bool,
+        sink: Optional[TulipTableDeadLetterSink],
+        tracker: Optional[TulipTableProgress],
+    ):
+        """
+        Creates the records of batches from the queue, one at a time. Returns the # of created and failed records.
+        """
+        created_records = 0
+        failed_records = 0
+        while True:
+            batch = await batches.get()
+            if batch is _DONE:
+                return created_records, failed_records
+            for record in batch:
+                try:
+                    await self.tulip_table.create_record(
+                        record, create_random_id=create_random_id
+                    )
+                    created_records += 1
+                    if tracker is not None:
+                        tracker.advance(completed=1)
+                except Exception as e:
+                    failed_records += 1
+                    if tracker is not None:
+                        tracker.advance(failed=1)
+                    if sink is not None:
+                        sink.write(
+                            TulipTableDeadLetter.from_exception(
+                                self.tulip_table.table_id, "create", record, e
+                            )
+                        )
+                        continue
+                    print(f"There was an issue creating a record\n{e}")
+                    if not warn_on_failure:
+                        raise e
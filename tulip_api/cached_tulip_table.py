@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from tulip_api.exceptions import (
     TulipAPICachedTableDuplicateIDFound,
@@ -15,15 +15,29 @@ class CachedTulipTable:
     Use with caution and only with small tables.
     """
 
-    def __init__(self, tulip_api: TulipAPI, table_id: str, filters: List = []):
+    def __init__(
+        self,
+        tulip_api: TulipAPI,
+        table_id: str,
+        filters: List = [],
+        columns: Optional[List[str]] = None,
+    ):
+        """
+        columns: only cache these columns of each record, to save memory with wide tables. `id` is always cached.
+        """
         self.tulip_api = tulip_api
         self.table_id = table_id
         self.filters = filters
+        self.columns = (
+            columns if columns is None or "id" in columns else ["id"] + columns
+        )
         self.tulip_table = TulipTable(self.tulip_api, self.table_id)
         self.update_data()
 
     def _fetch_data(self) -> List:
-        return list(self.tulip_table.stream_records(filters=self.filters))
+        return list(
+            self.tulip_table.stream_records(filters=self.filters, columns=self.columns)
+        )
 
     def update_data(self):
         self.records = self._fetch_data()
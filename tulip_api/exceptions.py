@@ -1,11 +1,16 @@
-import aiohttp
-import requests
+import sys
+from typing import TYPE_CHECKING, List, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from tulip_api.transport import TulipAPIResponse
 
 
 class BaseTulipAPIException(Exception):
     """All custom exceptions from within this package inherit from this exception"""
 
-    pass
+    # Set by the exceptions raised for an HTTP response.
+    status_code: Optional[int] = None
+    response_body: Optional[bytes] = None
 
 
 class TulipAPINoCredentialsFound(BaseTulipAPIException):
@@ -17,23 +22,28 @@ class TulipAPINoCredentialsFound(BaseTulipAPIException):
 class TulipAPIAuthorizationError(BaseTulipAPIException):
     """The given credentials were unable to authenticate with the tulip instance."""
 
-    def __init__(self, response: requests.Response):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
-            f"The {response.request.method} request to {response.url} was not able to authenticate using the given credentials.\n"
+            f"The {response.method} request to {response.url} was not able to authenticate using the given credentials.\n"
             f"Response status code: {response.status_code}."
         )
         super().__init__(self.message)
 
 
-class TulipAPIAsyncAuthorizationError(BaseTulipAPIException):
+# The asyncio exceptions subclass their sync counterparts, so the same `except` clauses handle both clients.
+class TulipAPIAsyncAuthorizationError(TulipAPIAuthorizationError):
     """The given credentials were unable to authenticate with the tulip instance."""
 
-    def __init__(self, response: aiohttp.ClientResponse):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
             f"The {response.method} request to {response.url} was not able to authenticate using the given credentials.\n"
-            f"Response status code: {response.status}."
+            f"Response status code: {response.status_code}."
         )
-        super().__init__(self.message)
+        BaseTulipAPIException.__init__(self, self.message)
 
 
 class TulipAPIConnectionError(BaseTulipAPIException):
@@ -45,91 +55,107 @@ class TulipAPIConnectionError(BaseTulipAPIException):
 class TulipAPIMalformedRequestError(BaseTulipAPIException):
     """The request was malformed"""
 
-    def __init__(self, response: requests.Response):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
-            f"The {response.request.method} request to {response.url} was malformed.\n"
+            f"The {response.method} request to {response.url} was malformed.\n"
             f"Response status code: {response.status_code}."
         )
         super().__init__(self.message)
 
 
-class TulipAPIAsyncMalformedRequestError(BaseTulipAPIException):
+class TulipAPIAsyncMalformedRequestError(TulipAPIMalformedRequestError):
     """The request was malformed"""
 
-    def __init__(self, response: aiohttp.ClientResponse):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
             f"The {response.method} request to {response.url} was malformed.\n"
-            f"Response status code: {response.status}."
+            f"Response status code: {response.status_code}."
         )
-        super().__init__(self.message)
+        BaseTulipAPIException.__init__(self, self.message)
 
 
 class TulipAPINotFoundError(BaseTulipAPIException):
     """The requested resource was not found"""
 
-    def __init__(self, response: requests.Response):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
-            f"The {response.request.method} request to {response.url} did not find the requested resource.\n"
+            f"The {response.method} request to {response.url} did not find the requested resource.\n"
             f"Response status code: {response.status_code}."
         )
         super().__init__(self.message)
 
 
-class TulipAPIAsyncNotFoundError(BaseTulipAPIException):
+class TulipAPIAsyncNotFoundError(TulipAPINotFoundError):
     """The requested resource was not found"""
 
-    def __init__(self, response: aiohttp.ClientResponse):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
             f"The {response.method} request to {response.url} did not find the requested resource.\n"
-            f"Response status code: {response.status}."
+            f"Response status code: {response.status_code}."
         )
-        super().__init__(self.message)
+        BaseTulipAPIException.__init__(self, self.message)
 
 
 class TulipAPIInternalError(BaseTulipAPIException):
     """The requested resource was not found"""
 
-    def __init__(self, response: requests.Response):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
-            f"The {response.request.method} request to {response.url} resulted in an internal error.\n"
+            f"The {response.method} request to {response.url} resulted in an internal error.\n"
             f"Response status code: {response.status_code}.\n"
             "Request Body:\n"
-            f"{response.request.body}"
+            f"{response.request_body}"
         )
         super().__init__(self.message)
 
 
-class TulipAPIAsyncInternalError(BaseTulipAPIException):
+class TulipAPIAsyncInternalError(TulipAPIInternalError):
     """The requested resource was not found"""
 
-    def __init__(self, response: aiohttp.ClientResponse):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
             f"The {response.method} request to {response.url} resulted in an internal error.\n"
-            f"Response status code: {response.status}."
+            f"Response status code: {response.status_code}."
         )
-        super().__init__(self.message)
+        BaseTulipAPIException.__init__(self, self.message)
 
 
 class TulipAPIUnknownResponse(BaseTulipAPIException):
     """The requested resource was not found"""
 
-    def __init__(self, response: requests.Response):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
-            f"The {response.request.method} request to {response.url} resulted in an unknown response.\n"
+            f"The {response.method} request to {response.url} resulted in an unknown response.\n"
             f"Response status code: {response.status_code}."
         )
         super().__init__(self.message)
 
 
-class TulipAPIAsyncUnknownResponse(BaseTulipAPIException):
+class TulipAPIAsyncUnknownResponse(TulipAPIUnknownResponse):
     """The requested resource was not found"""
 
-    def __init__(self, response: aiohttp.ClientResponse):
+    def __init__(self, response: "TulipAPIResponse"):
+        self.status_code = response.status_code
+        self.response_body = response.content
         self.message = (
             f"The {response.method} request to {response.url} resulted in an unknown response.\n"
-            f"Response status code: {response.status}."
+            f"Response status code: {response.status_code}."
         )
-        super().__init__(self.message)
+        BaseTulipAPIException.__init__(self, self.message)
 
 
 class TulipAPIInvalidChunkSize(BaseTulipAPIException):
@@ -155,6 +181,74 @@ class TulipApiCachedTableRecordNotFound(BaseTulipAPIException):
         super().__init__(self.message)
 
 
+class TulipAPICachedTableNotLoaded(BaseTulipAPIException):
+    """An asyncio cached table was read before it was loaded"""
+
+    def __init__(self, table_id: str):
+        self.message = f"The cached table {table_id} must be loaded with `await load()` before it is read."
+        super().__init__(self.message)
+
+
 class TulipApiTableRecordCreateMustIncludeID(BaseTulipAPIException):
     def __init__(self):
         self.message = "Table Record creates must include an `id` key in the record, or the `create_random_id` flag must be set to True."
+
+
+class TulipAPIMachineEventSpoolFull(BaseTulipAPIException):
+    """The machine event spool has reached its maximum size"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.message = f"The machine event spool in {directory} has reached its maximum size of {max_bytes} bytes."
+        super().__init__(self.message)
+
+
+class TulipAPIOptionalDependencyMissing(BaseTulipAPIException):
+    """An optional dependency needed for the requested feature is not installed"""
+
+    def __init__(self, package: str, extra: str):
+        self.message = (
+            f"The `{package}` package is required for this feature. "
+            f"Install it with `pip install community-tulip-api[{extra}]`."
+        )
+        super().__init__(self.message)
+
+
+class TulipAPIBudgetUnsupportedPlatform(BaseTulipAPIException):
+    """TulipAPIBudget relies on `fcntl` file locks, which are only available on POSIX platforms"""
+
+    def __init__(self):
+        self.message = (
+            "TulipAPIBudget requires a POSIX platform, `fcntl` is not available."
+        )
+        super().__init__(self.message)
+
+
+def is_retryable(exception: BaseException) -> bool:
+    """
+    Returns whether a request that raised `exception` may succeed if it is sent again:
+    after a connection error, a timeout, a 429 (Too Many Requests) or a 5xx response.
+    Other responses, and errors that aren't about the transport (such as a `TypeError`), would fail again.
+    """
+    status_code = getattr(exception, "status_code", None)
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+    return isinstance(exception, _transport_errors())
+
+
+def _transport_errors() -> Tuple[Type[BaseException], ...]:
+    # The HTTP libraries are imported lazily, and an exception from one can only exist once it is imported.
+    errors: List[Type[BaseException]] = [
+        TulipAPIConnectionError,
+        ConnectionError,
+        TimeoutError,
+    ]
+    requests = sys.modules.get("requests")
+    if requests is not None:
+        errors += [requests.ConnectionError, requests.Timeout]
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None:
+        errors.append(aiohttp.ClientConnectionError)
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is not None:
+        errors.append(asyncio.TimeoutError)
+    return tuple(errors)
@@ -0,0 +1,6 @@
+class TulipAPIResponseCodes:
+    SUCCESS_CODES = {200, 201, 204}
+    MALFORMED_CODES = {400, 422}
+    NOT_FOUND_CODES = {404}
+    UNAUTHENTICATED_CODES = {401, 403}
+    UNEXCPECTED_ERROR_CODES = {500}
@@ -0,0 +1,61 @@
+import json
+from typing import Any
+
+from tulip_api.exceptions import TulipAPIOptionalDependencyMissing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONSerializer:
+    """
+    Encodes request bodies and decodes response bodies with the standard library `json` module.
+    """
+
+    content_type: str = "application/json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class ORJSONSerializer(JSONSerializer):
+    """
+    Encodes request bodies and decodes response bodies with `orjson`. Requires `orjson`.
+
+    Values `orjson` rejects, such as dicts with non-str keys and integers wider than 64 bits,
+    fall back to the `json` module, as does a body `orjson` can't decode, so anything `json` handles still works.
+    It differs from `json` where `json` would fail or produce invalid JSON: NaN and infinity are encoded as `null`,
+    datetimes are encoded as RFC 3339 strings, and NumPy arrays and scalars are serialized natively.
+    Integers wider than 64 bits in a response are decoded as floats.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise TulipAPIOptionalDependencyMissing("orjson", "fast")
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            return super().dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+def default_serializer() -> JSONSerializer:
+    """
+    Returns an `ORJSONSerializer` if `orjson` is installed, otherwise a `JSONSerializer`.
+    See `ORJSONSerializer` for how its encoding differs from `json`.
+    """
+    if orjson is not None:
+        return ORJSONSerializer()
+    return JSONSerializer()
@@ -0,0 +1,170 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from tulip_api.exceptions import (
+    TulipAPIConnectionError,
+    TulipAPIOptionalDependencyMissing,
+)
+
+
+class TulipAPIResponse:
+    """
+    A transport independent HTTP response, as returned by every transport.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        content: bytes,
+        request_body: Optional[bytes] = None,
+    ):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.request_body = request_body
+
+
+class TulipAPITransport(ABC):
+    """
+    Sends the HTTP requests of the sync `TulipAPI`.
+
+    Subclass it and implement `request` (and `close`, if the transport holds connections) to use another HTTP library.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> TulipAPIResponse:
+        """
+        Sends a request, and returns its response whatever its status code.
+        """
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(TulipAPITransport):
+    """
+    Sends requests with a `requests.Session`, reusing HTTP/1.1 connections between requests.
+
+    Connection errors are raised as `requests` exceptions.
+    """
+
+    def __init__(self, pool_maxsize: int = 32):
+        """
+        pool_maxsize: the # of connections kept open per host. Set it to at least the # of threads making requests.
+        """
+        import requests
+
+        self.pool_maxsize = pool_maxsize
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def __getstate__(self):
+        # Copies, like those sent to worker processes, open their own connections.
+        return {"pool_maxsize": self.pool_maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> TulipAPIResponse:
+        response = self.session.request(
+            method, url, params=params, data=data, headers=headers, timeout=timeout
+        )
+        return TulipAPIResponse(
+            method, response.url, response.status_code, response.content, data
+        )
+
+    def close(self):
+        self.session.close()
+
+
+class HTTPXTransport(TulipAPITransport):
+    """
+    Sends requests with an `httpx.Client`. Requires `httpx`.
+
+    With `http2` (requires the `h2` package), concurrent requests from multiple threads are multiplexed
+    over a single connection per host, instead of opening a connection per thread.
+
+    Connection errors are raised as `TulipAPIConnectionError`.
+    """
+
+    def __init__(self, http2: bool = True, max_connections: Optional[int] = None):
+        try:
+            import httpx
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("httpx", "http2")
+        self._httpx = httpx
+        self.http2 = http2
+        self.max_connections = max_connections
+        try:
+            self.client = httpx.Client(
+                http2=http2, limits=httpx.Limits(max_connections=max_connections)
+            )
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("h2", "http2")
+
+    def __getstate__(self):
+        return {"http2": self.http2, "max_connections": self.max_connections}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> TulipAPIResponse:
+        try:
+            response = self.client.request(
+                method,
+                url,
+                params=params,
+                content=data,
+                headers=headers,
+                timeout=timeout,
+            )
+        except self._httpx.TransportError as e:
+            raise TulipAPIConnectionError(str(e)) from e
+        return TulipAPIResponse(
+            method, str(response.url), response.status_code, response.content, data
+        )
+
+    def close(self):
+        self.client.close()
+
+
+def create_transport(transport: str) -> TulipAPITransport:
+    """
+    Returns a new transport by name: `requests` or `httpx`.
+    """
+    if transport == "requests":
+        return RequestsTransport()
+    if transport == "httpx":
+        return HTTPXTransport()
+    raise ValueError(
+        f"Unsupported transport: {transport}. Must be one of ['httpx', 'requests']."
+    )
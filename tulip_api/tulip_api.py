@@ -1,8 +1,7 @@
 import os
+import threading
 from base64 import b64encode
-from typing import Any, List, Optional, Tuple, Union
-
-import requests
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 from tulip_api.exceptions import (
     TulipAPIAuthorizationError,
@@ -12,11 +11,21 @@ from tulip_api.exceptions import (
     TulipAPINotFoundError,
     TulipAPIUnknownResponse,
 )
+from tulip_api.response_codes import TulipAPIResponseCodes
+from tulip_api.serializers import JSONSerializer, default_serializer
+from tulip_api.transport import TulipAPIResponse, TulipAPITransport, create_transport
+from tulip_api.tulip_api_budget import TulipAPIBudget
+
+if TYPE_CHECKING:
+    from tulip_api.tulip_api_event_loop import TulipAPIEventLoop
+
+# Guards the lazy creation of each TulipAPI's event loop. Module level, so TulipAPI instances stay picklable.
+_event_loop_lock = threading.Lock()
 
 
 class TulipAPI:
     """
-    Wraps the `requests.request` function with authentication, response processing, and base url construction.
+    Wraps the HTTP transport (`requests` by default) with authentication, response processing, and base url construction.
     """
 
     def __init__(
@@ -27,12 +36,27 @@ class TulipAPI:
         auth: Optional[str] = None,
         use_full_url: bool = False,
         request_timeout: Optional[int] = 60,
+        serializer: Optional[JSONSerializer] = None,
+        bulk_concurrency: Optional[int] = None,
+        transport: Union[str, TulipAPITransport] = "requests",
+        budget: Optional[TulipAPIBudget] = None,
     ):
         """
         use_full_url: if set to true, the tulip_url must include `http://` or `https://` as well as the fqdn. For example `https://abc.tulip.co`
-        request_timeout: timeout for the underlying requests.request. Defaults to 60s. Set to None to disable the timeout.
+        request_timeout: timeout for each request. Defaults to 60s. Set to None to disable the timeout.
+        serializer: encodes request bodies and decodes responses. Defaults to `orjson` when it is installed, and the standard library `json` module otherwise.
+        bulk_concurrency: if set, bulk `TulipTable` calls (`create_records`, `update_records`, `retry_dead_letters` and `stream_records`) run through
+            the asyncio client on a background event loop, with up to this many requests in flight. They still block and raise the sync exceptions.
+            Records are still read on the calling thread. Requires `aiohttp`.
+        transport: sends the HTTP requests. `requests` (default), `httpx` for HTTP/2 (requires `httpx` and `h2`), or a `TulipAPITransport`.
+            Bulk calls use `aiohttp`, or `httpx` with the same `http2` setting for an `HTTPXTransport`. A custom transport only sends the other calls.
+        budget: a request rate and concurrency budget shared with other `TulipAPI`s, including those in other processes.
         """
         self.timeout = request_timeout
+        self.transport = (
+            create_transport(transport) if isinstance(transport, str) else transport
+        )
+        self.serializer = serializer if serializer is not None else default_serializer()
         self.host = self._construct_base_url(tulip_url, use_full_url)
 
         self.auth = TulipAPI._provide_api_credentials(
@@ -40,6 +64,38 @@ class TulipAPI:
         )
 
         self.headers = self._construct_headers()
+        self.json_headers = {
+            **self.headers,
+            "Content-Type": self.serializer.content_type,
+        }
+        self.bulk_concurrency = bulk_concurrency
+        self.budget = budget
+        self._event_loop: Optional["TulipAPIEventLoop"] = None
+
+    def __getstate__(self):
+        # The background event loop belongs to this process, copies create their own.
+        return {**self.__dict__, "_event_loop": None}
+
+    def event_loop(self) -> "TulipAPIEventLoop":
+        """
+        Returns the background event loop used for bulk calls, starting it on first use. See `bulk_concurrency`.
+        """
+        with _event_loop_lock:
+            if self._event_loop is None:
+                from tulip_api.tulip_api_event_loop import TulipAPIEventLoop
+
+                self._event_loop = TulipAPIEventLoop(self, self.bulk_concurrency or 40)
+            return self._event_loop
+
+    def close(self):
+        """
+        Closes the transport's connections, and stops the background event loop if it was started.
+        """
+        with _event_loop_lock:
+            if self._event_loop is not None:
+                self._event_loop.close()
+                self._event_loop = None
+        self.transport.close()
 
     def _make_request(
         self,
@@ -48,16 +104,23 @@ class TulipAPI:
         params: Union[dict, List[Tuple], bytes, None] = None,
         json: Any = None,
     ):
-        return self._handle_api_response(
-            requests.request(
+        # Bodies are encoded once here and sent as bytes, rather than re-encoded by the transport.
+        data = None if json is None else self.serializer.dumps(json)
+        if self.budget is not None:
+            self.budget.acquire()
+        try:
+            response = self.transport.request(
                 method,
                 self._construct_url(path),
                 params=params,
-                json=json,
-                headers=self.headers,
+                data=data,
+                headers=self.headers if json is None else self.json_headers,
                 timeout=self.timeout,
             )
-        )
+        finally:
+            if self.budget is not None:
+                self.budget.release()
+        return self._handle_api_response(response)
 
     def make_request(
         self,
@@ -69,7 +132,9 @@ class TulipAPI:
         """
         Makes a request against the Tulip API. Parses and returns JSON returned from the Tulip API.
         """
-        return self._make_request(path, method, params=params, json=json).json()
+        return self.serializer.loads(
+            self._make_request(path, method, params=params, json=json).content
+        )
 
     def make_request_expect_nothing(
         self,
@@ -112,7 +177,7 @@ class TulipAPI:
     def _construct_headers(self):
         return {"Authorization": f"Basic {self.auth}"}
 
-    def _handle_api_response(self, response: requests.Response):
+    def _handle_api_response(self, response: TulipAPIResponse):
         if response.status_code in TulipAPIResponseCodes.SUCCESS_CODES:
             return response
         if response.status_code in TulipAPIResponseCodes.MALFORMED_CODES:
@@ -124,11 +189,3 @@ class TulipAPI:
         if response.status_code in TulipAPIResponseCodes.UNEXCPECTED_ERROR_CODES:
             raise TulipAPIInternalError(response)
         raise TulipAPIUnknownResponse(response)
-
-
-class TulipAPIResponseCodes:
-    SUCCESS_CODES = {200, 201, 204}
-    MALFORMED_CODES = {400, 422}
-    NOT_FOUND_CODES = {404}
-    UNAUTHENTICATED_CODES = {401, 403}
-    UNEXCPECTED_ERROR_CODES = {500}
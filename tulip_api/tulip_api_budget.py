@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple
+
+from tulip_api.exceptions import TulipAPIBudgetUnsupportedPlatform
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class TulipAPIBudget:
+    """
+    A request rate and concurrency budget shared by every `TulipAPI`, in any process on the host, given a budget with the same `key`.
+
+    The budget is a token bucket of `requests_per_second` tokens, plus a count of requests in flight,
+    kept in a small state file behind an `fcntl` file lock. Each request takes a token and a slot before it is sent,
+    so all processes together stay under the instance's limits. Slots held by processes that have exited are reclaimed.
+
+    Only supported on POSIX platforms.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        requests_per_second: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        directory: Optional[str] = None,
+        poll_interval: float = 0.01,
+    ):
+        """
+        key: budgets with the same key share their state, for example the Tulip instance's host.
+        requests_per_second: the rate of requests across all processes. None for no rate limit.
+        concurrency: the # of requests in flight across all processes. None for no concurrency limit.
+        directory: where the state file is kept. Defaults to the system's temporary directory.
+        poll_interval: how often a request waiting for a free slot checks the budget, in seconds.
+        """
+        try:
+            import fcntl  # noqa: F401
+        except ImportError:
+            raise TulipAPIBudgetUnsupportedPlatform()
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0.")
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        self.key = key
+        self.requests_per_second = requests_per_second
+        self.concurrency = concurrency
+        self.directory = directory or tempfile.gettempdir()
+        self.poll_interval = poll_interval
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(self.directory, f"tulip-api-budget-{digest}.json")
+        # The waiting requests and poller task of each event loop using the budget. See `acquire_async`.
+        self._pollers: Dict[Any, Tuple[Deque, Any]] = {}
+
+    def __getstate__(self):
+        # Pollers belong to this process's event loops.
+        state = self.__dict__.copy()
+        state["_pollers"] = {}
+        return state
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent. Each `acquire` must be followed by a `release`.
+        """
+        while True:
+            wait = self._try_acquire()
+            if wait == 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Waits, without blocking the event loop, until a request may be sent. Each `acquire_async` must be followed by a `release_async`.
+
+        The waiting requests of an event loop queue up behind a single poller, which takes the file lock
+        in the default executor, so the lock is polled once per event loop rather than once per request.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        waiters, poller = self._pollers.get(loop, (None, None))
+        if waiters is None or poller is None or poller.done():
+            waiters = deque()
+            poller = loop.create_task(self._poll_async(waiters))
+            self._pollers[loop] = (waiters, poller)
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the request was cancelled.
+                loop.run_in_executor(None, self.release)
+            elif waiter in waiters:
+                waiters.remove(waiter)
+            raise
+
+    async def release_async(self):
+        """
+        Frees the slot of a request that finished, without blocking the event loop.
+        """
+        if self.concurrency is None:
+            return
+        import asyncio
+
+        await asyncio.get_running_loop().run_in_executor(None, self.release)
+
+    async def _poll_async(self, waiters: Deque["asyncio.Future"]):
+        """
+        Takes tokens and slots for the event loop's waiting requests, in order, until none are left.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                while len(waiters) > 0 and waiters[0].done():
+                    waiters.popleft()
+                if len(waiters) == 0:
+                    return
+                wait = await loop.run_in_executor(None, self._try_acquire)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+                while len(waiters) > 0 and waiters[0].done():
+                    waiters.popleft()
+                if len(waiters) == 0:
+                    # Every waiter was cancelled while the slot was taken.
+                    await loop.run_in_executor(None, self.release)
+                    return
+                waiters.popleft().set_result(None)
+        finally:
+            if self._pollers.get(loop, (None,))[0] is waiters:
+                del self._pollers[loop]
+
+    def release(self):
+        """
+        Frees the slot of a request that finished.
+        """
+        if self.concurrency is None:
+            return
+        pid = str(os.getpid())
+        with self._locked_state() as state:
+            holders = state.value["holders"]
+            if holders.get(pid, 0) <= 1:
+                holders.pop(pid, None)
+            else:
+                holders[pid] -= 1
+
+    def _try_acquire(self) -> float:
+        """
+        Takes a token and a slot if both are available, and returns 0. Otherwise returns the # of seconds to wait before trying again.
+        """
+        pid = str(os.getpid())
+        with self._locked_state() as state:
+            now = time.time()
+            value = state.value
+            holders = value["holders"]
+
+            if self.concurrency is not None:
+                if sum(holders.values()) >= self.concurrency:
+                    TulipAPIBudget._reclaim_slots(holders)
+                if sum(holders.values()) >= self.concurrency:
+                    return self.poll_interval
+
+            if self.requests_per_second is not None:
+                # The bucket holds at most one second of requests, so idle time doesn't allow a large burst.
+                tokens = min(
+                    self.requests_per_second,
+                    value["tokens"]
+                    + (now - value["updated_at"]) * self.requests_per_second,
+                )
+                value["updated_at"] = now
+                if tokens < 1:
+                    value["tokens"] = tokens
+                    return (1 - tokens) / self.requests_per_second
+                value["tokens"] = tokens - 1
+
+            if self.concurrency is not None:
+                holders[pid] = holders.get(pid, 0) + 1
+            return 0
+
+    @staticmethod
+    def _reclaim_slots(holders: Dict[str, int]):
+        for pid in list(holders):
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                del holders[pid]
+            except PermissionError:
+                # The process exists, but belongs to another user.
+                pass
+
+    def _locked_state(self) -> "_TulipAPIBudgetState":
+        return _TulipAPIBudgetState(self.path, self.requests_per_second)
+
+
+class _TulipAPIBudgetState:
+    """
+    Holds the budget's file lock while in use, and writes the (modified) state back when done.
+    """
+
+    def __init__(self, path: str, requests_per_second: Optional[float]):
+        self.path = path
+        self.requests_per_second = requests_per_second
+        self.value: Dict[str, Any] = {}
+
+    def __enter__(self) -> "_TulipAPIBudgetState":
+        import fcntl
+
+        self._file = open(
+            os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600), "r+", encoding="utf-8"
+        )
+        fcntl.flock(self._file, fcntl.LOCK_EX)
+        content = self._file.read()
+        self.value = (
+            json.loads(content)
+            if content
+            else {
+                "tokens": self.requests_per_second or 0,
+                "updated_at": time.time(),
+                "holders": {},
+            }
+        )
+        return self
+
+    def __exit__(self, _, __, ___):
+        try:
+            self._file.seek(0)
+            self._file.truncate()
+            self._file.write(json.dumps(self.value))
+            self._file.flush()
+        finally:
+            # Closing the file releases the lock.
+            self._file.close()
@@ -0,0 +1,216 @@
+import asyncio
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    TypeVar,
+)
+
+from tulip_api.exceptions import TulipAPIConnectionError
+from tulip_api.transport import HTTPXTransport
+
+if TYPE_CHECKING:
+    from tulip_api.asyncio.tulip_table import TulipTable as AsyncTulipTable
+    from tulip_api.tulip_api import TulipAPI
+
+T = TypeVar("T")
+
+# Marks the end of a page stream, or of the items fed to a consumer.
+_DONE = object()
+
+
+class TulipAPIEventLoop:
+    """
+    Runs an asyncio `TulipAPI` on a private event loop in a background thread, so sync code can use its concurrency.
+
+    Created by the sync `TulipAPI` when it is given a `bulk_concurrency`. Requires `aiohttp`.
+    Requests are sent with `aiohttp`, or with `httpx` if the sync client uses an `HTTPXTransport`;
+    any other custom sync transport isn't used by the event loop.
+    The asyncio exceptions subclass the sync ones, and connection errors are raised as `TulipAPIConnectionError`,
+    so calls through the event loop raise the same exception types as the sync client.
+    """
+
+    def __init__(self, tulip_api: "TulipAPI", concurrency: int):
+        from tulip_api.asyncio.transport import AsyncHTTPXTransport
+        from tulip_api.asyncio.tulip_api import TulipAPI as AsyncTulipAPI
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="tulip-api-event-loop", daemon=True
+        )
+        self._thread.start()
+
+        self.tulip_api = AsyncTulipAPI(
+            tulip_api.host,
+            concurrency=concurrency,
+            auth=tulip_api.auth,
+            use_full_url=True,
+            request_timeout=tulip_api.timeout,
+            serializer=tulip_api.serializer,
+            budget=tulip_api.budget,
+            transport=(
+                AsyncHTTPXTransport(http2=tulip_api.transport.http2)
+                if isinstance(tulip_api.transport, HTTPXTransport)
+                else "aiohttp"
+            ),
+        )
+        # Use the sync client's base url as is, rather than rebuilding it from a host.
+        self.tulip_api.host = tulip_api.host
+        # The connection pool must be created on the event loop that uses it.
+        self.run(self._enter())
+        atexit.register(self.close)
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """
+        Runs a coroutine on the event loop and blocks until it is done. Returns its result, or raises its exception.
+        """
+        return TulipAPIEventLoop._result(
+            asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        )
+
+    def run_consumer(
+        self,
+        consumer: Callable[[AsyncIterator[Any]], Awaitable[T]],
+        items: Iterable[Any],
+        buffered_items: int = 1024,
+    ) -> T:
+        """
+        Runs `consumer` on the event loop with an async iterator of `items`, and blocks until it is done.
+        Returns its result, or raises its exception.
+
+        `items` is read on the calling thread, and handed to the event loop through a queue of at most `buffered_items`,
+        so an Iterable that blocks, or that is itself fed by the event loop (like `stream_records`), doesn't stall it.
+        Reading stops once the consumer is done.
+        """
+        handoff: queue.Queue = queue.Queue(buffered_items)
+        stopped = threading.Event()
+
+        def take() -> List[Any]:
+            # Runs in a worker thread, so waiting for items doesn't block the event loop.
+            if stopped.is_set():
+                return [_DONE]
+            taken = [handoff.get()]
+            while taken[-1] is not _DONE:
+                try:
+                    taken.append(handoff.get_nowait())
+                except queue.Empty:
+                    break
+            return taken
+
+        async def feed() -> AsyncIterator[Any]:
+            loop = asyncio.get_running_loop()
+            while True:
+                for item in await loop.run_in_executor(None, take):
+                    if item is _DONE:
+                        return
+                    yield item
+
+        future = asyncio.run_coroutine_threadsafe(consumer(feed()), self._loop)
+        # Nothing reads the queue once the consumer is done, so makes room for a put waiting on it.
+        future.add_done_callback(lambda _: TulipAPIEventLoop._drain(handoff))
+        try:
+            for item in items:
+                if future.done():
+                    break
+                handoff.put(item)
+            else:
+                if not future.done():
+                    handoff.put(_DONE)
+            return TulipAPIEventLoop._result(future)
+        finally:
+            stopped.set()
+            # Wakes a take waiting for an item, if `items` raised.
+            TulipAPIEventLoop._drain(handoff)
+            handoff.put_nowait(_DONE)
+
+    def stream_pages(
+        self,
+        tulip_table: "AsyncTulipTable",
+        concurrency: int,
+        chunk_size: int,
+        buffered_pages: int = 16,
+        **query,
+    ) -> Generator[List[dict], None, None]:
+        """
+        Yields the pages of an asyncio `TulipTable._stream_pages_concurrently` in order.
+
+        Up to `buffered_pages` pages are fetched ahead of the caller. Closing the Generator stops the fetch.
+        """
+        pages: queue.Queue = queue.Queue(buffered_pages)
+        stopped = threading.Event()
+
+        def put(item: Any) -> bool:
+            # Runs in a worker thread, so waiting for room doesn't block the event loop.
+            if stopped.is_set():
+                return False
+            pages.put(item)
+            return True
+
+        async def fetch():
+            loop = asyncio.get_running_loop()
+            try:
+                async for records in tulip_table._stream_pages_concurrently(
+                    concurrency, chunk_size, **query
+                ):
+                    if not await loop.run_in_executor(None, put, records):
+                        return
+            finally:
+                await loop.run_in_executor(None, put, _DONE)
+
+        future = asyncio.run_coroutine_threadsafe(fetch(), self._loop)
+        try:
+            while True:
+                records = pages.get()
+                if records is _DONE:
+                    break
+                yield records
+            TulipAPIEventLoop._result(future)
+        finally:
+            stopped.set()
+            future.cancel()
+            # Makes room for a put waiting in a worker thread, which then sees `stopped`.
+            TulipAPIEventLoop._drain(pages)
+
+    def close(self):
+        """
+        Closes the connection pool and stops the event loop.
+        """
+        if not self._thread.is_alive():
+            return
+        atexit.unregister(self.close)
+        self.run(self._exit())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @staticmethod
+    def _drain(items: queue.Queue):
+        while True:
+            try:
+                items.get_nowait()
+            except queue.Empty:
+                return
+
+    @staticmethod
+    def _result(future: "Future[T]") -> T:
+        import aiohttp
+
+        try:
+            return future.result()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise TulipAPIConnectionError(str(e)) from e
+
+    async def _enter(self):
+        self.tulip_api.__enter__()
+
+    async def _exit(self):
+        await self.tulip_api.close()
@@ -0,0 +1,88 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TulipMachineAttributeFilter:
+    """
+    Report-on-change filtering for machine attributes.
+
+    Remembers the last reported value per (machine_id, attributeId) and suppresses values that did not change.
+    Numeric values are also suppressed while they stay within the attribute's deadband of the last reported value.
+    """
+
+    def __init__(
+        self,
+        deadband: float = 0,
+        deadbands: Optional[Dict[str, float]] = None,
+        max_silence: Optional[float] = None,
+    ):
+        """
+        deadband: numeric values within this distance of the last reported value are suppressed.
+        deadbands: per attributeId deadbands, overriding `deadband`.
+        max_silence: seconds after which an unchanged value is reported anyway, as a heartbeat. Set to None to never resend unchanged values.
+        """
+        self.deadband = deadband
+        self.deadbands = deadbands if deadbands is not None else {}
+        self.max_silence = max_silence
+
+        self.sent_values = 0
+        self.suppressed_values = 0
+        self._last_reported: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+
+    def filter_attributes(
+        self, attributes: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the `{"machineId", "attributeId", "value"}` entries that should be reported, and remembers them as reported.
+        """
+        now = time.monotonic()
+        reported = []
+        for attribute in attributes:
+            key = (attribute["machineId"], attribute["attributeId"])
+            value = attribute["value"]
+            last_reported = self._last_reported.get(key)
+            if last_reported is not None and self._is_suppressed(
+                key[1], value, last_reported, now
+            ):
+                self.suppressed_values += 1
+                continue
+            self._last_reported[key] = (value, now)
+            self.sent_values += 1
+            reported.append(attribute)
+        return reported
+
+    def reset(self, machine_id: Optional[str] = None):
+        """
+        Forgets the last reported values, of a single machine or of every machine, so their next values are always reported.
+        """
+        if machine_id is None:
+            self._last_reported = {}
+            return
+        for key in [key for key in self._last_reported if key[0] == machine_id]:
+            del self._last_reported[key]
+
+    def _is_suppressed(
+        self,
+        attribute_id: str,
+        value: Any,
+        last_reported: Tuple[Any, float],
+        now: float,
+    ) -> bool:
+        last_value, last_reported_at = last_reported
+        if self.max_silence is not None and now - last_reported_at >= self.max_silence:
+            return False
+        if value == last_value:
+            return True
+
+        deadband = self.deadbands.get(attribute_id, self.deadband)
+        if deadband <= 0:
+            return False
+        if not TulipMachineAttributeFilter._is_number(
+            value
+        ) or not TulipMachineAttributeFilter._is_number(last_value):
+            return False
+        return abs(value - last_value) <= deadband
+
+    @staticmethod
+    def _is_number(value: Any) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -0,0 +1,225 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from tulip_api.exceptions import TulipAPIMachineEventSpoolFull
+
+
+class TulipMachineEventSpool:
+    """
+    A durable store-and-forward spool for machine attributes.
+
+    Batches are appended as NDJSON lines to append-only segment files in `directory`, and read back in the order they were written.
+    Total disk usage is bounded by `max_bytes`. When the spool is full, `overflow` decides what happens:
+
+    - `drop_oldest`: delete the oldest segments to make room.
+    - `drop_newest`: drop the batch being appended.
+    - `raise`: raise `TulipAPIMachineEventSpoolFull`.
+    """
+
+    OVERFLOW_DROP_OLDEST = "drop_oldest"
+    OVERFLOW_DROP_NEWEST = "drop_newest"
+    OVERFLOW_RAISE = "raise"
+
+    segment_suffix: str = ".ndjson"
+    cursor_filename: str = "cursor"
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        segment_bytes: int = 8 * 1024 * 1024,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        fsync: bool = False,
+    ):
+        """
+        max_bytes: the maximum # of bytes used by all segment files.
+        segment_bytes: segment files are rotated once they reach this size.
+        overflow: one of `drop_oldest`, `drop_newest` or `raise`.
+        fsync: if set to true, every append is fsync'd to disk.
+        """
+        if overflow not in {
+            TulipMachineEventSpool.OVERFLOW_DROP_OLDEST,
+            TulipMachineEventSpool.OVERFLOW_DROP_NEWEST,
+            TulipMachineEventSpool.OVERFLOW_RAISE,
+        }:
+            raise ValueError(f"Unsupported overflow policy: {overflow}")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.overflow = overflow
+        self.fsync = fsync
+
+        self.dropped_batches = 0
+        self.dropped_segments = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._segments: Dict[int, int] = {
+            number: os.path.getsize(self._segment_path(number))
+            for number in self._list_segments()
+        }
+        self._cursor = self._read_cursor()
+        # Segment numbers only ever increase, so a persisted cursor never points into a newer segment.
+        # Appends after a restart go to a new segment, in case the last one ends with a partially written line.
+        self._last_number = max(list(self._segments) + [self._cursor[0]])
+        self._write_number: Optional[int] = None
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if every appended batch has been acknowledged.
+        """
+        with self._lock:
+            return self._is_empty()
+
+    def append(self, attributes: List[Dict[str, Any]]) -> bool:
+        """
+        Appends a batch of `{"machineId", "attributeId", "value"}` entries to the spool.
+
+        Returns False if the batch was dropped by the `drop_newest` overflow policy.
+        """
+        line = (json.dumps(attributes) + "\n").encode("utf-8")
+        with self._lock:
+            if not self._make_room(len(line)):
+                self.dropped_batches += 1
+                return False
+
+            number = self._write_number
+            if (
+                number is None
+                or number not in self._segments
+                or self._segments[number] + len(line) > self.segment_bytes
+            ):
+                self._last_number += 1
+                number = self._write_number = self._last_number
+                self._segments[number] = 0
+
+            with open(self._segment_path(number), "ab") as segment:
+                segment.write(line)
+                if self.fsync:
+                    segment.flush()
+                    os.fsync(segment.fileno())
+            self._segments[number] += len(line)
+            return True
+
+    def read(
+        self, max_attributes: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[int, int]]]:
+        """
+        Reads the oldest unacknowledged batches, combined into a list of at most `max_attributes` entries.
+        A single batch larger than `max_attributes` is returned whole.
+
+        Returns the entries and a position to pass to `acknowledge` once they have been sent.
+        """
+        with self._lock:
+            if self._is_empty():
+                return [], None
+            number, offset = self._cursor
+            if number not in self._segments:
+                number, offset = min(self._segments), 0
+
+            attributes: List[Dict[str, Any]] = []
+            with open(self._segment_path(number), "rb") as segment:
+                segment.seek(offset)
+                while True:
+                    line = segment.readline()
+                    if len(line) == 0:
+                        break
+                    if not line.endswith(b"\n"):
+                        # A partially written line can only be completed in the segment being written to.
+                        if number != self._write_number:
+                            offset += len(line)
+                        break
+                    try:
+                        batch = json.loads(line)
+                    except ValueError:
+                        offset += len(line)
+                        continue
+                    if (
+                        len(attributes) > 0
+                        and len(attributes) + len(batch) > max_attributes
+                    ):
+                        break
+                    attributes += batch
+                    offset += len(line)
+            return attributes, (number, offset)
+
+    def acknowledge(self, position: Optional[Tuple[int, int]]):
+        """
+        Marks everything up to `position` (as returned by `read`) as sent.
+        Fully sent segment files are deleted.
+        """
+        if position is None:
+            return
+        with self._lock:
+            number, offset = position
+            if number not in self._segments:
+                return
+            for old_number in [n for n in self._segments if n < number]:
+                self._delete_segment(old_number)
+            if offset >= self._segments[number]:
+                self._delete_segment(number)
+                self._cursor = (number + 1, 0)
+            else:
+                self._cursor = (number, offset)
+            self._write_cursor()
+
+    def _is_empty(self) -> bool:
+        if len(self._segments) == 0:
+            return True
+        number, offset = self._cursor
+        return (
+            len(self._segments) == 1
+            and number in self._segments
+            and offset >= self._segments[number]
+        )
+
+    def _make_room(self, size: int) -> bool:
+        while sum(self._segments.values()) + size > self.max_bytes:
+            if self.overflow == TulipMachineEventSpool.OVERFLOW_RAISE:
+                raise TulipAPIMachineEventSpoolFull(self.directory, self.max_bytes)
+            if (
+                self.overflow == TulipMachineEventSpool.OVERFLOW_DROP_NEWEST
+                or len(self._segments) == 0
+            ):
+                return False
+            self._delete_segment(min(self._segments))
+            self.dropped_segments += 1
+        return True
+
+    def _delete_segment(self, number: int):
+        del self._segments[number]
+        try:
+            os.remove(self._segment_path(number))
+        except FileNotFoundError:
+            pass
+
+    def _list_segments(self) -> List[int]:
+        return sorted(
+            int(filename[: -len(TulipMachineEventSpool.segment_suffix)])
+            for filename in os.listdir(self.directory)
+            if filename.endswith(TulipMachineEventSpool.segment_suffix)
+        )
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(
+            self.directory, f"{number:012d}{TulipMachineEventSpool.segment_suffix}"
+        )
+
+    def _cursor_path(self) -> str:
+        return os.path.join(self.directory, TulipMachineEventSpool.cursor_filename)
+
+    def _read_cursor(self) -> Tuple[int, int]:
+        try:
+            with open(self._cursor_path(), "r") as cursor:
+                number, offset = cursor.read().split()
+                return int(number), int(offset)
+        except (FileNotFoundError, ValueError):
+            return 0, 0
+
+    def _write_cursor(self):
+        temporary_path = f"{self._cursor_path()}.tmp"
+        with open(temporary_path, "w") as cursor:
+            cursor.write(f"{self._cursor[0]} {self._cursor[1]}")
+        os.replace(temporary_path, self._cursor_path())
@@ -0,0 +1,187 @@
+import atexit
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from tulip_api.exceptions import TulipAPIMachineEventSpoolFull, is_retryable
+from tulip_api.tulip_api import TulipAPI
+from tulip_api.tulip_machine_attribute_filter import TulipMachineAttributeFilter
+from tulip_api.tulip_machine_event_spool import TulipMachineEventSpool
+
+
+class TulipMachineReporter:
+    """
+    Queues machine attribute reports from many `TulipMachine`s and sends them together.
+
+    Queued attributes are packed into a single `/attributes/report` request per flush.
+    A flush happens every `flush_interval` seconds, or as soon as `max_batch_size` attributes are queued.
+    Pending attributes are flushed when the reporter is closed (or the `with` block exits) and at interpreter exit.
+    """
+
+    attributes_report_path: str = "attributes/report"
+
+    def __init__(
+        self,
+        tulip_api: TulipAPI,
+        max_batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        attribute_filter: Optional[TulipMachineAttributeFilter] = None,
+        spool: Optional[TulipMachineEventSpool] = None,
+        replay_requests_per_flush: int = 10,
+    ):
+        """
+        max_batch_size: the maximum # of attributes sent in a single request.
+        flush_interval: seconds between background flushes.
+        attribute_filter: if given, only attributes passing the filter are queued. See `TulipMachineAttributeFilter`.
+        spool: if given, batches that can't be sent because the Tulip instance is unreachable are stored in the spool, and replayed in order once it is reachable again. See `TulipMachineEventSpool`.
+        replay_requests_per_flush: the maximum # of requests used to replay spooled batches per flush.
+        """
+        self.tulip_api = tulip_api
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.attribute_filter = attribute_filter
+        self.spool = spool
+        self.replay_requests_per_flush = replay_requests_per_flush
+
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._queue_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._closed = False
+
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _, __, ___):
+        self.close()
+
+    def queue_event(self, machine_id: str, attributes: Dict[str, Any]):
+        """
+        Queues a machine event.
+
+        `attributes`: A dict with attributeId: value pairs.
+        """
+        self.queue_attributes(
+            [
+                {"machineId": machine_id, "attributeId": key, "value": value}
+                for key, value in attributes.items()
+            ]
+        )
+
+    def queue_attributes(self, attributes: List[Dict[str, Any]]):
+        """
+        Queues already constructed `{"machineId", "attributeId", "value"}` entries.
+        """
+        with self._queue_lock:
+            if self.attribute_filter is not None:
+                attributes = self.attribute_filter.filter_attributes(attributes)
+            self._queue.extend(attributes)
+            if len(self._queue) >= self.max_batch_size:
+                self._flush_requested.set()
+
+    def flush(self) -> int:
+        """
+        POST `/attributes/report`
+
+        Sends every queued attribute, `max_batch_size` attributes per request. Returns the # of requests made.
+        If a request fails, its attributes are put back at the front of the queue and the exception is raised.
+
+        With a spool, spooled batches are replayed first. While the spool isn't empty, or once the Tulip instance
+        turns out to be unreachable, queued batches are appended to the spool instead of being sent.
+        """
+        requests_made = 0
+        with self._flush_lock:
+            reachable = True
+            if self.spool is not None:
+                replay_requests, reachable = self._replay_spool(self.spool)
+                requests_made += replay_requests
+            while True:
+                batch = self._take_batch()
+                if len(batch) == 0:
+                    return requests_made
+                if self.spool is not None and (
+                    not reachable or not self.spool.is_empty()
+                ):
+                    self._spool_batch(self.spool, batch)
+                    continue
+                try:
+                    self._send_batch(batch)
+                except Exception as exception:
+                    if self.spool is not None and is_retryable(exception):
+                        self._spool_batch(self.spool, batch)
+                        reachable = False
+                        continue
+                    with self._queue_lock:
+                        self._queue.extendleft(reversed(batch))
+                    raise exception
+                requests_made += 1
+
+    def _spool_batch(self, spool: TulipMachineEventSpool, batch: List[Dict]):
+        """
+        Appends a taken batch to the spool. If the spool is full, the batch is put back at the front of the queue.
+        """
+        try:
+            spool.append(batch)
+        except TulipAPIMachineEventSpoolFull:
+            with self._queue_lock:
+                self._queue.extendleft(reversed(batch))
+            raise
+
+    def close(self):
+        """
+        Stops the background flush and flushes all queued attributes.
+
+        If the final flush raises, the attributes are kept, and calling `close` again retries it.
+        """
+        if not self._closed:
+            self._closed = True
+            self._flush_requested.set()
+            self._flush_thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        with self._queue_lock:
+            batch_size = min(self.max_batch_size, len(self._queue))
+            return [self._queue.popleft() for _ in range(batch_size)]
+
+    def _replay_spool(self, spool: TulipMachineEventSpool) -> Tuple[int, bool]:
+        requests_made = 0
+        while requests_made < self.replay_requests_per_flush:
+            attributes, position = spool.read(self.max_batch_size)
+            if position is None:
+                break
+            if len(attributes) > 0:
+                try:
+                    self._send_batch(attributes)
+                    requests_made += 1
+                except Exception as e:
+                    if is_retryable(e):
+                        return requests_made, False
+                    print(
+                        f"Dropping spooled machine attributes that were rejected\n{e}"
+                    )
+            spool.acknowledge(position)
+        return requests_made, True
+
+    def _send_batch(self, batch: List[Dict[str, Any]]):
+        self.tulip_api.make_request_expect_nothing(
+            TulipMachineReporter.attributes_report_path,
+            "POST",
+            json={"attributes": batch},
+        )
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"There was an issue reporting machine attributes\n{e}")
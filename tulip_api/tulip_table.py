@@ -1,5 +1,22 @@
 import json
-from typing import Any, Dict, Generator, Iterable, List, Union
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import uuid4
 
 from tulip_api.exceptions import (
@@ -8,6 +25,27 @@ from tulip_api.exceptions import (
     TulipApiTableRecordCreateMustIncludeID,
 )
 from tulip_api.tulip_api import TulipAPI
+from tulip_api.tulip_table_columns import TulipTableColumnBuilder
+from tulip_api.tulip_table_dead_letter import (
+    DeadLetters,
+    TulipTableDeadLetter,
+    TulipTableDeadLetterSink,
+    read_dead_letters,
+)
+from tulip_api.tulip_table_export import TulipTableExportWriter
+from tulip_api.tulip_table_progress import ProgressReporting, TulipTableProgress
+from tulip_api.tulip_table_record import TulipTableRecord
+from tulip_api.tulip_table_watermark import TulipTableWatchInterval, TulipTableWatermark
+
+if TYPE_CHECKING:
+    from tulip_api.asyncio.tulip_table import TulipTable as AsyncTulipTable
+
+
+# The order of a `watch`: records updated at the same time are ordered by `id`, so pages are stable.
+_WATCH_SORT_OPTIONS = [
+    {"sortBy": "_updatedAt", "sortDir": "asc"},
+    {"sortBy": "id", "sortDir": "asc"},
+]
 
 
 class TulipTable:
@@ -27,6 +65,18 @@ class TulipTable:
         """
         return self.tulip_api.make_request(self._construct_base_path(), "GET")
 
+    def record_type(
+        self, columns: Optional[List[str]] = None
+    ) -> Type[TulipTableRecord]:
+        """
+        Returns a `TulipTableRecord` type for this table's schema, whose views convert fields lazily on first access.
+
+        `columns`: only convert these columns. Defaults to every column in the schema.
+        """
+        return TulipTableRecord.record_type(
+            self.get_details()["columns"], columns=columns
+        )
+
     def update_table(
         self,
         label: Union[str, None] = None,
@@ -81,12 +131,22 @@ class TulipTable:
         sort_by: str = "_updatedAt",
         sort_asc: bool = False,
         filter_aggregator: str = "all",
+        columns: Union[List[str], None] = None,
+        sort_options: Union[List[Dict], None] = None,
     ):
         """
         GET `/tables/{tableId}/records`
 
         Get a list of table records.
 
+        `columns`: only keep these columns of each record, including `id` only if it is listed.
+        The full records are decoded, but are discarded as soon as the page is projected.
+
+        `sort_options`: sort by several columns, for example to break ties. Replaces `sort_by` and `sort_asc`.
+        ```
+        [{"sortBy": "_updatedAt", "sortDir": "asc"}, {"sortBy": "id", "sortDir": "asc"}]
+        ```
+
         `filters`: A list of filters
         ```
         {
@@ -103,12 +163,18 @@ class TulipTable:
             "filterAggregator": filter_aggregator,
             "sortDir": "asc" if sort_asc else "desc",
         }
+        if sort_options is not None:
+            del params["sortBy"], params["sortDir"]
+            params["sortOptions"] = json.dumps(sort_options)
         for index, filter in enumerate(filters):
             for key, value in filter.items():
                 params[f"filters.{index}.{key}"] = value
-        return self.tulip_api.make_request(
+        records = self.tulip_api.make_request(
             self._construct_records_path(), "GET", params=params
         )
+        if columns is None:
+            return records
+        return TulipTable._project(records, columns)
 
     def stream_records(
         self,
@@ -118,51 +184,389 @@ class TulipTable:
         filter_aggregator: str = "all",
         chunk_size: int = 100,
         limit: Union[int, None] = None,
+        columns: Union[List[str], None] = None,
+        progress: ProgressReporting = None,
     ) -> Generator[dict, None, None]:
         """
         Returns a Generator that will pull all (or up to a limit) records from a Tulip Table.
 
         `chunk_size`: Must be between 1 and 100
+
+        `columns`: only keep these columns of each record. See `get_records`.
+
+        `progress`: True to report the progress on the console, or a callback or `TulipTableProgressReporter`
+        that receives the `TulipTableProgress`. The ETA is based on the table's record count.
         """
         if chunk_size < 1 or chunk_size > 100:
             raise TulipAPIInvalidChunkSize(chunk_size)
-        offset = 0
-        index = 0
+        for records in self._stream_pages(
+            limit,
+            chunk_size,
+            filters=filters,
+            sort_by=sort_by,
+            sort_asc=sort_asc,
+            filter_aggregator=filter_aggregator,
+            columns=columns,
+            progress=progress,
+        ):
+            yield from records
+
+    def stream_record_batches(
+        self,
+        filters: List = [],
+        sort_by: str = "_updatedAt",
+        sort_asc: bool = False,
+        filter_aggregator: str = "all",
+        chunk_size: int = 100,
+        limit: Union[int, None] = None,
+        columns: Union[List[str], None] = None,
+        batch_size: Union[int, None] = None,
+        progress: ProgressReporting = None,
+    ) -> Generator[List[dict], None, None]:
+        """
+        Returns a Generator that will pull all (or up to a limit) records from a Tulip Table, as lists of records.
+
+        Works like `stream_records`, without the overhead of yielding each record, for consumers that work in bulk.
+
+        `chunk_size`: Must be between 1 and 100
+
+        `batch_size`: the # of records in each list, only the last list may be shorter. Defaults to yielding each page as it is fetched.
+
+        `progress`: reports the progress. See `stream_records`.
+        """
+        if chunk_size < 1 or chunk_size > 100:
+            raise TulipAPIInvalidChunkSize(chunk_size)
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1. {batch_size} is invalid.")
+        pages = self._stream_pages(
+            limit,
+            chunk_size,
+            filters=filters,
+            sort_by=sort_by,
+            sort_asc=sort_asc,
+            filter_aggregator=filter_aggregator,
+            columns=columns,
+            progress=progress,
+        )
+        if batch_size is None:
+            yield from pages
+            return
+        batch: List[dict] = []
+        for records in pages:
+            batch += records
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                batch = batch[batch_size:]
+        if len(batch) > 0:
+            yield batch
+
+    def watch(
+        self,
+        watermark: Union[str, TulipTableWatermark, None] = None,
+        filters: List = [],
+        filter_aggregator: str = "all",
+        chunk_size: int = 100,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Generator[dict, None, None]:
+        """
+        Returns a Generator that yields records as they are created or updated, in `_updatedAt` order. It never ends.
+
+        Each poll only requests records at or after the watermark, the latest `_updatedAt` seen, ordered by `_updatedAt` then `id`.
+        The poll interval drops to `min_interval` while changes are flowing, and doubles after each idle poll up to `max_interval`.
+
+        `watermark`: a file path or `TulipTableWatermark` to save the position to after every page,
+        so a restarted watch resumes where it left off. A new watermark starts by yielding every existing record.
+        Records are yielded at least once: records of a page that wasn't finished before a restart are yielded again.
+
+        `filters`: only watch records matching these filters. Joined to the watermark filter using `filter_aggregator`,
+        so `any` isn't supported.
+
+        `chunk_size`: Must be between 1 and 100
+        """
+        if chunk_size < 1 or chunk_size > 100:
+            raise TulipAPIInvalidChunkSize(chunk_size)
+        if filter_aggregator != "all":
+            raise ValueError("watch only supports the `all` filter_aggregator.")
+        if not isinstance(watermark, TulipTableWatermark):
+            watermark = TulipTableWatermark(path=watermark)
+        interval = TulipTableWatchInterval(min_interval, max_interval)
         while True:
-            records = self.get_records(
-                limit=chunk_size,
-                offset=offset,
+            changes = 0
+            offset = 0
+            # The last record yielded, expected at `offset` after re-querying from the advanced watermark.
+            last_record = None
+            while True:
+                updated_at = watermark.updated_at
+                records = self.get_records(
+                    limit=chunk_size,
+                    offset=offset,
+                    filters=filters + watermark.filters(),
+                    filter_aggregator=filter_aggregator,
+                    sort_options=_WATCH_SORT_OPTIONS,
+                )
+                if last_record is not None and (
+                    len(records) == 0 or records[0]["id"] != last_record["id"]
+                ):
+                    # A record seen at the watermark was updated since, shifting the rest: re-read from the watermark.
+                    offset = 0
+                    last_record = None
+                    continue
+                new_records = [record for record in records if watermark.is_new(record)]
+                for record in new_records:
+                    watermark.advance(record)
+                    changes += 1
+                    yield record
+                if len(new_records) > 0:
+                    watermark.save()
+                if len(records) < chunk_size:
+                    break
+                if len(new_records) > 0:
+                    # Ties are ordered by `id`, so the records seen at the watermark come first.
+                    # Re-query from the advanced watermark, skipping past all but the last of them.
+                    last_record = new_records[-1]
+                    index = records.index(last_record)
+                    if last_record["_updatedAt"] == updated_at:
+                        offset += index
+                    else:
+                        offset = index - next(
+                            i
+                            for i, record in enumerate(records)
+                            if record["_updatedAt"] == last_record["_updatedAt"]
+                        )
+                else:
+                    last_record = None
+                    offset += chunk_size
+            time.sleep(interval.next_interval(changes))
+
+    def export_records(
+        self,
+        file: Union[str, BinaryIO],
+        file_format: str = "csv",
+        compress: bool = False,
+        filters: List = [],
+        sort_by: str = "_createdAt",
+        sort_asc: bool = True,
+        filter_aggregator: str = "all",
+        chunk_size: int = 100,
+        concurrency: int = 8,
+    ) -> int:
+        """
+        Exports all records from a Tulip Table to a file. Returns the # of exported records.
+
+        Column order and types are taken from the table's schema (`get_details`).
+        Up to `concurrency` pages are fetched at a time, and each page is written as it arrives in order,
+        so memory use doesn't grow with the size of the table.
+
+        `file`: a path, or a binary file object.
+
+        `file_format`: one of `csv`, `ndjson` or `parquet`. Parquet requires `pyarrow`.
+
+        `compress`: gzip the `csv` or `ndjson` output.
+
+        `chunk_size`: Must be between 1 and 100
+        """
+        if chunk_size < 1 or chunk_size > 100:
+            raise TulipAPIInvalidChunkSize(chunk_size)
+        columns = self.get_details()["columns"]
+        with TulipTableExportWriter.open(
+            file,
+            columns,
+            file_format=file_format,
+            compress=compress,
+            serializer=self.tulip_api.serializer,
+        ) as writer:
+            for records in self._stream_pages_concurrently(
+                concurrency,
+                chunk_size,
                 filters=filters,
                 sort_by=sort_by,
                 sort_asc=sort_asc,
                 filter_aggregator=filter_aggregator,
-            )
-            if len(records) == 0:
-                break
-
-            for record in self._stream_records_helper(records, limit, index):
-                index += 1
-                yield record
+            ):
+                writer.write_records(records)
+        return writer.records_written
 
+    def _stream_pages(
+        self,
+        limit: Union[int, None],
+        chunk_size: int,
+        progress: ProgressReporting = None,
+        **query,
+    ) -> Generator[List[dict], None, None]:
+        """
+        Yields non-empty pages in order, cut off after exactly `limit` records.
+        Pages are fetched on the background event loop if bulk calls are enabled.
+        """
+        if limit is not None and limit <= 0:
+            return
+        bulk_table = self._bulk_table()
+        tracker = None
+        if progress is not None:
+            total = self.get_record_count(
+                query.get("filters", []), query.get("filter_aggregator", "all")
+            )
+            tracker = TulipTableProgress.track(
+                progress,
+                "stream_records",
+                total if limit is None else min(total, limit),
+                None if bulk_table is None else self._bulk_in_flight,
+            )
+        pages = (
+            self.tulip_api.event_loop().stream_pages(
+                bulk_table, self.tulip_api.bulk_concurrency, chunk_size, **query
+            )
+            if bulk_table is not None
+            else self._stream_pages_sequentially(chunk_size, **query)
+        )
+        try:
+            remaining = limit
+            for records in pages:
+                if remaining is not None:
+                    records = records[:remaining]
+                    remaining -= len(records)
+                if tracker is not None:
+                    tracker.advance(completed=len(records))
+                if len(records) > 0:
+                    yield records
+                if remaining == 0:
+                    return
+        finally:
+            pages.close()
+            if tracker is not None:
+                tracker.finish()
+
+    def _stream_pages_sequentially(
+        self, chunk_size: int, **query
+    ) -> Generator[List[dict], None, None]:
+        offset = 0
+        while True:
+            records = self.get_records(limit=chunk_size, offset=offset, **query)
+            yield records
+            if len(records) < chunk_size:
+                return
             offset += chunk_size
 
-            if index < offset:
-                break
+    def _stream_pages_concurrently(
+        self, concurrency: int, chunk_size: int, **query
+    ) -> Generator[List[dict], None, None]:
+        """
+        Yields pages in order, keeping up to `concurrency` `get_records` requests in flight.
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            offset = 0
+            pending: Deque[Future] = deque()
+            for _ in range(concurrency):
+                pending.append(
+                    executor.submit(
+                        self.get_records, limit=chunk_size, offset=offset, **query
+                    )
+                )
+                offset += chunk_size
+
+            while len(pending) > 0:
+                records = pending.popleft().result()
+                if len(records) > 0:
+                    yield records
+                if len(records) < chunk_size:
+                    for future in pending:
+                        future.cancel()
+                    return
+                pending.append(
+                    executor.submit(
+                        self.get_records, limit=chunk_size, offset=offset, **query
+                    )
+                )
+                offset += chunk_size
 
     @staticmethod
-    def _stream_records_helper(
-        records: List, limit: Union[int, None], index
-    ) -> Iterable:
-        if limit is None:
-            for record in records:
-                yield record
-            return
+    def _project(records: List[dict], columns: List[str]) -> List[dict]:
+        return [
+            {column: record[column] for column in columns if column in record}
+            for record in records
+        ]
+
+    def get_record_count(
+        self, filters: List = [], filter_aggregator: str = "all"
+    ) -> int:
+        """
+        GET `/tables/{tableId}/count`
 
-        for record in records:
-            if index > limit:
-                return
-            index += 1
-            yield record
+        Returns the # of records in a Tulip Table that match the given filters.
+        """
+        params = {"filterAggregator": filter_aggregator}
+        for index, filter in enumerate(filters):
+            for key, value in filter.items():
+                params[f"filters.{index}.{key}"] = value
+        return self.tulip_api.make_request(
+            self._construct_count_path(), "GET", params=params
+        )["count"]
+
+    def to_columns(
+        self,
+        columns: Union[List[str], None] = None,
+        filters: List = [],
+        sort_by: str = "_createdAt",
+        sort_asc: bool = True,
+        filter_aggregator: str = "all",
+        concurrency: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Returns a dict of column name to typed NumPy array with all (filtered) records of a Tulip Table. Requires `numpy`.
+
+        Column buffers are preallocated using the table schema and record count, and filled page by page as records stream in,
+        so records are never all held as dicts at once. See `TulipTableColumnBuilder` for the dtype of each column type.
+
+        `columns`: the column names to return. Defaults to every column in the schema.
+        """
+        return self._build_columns(
+            columns, filters, sort_by, sort_asc, filter_aggregator, concurrency
+        ).to_columns()
+
+    def to_dataframe(
+        self,
+        columns: Union[List[str], None] = None,
+        filters: List = [],
+        sort_by: str = "_createdAt",
+        sort_asc: bool = True,
+        filter_aggregator: str = "all",
+        concurrency: int = 8,
+    ):
+        """
+        Returns a typed pandas DataFrame with all (filtered) records of a Tulip Table. Requires `numpy` and `pandas`.
+
+        Works like `to_columns`. `integer` and `boolean` columns use pandas' nullable `Int64` and `boolean` dtypes.
+        """
+        return self._build_columns(
+            columns, filters, sort_by, sort_asc, filter_aggregator, concurrency
+        ).to_dataframe()
+
+    def _build_columns(
+        self,
+        columns: Union[List[str], None],
+        filters: List,
+        sort_by: str,
+        sort_asc: bool,
+        filter_aggregator: str,
+        concurrency: int,
+    ) -> TulipTableColumnBuilder:
+        builder = TulipTableColumnBuilder(
+            self.get_details()["columns"],
+            columns=columns,
+            capacity=self.get_record_count(
+                filters=filters, filter_aggregator=filter_aggregator
+            ),
+        )
+        for records in self._stream_pages_concurrently(
+            concurrency,
+            100,
+            filters=filters,
+            sort_by=sort_by,
+            sort_asc=sort_asc,
+            filter_aggregator=filter_aggregator,
+        ):
+            builder.add_records(records)
+        return builder
 
     def get_record(self, record_id: str):
         """
@@ -210,7 +614,12 @@ class TulipTable:
         )
 
     def create_records(
-        self, records: Iterable[dict], create_random_id=False, warn_on_failure=False
+        self,
+        records: Iterable[dict],
+        create_random_id=False,
+        warn_on_failure=False,
+        dead_letters: DeadLetters = None,
+        progress: ProgressReporting = None,
     ) -> int:
         """
         Iterates over a list of records and creates them. Calling `create_record`
@@ -220,22 +629,21 @@ class TulipTable:
         `warn_on_failure`: set to True if you want to continue with creating the rest of the records
         , despite a malformed request.
 
-        """
-        created_records = 0
-        failed_records = 0
-        for record in records:
-            try:
-                self.create_record(record, create_random_id=create_random_id)
-                created_records += 1
-            except TulipAPIMalformedRequestError as exception:
-                failed_records += 1
-                print(f"There was an issue creating the record:\n{json.dumps(record)}")
-                if not warn_on_failure:
-                    raise exception
-        if warn_on_failure and failed_records > 0:
-            print(f"Failed to create {failed_records} records.")
+        `dead_letters`: a file path, callback or `TulipTableDeadLetterSink` that receives each record that failed,
+        with the response's status code and body. Failed records don't stop the call. See `retry_dead_letters`.
 
-        return created_records
+        `progress`: True to report the progress on the console, or a callback or `TulipTableProgressReporter`
+        that receives the `TulipTableProgress`. The ETA is known if `records` has a length.
+        """
+        return self._run_record_requests(
+            (("create", record) for record in records),
+            "create",
+            warn_on_failure,
+            dead_letters,
+            create_random_id=create_random_id,
+            progress=progress,
+            total=len(records) if isinstance(records, Sized) else None,
+        )
 
     def update_record(self, record_id: str, record: dict = {}):
         """
@@ -247,6 +655,209 @@ class TulipTable:
             self._construct_record_path(record_id), "PUT", json=record
         )
 
+    def update_records(
+        self,
+        records: Iterable[dict],
+        warn_on_failure=False,
+        dead_letters: DeadLetters = None,
+        progress: ProgressReporting = None,
+    ) -> int:
+        """
+        Iterates over a list of records and updates them. Calling `update_record` with each record's `id`.
+
+        Returns the # of successfully updated records.
+
+        `warn_on_failure`: set to True if you want to continue with updating the rest of the records
+        , despite a malformed request.
+
+        `dead_letters`: receives each record that failed. See `create_records`.
+
+        `progress`: reports the progress. See `create_records`.
+        """
+        return self._run_record_requests(
+            (("update", record) for record in records),
+            "update",
+            warn_on_failure,
+            dead_letters,
+            progress=progress,
+            total=len(records) if isinstance(records, Sized) else None,
+        )
+
+    def retry_dead_letters(
+        self,
+        dead_letters: Union[str, Iterable[TulipTableDeadLetter]],
+        warn_on_failure=True,
+        failed_dead_letters: DeadLetters = None,
+        progress: ProgressReporting = None,
+        concurrency: int = 8,
+    ) -> int:
+        """
+        Re-submits the creates and updates of dead letters concurrently, for example from the NDJSON file of a failed upload.
+        Dead letters of other tables are skipped. Runs on the background event loop if bulk calls are enabled.
+
+        Returns the # of successfully re-submitted records.
+
+        `failed_dead_letters`: receives each record that failed again. Must not be the file being retried.
+
+        `progress`: reports the progress. See `create_records`.
+
+        `concurrency`: the # of requests in flight, from a thread pool. Bulk calls use the `bulk_concurrency` instead.
+        """
+        if isinstance(dead_letters, str) and failed_dead_letters == dead_letters:
+            raise ValueError("failed_dead_letters must not be the file being retried.")
+        return self._run_record_requests(
+            (
+                (dead_letter.operation, dead_letter.record)
+                for dead_letter in read_dead_letters(dead_letters)
+                if dead_letter.table_id == self.table_id
+            ),
+            "retry",
+            warn_on_failure,
+            failed_dead_letters,
+            progress=progress,
+            concurrency=concurrency,
+        )
+
+    def _run_record_requests(
+        self,
+        requests: Iterable[Tuple[str, dict]],
+        operation: str,
+        warn_on_failure: bool,
+        dead_letters: DeadLetters,
+        create_random_id: bool = False,
+        progress: Union[ProgressReporting, TulipTableProgress] = None,
+        total: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> int:
+        """
+        Runs the `(operation, record)` requests, up to `concurrency` at a time.
+        `requests` is read, and results are handled in order, on the calling thread.
+
+        With bulk calls, `requests` is still read on the calling thread, and fed to the asyncio client
+        on the background event loop, which runs up to `bulk_concurrency` requests at a time.
+
+        Returns the # of successful requests.
+        """
+        bulk_table = self._bulk_table()
+        if bulk_table is not None:
+            return self.tulip_api.event_loop().run_consumer(
+                lambda bulk_requests: bulk_table._run_record_requests(
+                    bulk_requests,
+                    operation,
+                    warn_on_failure,
+                    dead_letters,
+                    create_random_id=create_random_id,
+                    progress=progress,
+                    total=total,
+                ),
+                requests,
+            )
+        succeeded = 0
+        failed = 0
+        sink = (
+            None
+            if dead_letters is None
+            else TulipTableDeadLetterSink.open(dead_letters)
+        )
+        tracker = TulipTableProgress.track(progress, f"{operation}_records", total)
+        # Without a sink, only malformed requests are tolerated.
+        tolerated = TulipAPIMalformedRequestError if sink is None else Exception
+        try:
+            for request_operation, record, exception in self._send_record_requests(
+                requests, create_random_id, concurrency
+            ):
+                if exception is None:
+                    succeeded += 1
+                    if tracker is not None:
+                        tracker.advance(completed=1)
+                elif not isinstance(exception, tolerated):
+                    raise exception
+                else:
+                    failed += 1
+                    if tracker is not None:
+                        tracker.advance(failed=1)
+                    if sink is not None:
+                        sink.write(
+                            TulipTableDeadLetter.from_exception(
+                                self.table_id, request_operation, record, exception
+                            )
+                        )
+                        continue
+                    print(
+                        f"There was an issue {request_operation[:-1]}ing the record:\n{json.dumps(record)}"
+                    )
+                    if not warn_on_failure:
+                        raise exception
+        finally:
+            if sink is not None and sink is not dead_letters:
+                sink.close()
+            if tracker is not None and tracker is not progress:
+                tracker.finish()
+        if (warn_on_failure or sink is not None) and failed > 0:
+            print(f"Failed to {operation} {failed} records.")
+
+        return succeeded
+
+    def _send_record_requests(
+        self,
+        requests: Iterable[Tuple[str, dict]],
+        create_random_id: bool,
+        concurrency: int,
+    ) -> Generator[Tuple[str, dict, Optional[Exception]], None, None]:
+        """
+        Sends the `(operation, record)` requests, keeping up to `concurrency` in flight.
+        Yields each request in order, with the exception it raised, or None.
+        """
+        if concurrency <= 1:
+            for request_operation, record in requests:
+                yield request_operation, record, self._send_record_request(
+                    request_operation, record, create_random_id
+                )
+            return
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending: Deque[Tuple[str, dict, Future]] = deque()
+            try:
+                for request_operation, record in requests:
+                    pending.append(
+                        (
+                            request_operation,
+                            record,
+                            executor.submit(
+                                self._send_record_request,
+                                request_operation,
+                                record,
+                                create_random_id,
+                            ),
+                        )
+                    )
+                    if len(pending) >= concurrency:
+                        request_operation, record, future = pending.popleft()
+                        yield request_operation, record, future.result()
+                while len(pending) > 0:
+                    request_operation, record, future = pending.popleft()
+                    yield request_operation, record, future.result()
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+
+    def _send_record_request(
+        self, request_operation: str, record: dict, create_random_id: bool
+    ) -> Optional[Exception]:
+        """
+        Sends a create or update request. Returns the exception it raised, or None.
+        """
+        try:
+            if request_operation == "create":
+                self.create_record(record, create_random_id=create_random_id)
+            else:
+                self.update_record(
+                    record["id"],
+                    {key: value for key, value in record.items() if key != "id"},
+                )
+        except Exception as exception:
+            return exception
+        return None
+
     def delete_record(self, record_id: str):
         """
         DELETE `/tables/{tableId}/records/{recordId}`
@@ -298,12 +909,28 @@ class TulipTable:
             return default
         return value
 
+    def _bulk_table(self) -> Union["AsyncTulipTable", None]:
+        """
+        Returns this table on the TulipAPI's background event loop, if bulk calls are enabled. See `TulipAPI.bulk_concurrency`.
+        """
+        if self.tulip_api.bulk_concurrency is None:
+            return None
+        from tulip_api.asyncio.tulip_table import TulipTable as AsyncTulipTable
+
+        return AsyncTulipTable(self.tulip_api.event_loop().tulip_api, self.table_id)
+
+    def _bulk_in_flight(self) -> int:
+        return self.tulip_api.event_loop().tulip_api.scheduler.in_flight
+
     def _construct_base_path(self):
         return f"tables/{self.table_id}"
 
     def _construct_records_path(self):
         return f"{self._construct_base_path()}/records"
 
+    def _construct_count_path(self):
+        return f"{self._construct_base_path()}/count"
+
     def _construct_record_path(self, record_id: str):
         return f"{self._construct_records_path()}/{record_id}"
 
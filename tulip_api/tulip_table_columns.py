@@ -0,0 +1,170 @@
+from typing import Any, Dict, List, Optional
+
+from tulip_api.exceptions import TulipAPIOptionalDependencyMissing
+
+
+class TulipTableColumnBuilder:
+    """
+    Builds typed NumPy column arrays from pages of Tulip Table records. Requires `numpy`.
+
+    Column buffers are preallocated from the table schema and an expected row count, and are filled one page at a time,
+    so the records of a page can be released as soon as the page has been added.
+
+    Column types map to NumPy dtypes as follows:
+
+    - `integer`: `int64`
+    - `float`: `float64`, nulls are NaN
+    - `boolean`: `bool`
+    - `timestamp`: `datetime64[ms]` in UTC, nulls are NaT
+    - anything else: `object`
+
+    `integer` and `boolean` columns that contain nulls are returned as `numpy.ma.MaskedArray`s.
+    """
+
+    def __init__(
+        self,
+        table_columns: List[Dict],
+        columns: Optional[List[str]] = None,
+        capacity: int = 0,
+    ):
+        """
+        table_columns: the `columns` of the table's `get_details` schema.
+        columns: the column names to build, in order. Defaults to every column in the schema.
+        capacity: the expected # of rows. Buffers grow if more rows are added.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("numpy", "dataframe")
+        self._numpy = numpy
+
+        column_types = {
+            column["name"]: column["dataType"]["type"] for column in table_columns
+        }
+        column_types.setdefault("id", "string")
+        column_types.setdefault("_createdAt", "timestamp")
+        column_types.setdefault("_updatedAt", "timestamp")
+        self.columns = columns if columns is not None else list(column_types)
+        self.column_types = {
+            name: column_types.get(name, "string") for name in self.columns
+        }
+
+        self.rows = 0
+        self._capacity = max(capacity, 0)
+        self._values = {
+            name: numpy.empty(self._capacity, dtype=self._dtype(column_type))
+            for name, column_type in self.column_types.items()
+        }
+        self._masks = {
+            name: numpy.zeros(self._capacity, dtype=bool)
+            for name, column_type in self.column_types.items()
+            if column_type in {"integer", "boolean"}
+        }
+
+    def add_records(self, records: List[Dict[str, Any]]):
+        """
+        Converts a page of records and copies it into the column buffers.
+        """
+        if len(records) == 0:
+            return
+        start = self.rows
+        end = start + len(records)
+        if end > self._capacity:
+            self._grow(max(end, self._capacity * 2))
+
+        for name, column_type in self.column_types.items():
+            values = [record.get(name) for record in records]
+            self._values[name][start:end] = self._convert(values, column_type)
+            if name in self._masks:
+                self._masks[name][start:end] = [value is None for value in values]
+        self.rows = end
+
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Returns a dict of column name to NumPy array, trimmed to the # of rows added.
+        """
+        numpy = self._numpy
+        columns = {}
+        for name in self.columns:
+            values = self._values[name][: self.rows]
+            mask = self._masks.get(name)
+            if mask is not None and mask[: self.rows].any():
+                values = numpy.ma.MaskedArray(values, mask=mask[: self.rows])
+            columns[name] = values
+        return columns
+
+    def to_dataframe(self):
+        """
+        Returns a pandas DataFrame. Requires `pandas`.
+
+        `integer` and `boolean` columns use pandas' nullable `Int64` and `boolean` dtypes.
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("pandas", "dataframe")
+
+        data = {}
+        for name in self.columns:
+            values = self._values[name][: self.rows]
+            column_type = self.column_types[name]
+            if column_type == "integer":
+                data[name] = pandas.arrays.IntegerArray(
+                    values, self._masks[name][: self.rows]
+                )
+            elif column_type == "boolean":
+                data[name] = pandas.arrays.BooleanArray(
+                    values, self._masks[name][: self.rows]
+                )
+            else:
+                data[name] = values
+        return pandas.DataFrame(data, columns=self.columns, copy=False)
+
+    def _grow(self, capacity: int):
+        numpy = self._numpy
+        for buffers in (self._values, self._masks):
+            for name, buffer in buffers.items():
+                grown = numpy.zeros(capacity, dtype=buffer.dtype)
+                grown[: self.rows] = buffer[: self.rows]
+                buffers[name] = grown
+        self._capacity = capacity
+
+    def _dtype(self, column_type: str):
+        if column_type == "integer":
+            return "int64"
+        if column_type == "float":
+            return "float64"
+        if column_type == "boolean":
+            return "bool"
+        if column_type == "timestamp":
+            return "datetime64[ms]"
+        return "object"
+
+    def _convert(self, values: List[Any], column_type: str):
+        numpy = self._numpy
+        if column_type == "integer":
+            return numpy.array(
+                [0 if value is None else value for value in values], dtype="int64"
+            )
+        if column_type == "float":
+            return numpy.array(
+                [numpy.nan if value is None else value for value in values],
+                dtype="float64",
+            )
+        if column_type == "boolean":
+            return numpy.array(
+                [False if value is None else value for value in values], dtype="bool"
+            )
+        if column_type == "timestamp":
+            # NumPy parses ISO 8601 timestamps, but not the trailing `Z` UTC designator.
+            return numpy.array(
+                [
+                    "NaT" if not value else value[:-1] if value[-1] == "Z" else value
+                    for value in values
+                ],
+                dtype="datetime64[ms]",
+            )
+        converted = numpy.empty(len(values), dtype="object")
+        for index, value in enumerate(values):
+            converted[index] = value
+        return converted
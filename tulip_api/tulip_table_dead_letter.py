@@ -0,0 +1,163 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+
+class TulipTableDeadLetter:
+    """
+    A record that a bulk call failed to create or update, with the error the request failed with.
+
+    `status_code` and `response_body` are None if no response was received, for example after a connection error.
+    """
+
+    def __init__(
+        self,
+        table_id: str,
+        operation: str,
+        record: Dict[str, Any],
+        error: str,
+        status_code: Optional[int] = None,
+        response_body: Optional[str] = None,
+        failed_at: Optional[float] = None,
+    ):
+        self.table_id = table_id
+        self.operation = operation
+        self.record = record
+        self.error = error
+        self.status_code = status_code
+        self.response_body = response_body
+        self.failed_at = failed_at if failed_at is not None else time.time()
+
+    @staticmethod
+    def from_exception(
+        table_id: str, operation: str, record: Dict[str, Any], exception: Exception
+    ) -> "TulipTableDeadLetter":
+        response_body = getattr(exception, "response_body", None)
+        return TulipTableDeadLetter(
+            table_id,
+            operation,
+            record,
+            getattr(exception, "message", None) or str(exception),
+            status_code=getattr(exception, "status_code", None),
+            response_body=(
+                response_body.decode("utf-8", errors="replace")
+                if isinstance(response_body, bytes)
+                else response_body
+            ),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "table_id": self.table_id,
+            "operation": self.operation,
+            "record": self.record,
+            "error": self.error,
+            "status_code": self.status_code,
+            "response_body": self.response_body,
+            "failed_at": self.failed_at,
+        }
+
+    @staticmethod
+    def from_dict(value: Dict[str, Any]) -> "TulipTableDeadLetter":
+        return TulipTableDeadLetter(**value)
+
+    def __repr__(self):
+        return f"TulipTableDeadLetter(table_id={self.table_id!r}, operation={self.operation!r}, status_code={self.status_code!r}, record={self.record!r})"
+
+
+# Where bulk calls send their dead letters: a file path, a callback, or a sink. None raises on failure instead.
+DeadLetters = Optional[
+    Union[str, Callable[[TulipTableDeadLetter], Any], "TulipTableDeadLetterSink"]
+]
+
+
+class TulipTableDeadLetterSink(ABC):
+    """
+    Receives the dead letters of bulk `create_records` and `update_records` calls.
+
+    Subclass it and implement `write` to send dead letters elsewhere.
+    Use `TulipTableDeadLetterSink.open` to create the sink for a file path or callback.
+    """
+
+    @abstractmethod
+    def write(self, dead_letter: TulipTableDeadLetter):
+        """
+        Records the dead letter of a record that failed.
+        """
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def open(dead_letters: DeadLetters) -> "TulipTableDeadLetterSink":
+        """
+        `dead_letters`: a file path to append NDJSON dead letters to, a callback, or a sink.
+        """
+        if isinstance(dead_letters, TulipTableDeadLetterSink):
+            return dead_letters
+        if isinstance(dead_letters, str):
+            return NDJSONDeadLetterSink(dead_letters)
+        if callable(dead_letters):
+            return CallbackDeadLetterSink(dead_letters)
+        raise ValueError(
+            "dead_letters must be a file path, a callback or a TulipTableDeadLetterSink."
+        )
+
+
+class NDJSONDeadLetterSink(TulipTableDeadLetterSink):
+    """
+    Appends each dead letter to a file as a line of JSON. Read them back with `read_dead_letters`.
+
+    Each line is flushed as it is written, so dead letters survive a crash of the upload.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def write(self, dead_letter: TulipTableDeadLetter):
+        line = json.dumps(dead_letter.to_dict(), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                # Only created once a record fails, so uploads without failures leave no file behind.
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class CallbackDeadLetterSink(TulipTableDeadLetterSink):
+    """
+    Calls `callback` with each dead letter.
+
+    With a `TulipAPI` given a `bulk_concurrency`, the callback runs on the background event loop's thread.
+    """
+
+    def __init__(self, callback: Callable[[TulipTableDeadLetter], Any]):
+        self.callback = callback
+
+    def write(self, dead_letter: TulipTableDeadLetter):
+        self.callback(dead_letter)
+
+
+def read_dead_letters(
+    dead_letters: Union[str, Iterable[TulipTableDeadLetter]],
+) -> Iterator[TulipTableDeadLetter]:
+    """
+    Yields the dead letters of an NDJSON dead letter file, or of an iterable of dead letters.
+    """
+    if not isinstance(dead_letters, str):
+        yield from dead_letters
+        return
+    with open(dead_letters, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield TulipTableDeadLetter.from_dict(json.loads(line))
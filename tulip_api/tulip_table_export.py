@@ -0,0 +1,244 @@
+import gzip
+import io
+import json
+from abc import ABC, abstractmethod
+from csv import writer as csv_writer
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+from tulip_api.exceptions import TulipAPIOptionalDependencyMissing
+from tulip_api.serializers import JSONSerializer, default_serializer
+
+
+class TulipTableExportWriter(ABC):
+    """
+    Streams Tulip Table records to a file, one page at a time.
+
+    Columns (and their order) come from the table's `get_details` schema, not from the records,
+    so columns missing from some records are still exported.
+    Use `TulipTableExportWriter.open` to create the writer for a file format.
+    """
+
+    file_formats = {"csv", "ndjson", "parquet"}
+
+    # Record fields that are always present, but may not be listed in the table's columns.
+    system_columns = [
+        {"name": "id", "dataType": {"type": "string"}},
+        {"name": "_createdAt", "dataType": {"type": "timestamp"}},
+        {"name": "_updatedAt", "dataType": {"type": "timestamp"}},
+    ]
+
+    def __init__(self, file: Union[str, BinaryIO], columns: List[Dict]):
+        self.columns = TulipTableExportWriter._with_system_columns(columns)
+        self.column_names = [column["name"] for column in self.columns]
+        self.records_written = 0
+        self._owns_file = isinstance(file, str)
+        self._file: BinaryIO = open(file, "wb") if isinstance(file, str) else file
+
+    @staticmethod
+    def open(
+        file: Union[str, BinaryIO],
+        columns: List[Dict],
+        file_format: str = "csv",
+        compress: bool = False,
+        serializer: Optional[JSONSerializer] = None,
+    ) -> "TulipTableExportWriter":
+        """
+        `file_format`: one of `csv`, `ndjson` or `parquet`.
+
+        `compress`: gzip the output. Only supported by `csv` and `ndjson`, Parquet is compressed internally.
+
+        `serializer`: encodes `ndjson` records. Defaults to `default_serializer()`.
+        """
+        if file_format == "csv":
+            return CSVExportWriter(file, columns, compress=compress)
+        if file_format == "ndjson":
+            return NDJSONExportWriter(
+                file, columns, compress=compress, serializer=serializer
+            )
+        if file_format == "parquet":
+            return ParquetExportWriter(file, columns)
+        raise ValueError(
+            f"Unsupported export format: {file_format}. Must be one of {sorted(TulipTableExportWriter.file_formats)}."
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _, __, ___):
+        self.close()
+
+    @abstractmethod
+    def write_records(self, records: List[Dict[str, Any]]):
+        """
+        Writes a page of records, in `column_names` order.
+        """
+
+    def close(self):
+        if self._owns_file:
+            self._file.close()
+
+    @staticmethod
+    def _with_system_columns(columns: List[Dict]) -> List[Dict]:
+        column_names = {column["name"] for column in columns}
+        missing_system_columns = [
+            column
+            for column in TulipTableExportWriter.system_columns
+            if column["name"] not in column_names
+        ]
+        id_columns = [
+            column for column in missing_system_columns if column["name"] == "id"
+        ]
+        timestamp_columns = [
+            column for column in missing_system_columns if column["name"] != "id"
+        ]
+        return id_columns + columns + timestamp_columns
+
+    @staticmethod
+    def _to_text(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return value
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return str(value)
+
+
+class CSVExportWriter(TulipTableExportWriter):
+    def __init__(
+        self, file: Union[str, BinaryIO], columns: List[Dict], compress: bool = False
+    ):
+        super().__init__(file, columns)
+        self._compressed = (
+            gzip.GzipFile(fileobj=self._file, mode="wb") if compress else None
+        )
+        self._text = io.TextIOWrapper(
+            self._compressed or self._file, encoding="utf-8", newline=""
+        )
+        self._writer = csv_writer(self._text)
+        self._writer.writerow(self.column_names)
+
+    def write_records(self, records: List[Dict[str, Any]]):
+        to_text = TulipTableExportWriter._to_text
+        column_names = self.column_names
+        self._writer.writerows(
+            [[to_text(record.get(name)) for name in column_names] for record in records]
+        )
+        self.records_written += len(records)
+
+    def close(self):
+        self._text.flush()
+        self._text.detach()
+        if self._compressed is not None:
+            self._compressed.close()
+        super().close()
+
+
+class NDJSONExportWriter(TulipTableExportWriter):
+    def __init__(
+        self,
+        file: Union[str, BinaryIO],
+        columns: List[Dict],
+        compress: bool = False,
+        serializer: Optional[JSONSerializer] = None,
+    ):
+        super().__init__(file, columns)
+        self.serializer = serializer if serializer is not None else default_serializer()
+        self._compressed = (
+            gzip.GzipFile(fileobj=self._file, mode="wb") if compress else None
+        )
+        self._output: BinaryIO = self._compressed or self._file
+
+    def write_records(self, records: List[Dict[str, Any]]):
+        dumps = self.serializer.dumps
+        self._output.write(b"".join([dumps(record) + b"\n" for record in records]))
+        self.records_written += len(records)
+
+    def close(self):
+        if self._compressed is not None:
+            self._compressed.close()
+        super().close()
+
+
+class ParquetExportWriter(TulipTableExportWriter):
+    """
+    Writes Parquet row groups of `row_group_size` records. Requires `pyarrow`.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, BinaryIO],
+        columns: List[Dict],
+        row_group_size: int = 100000,
+    ):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("pyarrow", "parquet")
+        super().__init__(file, columns)
+        self._pyarrow = pyarrow
+        self.row_group_size = row_group_size
+        self.schema = pyarrow.schema(
+            [
+                (column["name"], self._arrow_type(column["dataType"]["type"]))
+                for column in self.columns
+            ]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(self._file, self.schema)
+        self._buffer: List[Dict[str, Any]] = []
+
+    def write_records(self, records: List[Dict[str, Any]]):
+        self._buffer += records
+        if len(self._buffer) >= self.row_group_size:
+            self._write_row_group()
+
+    def close(self):
+        self._write_row_group()
+        self._writer.close()
+        super().close()
+
+    def _write_row_group(self):
+        if len(self._buffer) == 0:
+            return
+        records, self._buffer = self._buffer, []
+        arrays = [
+            self._arrow_array([record.get(field.name) for record in records], field)
+            for field in self.schema
+        ]
+        self._writer.write_table(
+            self._pyarrow.Table.from_arrays(arrays, schema=self.schema)
+        )
+        self.records_written += len(records)
+
+    def _arrow_type(self, column_type: str):
+        pyarrow = self._pyarrow
+        if column_type == "integer":
+            return pyarrow.int64()
+        if column_type == "float":
+            return pyarrow.float64()
+        if column_type == "boolean":
+            return pyarrow.bool_()
+        if column_type == "timestamp":
+            return pyarrow.timestamp("ms", tz="UTC")
+        return pyarrow.string()
+
+    def _arrow_array(self, values: List[Any], field):
+        pyarrow = self._pyarrow
+        if pyarrow.types.is_timestamp(field.type):
+            return pyarrow.array(values, type=pyarrow.string()).cast(field.type)
+        if pyarrow.types.is_string(field.type):
+            return pyarrow.array(
+                [
+                    (
+                        value
+                        if value is None or isinstance(value, str)
+                        else TulipTableExportWriter._to_text(value)
+                    )
+                    for value in values
+                ],
+                type=field.type,
+            )
+        return pyarrow.array(values, type=field.type)
@@ -0,0 +1,104 @@
+import atexit
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from tulip_api.exceptions import is_retryable
+from tulip_api.tulip_table import TulipTable
+
+
+class TulipTableIncrementBuffer:
+    """
+    Aggregates `increment_record_column` calls in memory and flushes the summed values on an interval.
+
+    Every (record_id, column_id) pair costs one PATCH per flush interval, no matter how many times it was incremented.
+    Pending increments are flushed when the buffer is closed (or the `with` block exits) and at interpreter exit.
+    """
+
+    def __init__(self, tulip_table: TulipTable, flush_interval: float = 1.0):
+        """
+        flush_interval: seconds between background flushes.
+        """
+        self.tulip_table = tulip_table
+        self.flush_interval = flush_interval
+
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _, __, ___):
+        self.close()
+
+    def increment_record_column(self, record_id: str, column_id: str, value: int):
+        """
+        Adds `value` to the pending increment for the given record/column.
+        """
+        key = (record_id, column_id)
+        with self._pending_lock:
+            self._pending[key] = self._pending.get(key, 0) + value
+
+    def flush(self) -> int:
+        """
+        PATCH `/tables/{tableId}/records/{recordId}/increment`
+
+        Sends every pending increment. Returns the # of PATCH requests made.
+        Increments that failed with a connection error, a timeout, a 429 or a 5xx response are kept for the next flush,
+        and the first such exception is raised once every increment was sent.
+        Other failures, such as a 4xx response for a deleted record, are dropped and reported.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                pending = [item for item in self._pending.items() if item[1] != 0]
+                self._pending = {}
+
+            failed: List[Tuple[Tuple[str, str], int]] = []
+            exception: Optional[Exception] = None
+            for (record_id, column_id), value in pending:
+                try:
+                    self.tulip_table.increment_record_column(
+                        record_id, column_id, value
+                    )
+                except Exception as e:
+                    if not is_retryable(e):
+                        print(
+                            f"Dropped the increment of {column_id} of record {record_id} by {value}\n{e}"
+                        )
+                        continue
+                    failed.append(((record_id, column_id), value))
+                    exception = exception or e
+            self._requeue(failed)
+
+            if exception is not None:
+                raise exception
+            return len(pending)
+
+    def close(self):
+        """
+        Stops the background flush and flushes all pending increments.
+
+        If the final flush raises, the increments are kept, and calling `close` again retries it.
+        """
+        if not self._closed.is_set():
+            self._closed.set()
+            self._flush_thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def _requeue(self, increments: List[Tuple[Tuple[str, str], int]]):
+        with self._pending_lock:
+            for key, value in increments:
+                self._pending[key] = self._pending.get(key, 0) + value
+
+    def _flush_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"There was an issue flushing record increments\n{e}")
@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Tuple
+
 from tulip_api.tulip_api import TulipAPI
+from tulip_api.tulip_table_link_bulk_result import TulipTableLinkBulkResult
 
 
 class TulipTableLink:
@@ -44,6 +48,50 @@ class TulipTableLink:
             json={"leftRecord": left_record_id, "rightRecord": right_record_id},
         )
 
+    def link_many(
+        self, pairs: Iterable[Tuple[str, str]], concurrency: int = 8
+    ) -> TulipTableLinkBulkResult:
+        """
+        PUT `/tableLinks/{linkId}/link`
+
+        Links every (left_record_id, right_record_id) pair, using up to `concurrency` requests at a time.
+        Repeated pairs are only linked once.
+
+        Failures don't stop the other pairs, they are collected in the returned result.
+        """
+        return self._bulk(self.link_records, pairs, concurrency)
+
+    def unlink_many(
+        self, pairs: Iterable[Tuple[str, str]], concurrency: int = 8
+    ) -> TulipTableLinkBulkResult:
+        """
+        PUT `/tableLinks/{linkId}/unlink`
+
+        Unlinks every (left_record_id, right_record_id) pair, using up to `concurrency` requests at a time.
+        Repeated pairs are only unlinked once.
+
+        Failures don't stop the other pairs, they are collected in the returned result.
+        """
+        return self._bulk(self.unlink_records, pairs, concurrency)
+
+    def _bulk(
+        self, operation, pairs: Iterable[Tuple[str, str]], concurrency: int
+    ) -> TulipTableLinkBulkResult:
+        result = TulipTableLinkBulkResult()
+        unique_pairs = TulipTableLinkBulkResult.deduplicate_pairs(pairs, result)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                (pair, executor.submit(operation, pair[0], pair[1]))
+                for pair in unique_pairs
+            ]
+            for pair, future in futures:
+                exception = future.exception()
+                if exception is None:
+                    result.succeeded.append(pair)
+                else:
+                    result.failed[pair] = exception
+        return result
+
     def _construct_base_table_link_path(self):
         return f"tableLinks/{self.link_id}"
 
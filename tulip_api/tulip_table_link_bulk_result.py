@@ -0,0 +1,39 @@
+from typing import Dict, Iterable, List, Tuple
+
+
+class TulipTableLinkBulkResult:
+    """
+    The outcome of a `link_many`/`unlink_many` call.
+
+    `succeeded`: the (left_record_id, right_record_id) pairs that were (un)linked.
+
+    `failed`: a dict of (left_record_id, right_record_id) pairs to the exception raised for that pair.
+
+    `duplicates`: the # of repeated pairs that were skipped.
+    """
+
+    def __init__(self):
+        self.succeeded: List[Tuple[str, str]] = []
+        self.failed: Dict[Tuple[str, str], Exception] = {}
+        self.duplicates = 0
+
+    def __repr__(self):
+        return (
+            f"TulipTableLinkBulkResult(succeeded={len(self.succeeded)}, "
+            f"failed={len(self.failed)}, duplicates={self.duplicates})"
+        )
+
+    @staticmethod
+    def deduplicate_pairs(
+        pairs: Iterable[Tuple[str, str]], result: "TulipTableLinkBulkResult"
+    ) -> List[Tuple[str, str]]:
+        seen = set()
+        unique_pairs = []
+        for pair in pairs:
+            pair = (pair[0], pair[1])
+            if pair in seen:
+                result.duplicates += 1
+                continue
+            seen.add(pair)
+            unique_pairs.append(pair)
+        return unique_pairs
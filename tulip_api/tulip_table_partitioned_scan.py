@@ -0,0 +1,251 @@
+import multiprocessing
+import os
+import queue
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Generator, List, Optional
+
+from tulip_api.tulip_table import TulipTable
+
+# Set in each worker process by `_initialize_stream_worker`.
+_stream_queue: Any = None
+_stream_stop: Any = None
+
+
+class TulipTablePartition:
+    """
+    A range of a Tulip Table: the records whose `field` is at or after `lower`, and before `upper`.
+    A `lower` or `upper` of None leaves that end of the range open.
+    """
+
+    def __init__(
+        self, index: int, field: str, lower: Optional[str], upper: Optional[str]
+    ):
+        self.index = index
+        self.field = field
+        self.lower = lower
+        self.upper = upper
+
+    def filters(self) -> List[Dict]:
+        filters = []
+        if self.lower is not None:
+            filters.append(
+                {
+                    "field": self.field,
+                    "functionType": "greaterThanOrEqual",
+                    "arg": self.lower,
+                }
+            )
+        if self.upper is not None:
+            filters.append(
+                {"field": self.field, "functionType": "lessThan", "arg": self.upper}
+            )
+        return filters
+
+    def __repr__(self):
+        return f"TulipTablePartition(index={self.index}, field={self.field!r}, lower={self.lower!r}, upper={self.upper!r})"
+
+
+class TulipTablePartitionedScan:
+    """
+    Scans a Tulip Table in parallel worker processes, one disjoint range of `_createdAt` or `id` per partition.
+
+    Partition boundaries are sampled from the table, so partitions hold about the same # of records.
+    Each worker fetches and decodes its partition's pages with `concurrency` requests in flight,
+    so decoding is spread across all of the host's cores instead of a single one.
+
+    Use `export_records` to write one file per partition, which scales best, or `stream_records` for a single merged stream.
+    """
+
+    partition_fields = {"_createdAt", "id"}
+
+    def __init__(
+        self,
+        tulip_table: TulipTable,
+        partition_by: str = "_createdAt",
+        partitions: Optional[int] = None,
+        processes: Optional[int] = None,
+        filters: List = [],
+        concurrency: int = 4,
+        chunk_size: int = 100,
+    ):
+        """
+        partition_by: `_createdAt` or `id`.
+        partitions: the # of ranges to split the table into. Defaults to `processes`.
+        processes: the # of worker processes. Defaults to the # of CPUs.
+        filters: only scan records matching all of these filters.
+        concurrency: the # of page requests in flight in each worker process.
+        """
+        if partition_by not in TulipTablePartitionedScan.partition_fields:
+            raise ValueError(
+                f"Unsupported partition field: {partition_by}. Must be one of {sorted(TulipTablePartitionedScan.partition_fields)}."
+            )
+        self.tulip_table = tulip_table
+        self.partition_by = partition_by
+        self.processes = processes or os.cpu_count() or 1
+        self.partitions = partitions or self.processes
+        self.filters = filters
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+
+    def plan(self) -> List[TulipTablePartition]:
+        """
+        Returns the partitions to scan. Boundaries are the `partition_by` values at evenly spaced offsets of the sorted table.
+
+        Fewer partitions are returned if many records share a boundary value.
+        """
+        count = self.tulip_table.get_record_count(filters=self.filters)
+        boundaries: List[str] = []
+        for index in range(1, self.partitions):
+            records = self.tulip_table.get_records(
+                limit=1,
+                offset=index * count // self.partitions,
+                filters=self.filters,
+                sort_by=self.partition_by,
+                sort_asc=True,
+            )
+            if len(records) == 0:
+                break
+            boundary = records[0][self.partition_by]
+            if len(boundaries) == 0 or boundary > boundaries[-1]:
+                boundaries.append(boundary)
+
+        lowers = [None] + boundaries
+        uppers = boundaries + [None]
+        return [
+            TulipTablePartition(index, self.partition_by, lower, upper)
+            for index, (lower, upper) in enumerate(zip(lowers, uppers))
+        ]
+
+    def stream_records(self, queue_size: int = 64) -> Generator[dict, None, None]:
+        """
+        Returns a Generator of every (filtered) record in the table.
+
+        Pages from all partitions are merged as they arrive, so records are in `partition_by` order
+        within a partition, but not across partitions.
+
+        `queue_size`: the # of pages buffered between the workers and this process.
+        Workers wait while the buffer is full.
+        """
+        partitions = self.plan()
+        context = multiprocessing.get_context()
+        stream_queue = context.Queue(queue_size)
+        stream_stop = context.Event()
+        with ProcessPoolExecutor(
+            max_workers=min(self.processes, len(partitions)),
+            initializer=_initialize_stream_worker,
+            initargs=(stream_queue, stream_stop),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _stream_partition,
+                    self.tulip_table,
+                    partition,
+                    self.filters,
+                    self.concurrency,
+                    self.chunk_size,
+                )
+                for partition in partitions
+            ]
+            try:
+                remaining = len(futures)
+                while remaining > 0:
+                    try:
+                        index, records = stream_queue.get(timeout=1)
+                    except queue.Empty:
+                        TulipTablePartitionedScan._raise_failures(futures)
+                        continue
+                    if records is None:
+                        remaining -= 1
+                        futures[index].result()
+                        continue
+                    for record in records:
+                        yield record
+            finally:
+                stream_stop.set()
+                for future in futures:
+                    future.cancel()
+
+    def export_records(
+        self,
+        directory: str,
+        file_format: str = "ndjson",
+        compress: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Exports each partition to its own file in `directory` with `TulipTable.export_records`.
+
+        Returns the # of exported records by file path.
+        """
+        partitions = self.plan()
+        extension = f"{file_format}.gz" if compress else file_format
+        paths = [
+            os.path.join(
+                directory,
+                f"{self.tulip_table.table_id}-{partition.index:04d}.{extension}",
+            )
+            for partition in partitions
+        ]
+        with ProcessPoolExecutor(
+            max_workers=min(self.processes, len(partitions))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.tulip_table.export_records,
+                    path,
+                    file_format=file_format,
+                    compress=compress,
+                    filters=self.filters + partition.filters(),
+                    sort_by=self.partition_by,
+                    sort_asc=True,
+                    chunk_size=self.chunk_size,
+                    concurrency=self.concurrency,
+                )
+                for partition, path in zip(partitions, paths)
+            ]
+            return {path: future.result() for path, future in zip(paths, futures)}
+
+    @staticmethod
+    def _raise_failures(futures: List[Future]):
+        for future in futures:
+            if future.done() and not future.cancelled():
+                future.result()
+
+
+def _initialize_stream_worker(stream_queue, stream_stop):
+    global _stream_queue, _stream_stop
+    _stream_queue = stream_queue
+    _stream_stop = stream_stop
+    # Every page is followed by the partition's end marker, which the main process always waits for,
+    # so a worker never needs to wait for its queued pages to be flushed when it exits.
+    stream_queue.cancel_join_thread()
+
+
+def _stream_partition(
+    tulip_table: TulipTable,
+    partition: TulipTablePartition,
+    filters: List,
+    concurrency: int,
+    chunk_size: int,
+):
+    try:
+        for records in tulip_table._stream_pages_concurrently(
+            concurrency,
+            chunk_size,
+            filters=filters + partition.filters(),
+            sort_by=partition.field,
+            sort_asc=True,
+        ):
+            if not _put_page(partition.index, records):
+                return
+    finally:
+        _put_page(partition.index, None)
+
+
+def _put_page(index: int, records: Optional[List[dict]]) -> bool:
+    while not _stream_stop.is_set():
+        try:
+            _stream_queue.put((index, records), timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
@@ -0,0 +1,207 @@
+import sys
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Any, Callable, Optional, TextIO, Union
+
+
+class TulipTableProgress:
+    """
+    The progress of a long-running operation, such as `create_records`, an upload or `stream_records`.
+
+    Operations count records with `advance`, which only calls the reporter once its `interval` has passed,
+    so reporting costs a clock read per call in between.
+    `total` is the # of records expected, or an estimate, and None if it isn't known.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        reporter: "ProgressReporting",
+        total: Optional[int] = None,
+        in_flight: Optional[Callable[[], int]] = None,
+    ):
+        self.operation = operation
+        self.reporter = TulipTableProgressReporter.open(reporter)
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.finished = False
+        self.started_at = time.monotonic()
+        self._in_flight = in_flight
+        self._next_report = self.started_at + self.reporter.interval
+
+    @staticmethod
+    def track(
+        progress: Union["ProgressReporting", "TulipTableProgress"],
+        operation: str,
+        total: Optional[int] = None,
+        in_flight: Optional[Callable[[], int]] = None,
+    ) -> Optional["TulipTableProgress"]:
+        """
+        Returns the progress of an operation for the `progress` an operation was called with, or None for no reporting.
+
+        A `TulipTableProgress` is returned as is, so an operation built on another one, like an upload
+        on `create_records`, reports as one operation. Only the operation that created the progress calls `finish`.
+        """
+        if progress is None or progress is False:
+            return None
+        if isinstance(progress, TulipTableProgress):
+            if progress._in_flight is None:
+                progress._in_flight = in_flight
+            return progress
+        return TulipTableProgress(operation, progress, total, in_flight)
+
+    @property
+    def in_flight(self) -> Optional[int]:
+        """
+        The # of requests in flight, or None if the operation doesn't track them.
+        """
+        return None if self._in_flight is None else self._in_flight()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        elapsed = self.elapsed
+        return (self.completed + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """
+        The # of seconds until the operation is done at the current rate, or None if `total` isn't known.
+        """
+        records_per_second = self.records_per_second
+        if self.total is None or records_per_second == 0:
+            return None
+        return max(0, self.total - self.completed - self.failed) / records_per_second
+
+    def advance(self, completed: int = 0, failed: int = 0):
+        self.completed += completed
+        self.failed += failed
+        now = time.monotonic()
+        if now >= self._next_report:
+            self._next_report = now + self.reporter.interval
+            self.reporter.report(self)
+
+    def finish(self):
+        if self.finished:
+            return
+        self.finished = True
+        self.reporter.finish(self)
+
+    def __str__(self):
+        done = self.completed + self.failed
+        parts = [f"{self.operation}: {done:,}"]
+        if self.total is not None:
+            percent = min(100.0, 100.0 * done / self.total) if self.total > 0 else 100.0
+            parts[0] += f" / {self.total:,} records ({percent:.1f}%)"
+        else:
+            parts[0] += " records"
+        parts.append(f"{self.records_per_second:,.0f} records/s")
+        in_flight = self.in_flight
+        if in_flight is not None and not self.finished:
+            parts.append(f"{in_flight} in flight")
+        if self.failed > 0:
+            parts.append(f"{self.failed:,} failed")
+        if self.finished:
+            parts.append(f"took {timedelta(seconds=int(self.elapsed))}")
+        else:
+            eta = self.eta
+            if eta is not None:
+                parts.append(f"ETA {timedelta(seconds=int(eta))}")
+        return ", ".join(parts)
+
+
+class TulipTableProgressReporter(ABC):
+    """
+    Receives the progress of long-running operations, at most once every `interval` seconds, and once when they finish.
+
+    Subclass it and implement `report` to send progress elsewhere.
+    Use `TulipTableProgressReporter.open` to create the reporter for `True` or a callback.
+    """
+
+    def __init__(self, interval: float = 1.0):
+        if interval < 0:
+            raise ValueError("interval must be at least 0.")
+        self.interval = interval
+
+    @abstractmethod
+    def report(self, progress: TulipTableProgress):
+        """
+        Reports the progress of an operation, and by default its final progress from `finish`.
+        """
+
+    def finish(self, progress: TulipTableProgress):
+        self.report(progress)
+
+    @staticmethod
+    def open(progress: "ProgressReporting") -> "TulipTableProgressReporter":
+        """
+        `progress`: `True` for the `ConsoleProgressReporter`, a callback, or a reporter.
+        """
+        if isinstance(progress, TulipTableProgressReporter):
+            return progress
+        if progress is True:
+            return ConsoleProgressReporter()
+        if callable(progress):
+            return CallbackProgressReporter(progress)
+        raise ValueError(
+            "progress must be True, a callback or a TulipTableProgressReporter."
+        )
+
+
+class ConsoleProgressReporter(TulipTableProgressReporter):
+    """
+    Writes progress to `file` (stderr by default), on a single updating line on a terminal,
+    and as a line every `interval` seconds (30 by default) otherwise, for example in a log file.
+    """
+
+    def __init__(self, file: Optional[TextIO] = None, interval: Optional[float] = None):
+        self.file = file or sys.stderr
+        isatty = getattr(self.file, "isatty", None)
+        self._terminal = isatty is not None and isatty()
+        if interval is None:
+            interval = 1.0 if self._terminal else 30.0
+        super().__init__(interval)
+        self._width = 0
+
+    def report(self, progress: TulipTableProgress):
+        self._write(str(progress), end="")
+
+    def finish(self, progress: TulipTableProgress):
+        self._write(str(progress), end="\n")
+
+    def _write(self, line: str, end: str):
+        if self._terminal:
+            # Pads over the rest of a longer previous line.
+            self.file.write(f"\r{line:<{self._width}}{end}")
+            self._width = 0 if end else len(line)
+        else:
+            self.file.write(line + "\n")
+        self.file.flush()
+
+
+class CallbackProgressReporter(TulipTableProgressReporter):
+    """
+    Calls `callback` with the `TulipTableProgress`.
+
+    With a `TulipAPI` given a `bulk_concurrency`, the callback runs on the background event loop's thread.
+    """
+
+    def __init__(
+        self, callback: Callable[[TulipTableProgress], Any], interval: float = 1.0
+    ):
+        super().__init__(interval)
+        self.callback = callback
+
+    def report(self, progress: TulipTableProgress):
+        self.callback(progress)
+
+
+# How operations report their progress: True for the console, a callback, or a reporter. None doesn't report.
+ProgressReporting = Optional[
+    Union[bool, Callable[[TulipTableProgress], Any], TulipTableProgressReporter]
+]
@@ -0,0 +1,173 @@
+import keyword
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+from dateutil import parser
+
+# Marks a field that hasn't been converted yet.
+_UNSET = object()
+
+
+class TulipTableRecord:
+    """
+    A read-only view of a raw Tulip Table record, whose fields are converted to Python types on first access.
+
+    Build a record type for a table's schema with `TulipTableRecord.record_type` (or `TulipTable.record_type`),
+    then wrap each raw record: `Record(record)`. Wrapping only stores the dict, each field is converted once,
+    when it is first read, and cached in a slot of the view.
+
+    Column types convert as follows:
+
+    - `timestamp`: timezone aware `datetime` in UTC
+    - `integer`: `int`
+    - `float`: `float`
+    - `boolean`: `bool`
+    - anything else: the raw value
+
+    Fields are read as attributes (`record.status`) when the column id is a valid identifier, or by key (`record["status"]`).
+    Fields that aren't in the schema are returned as is.
+    """
+
+    __slots__ = ("raw",)
+
+    # The field accessors of each record type, by field name.
+    _getters: Dict[str, Callable[["TulipTableRecord"], Any]] = {}
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+
+    @staticmethod
+    def record_type(
+        table_columns: List[Dict],
+        columns: Optional[List[str]] = None,
+        name: str = "Record",
+    ) -> Type["TulipTableRecord"]:
+        """
+        Returns a `TulipTableRecord` subclass for a table's schema.
+
+        table_columns: the `columns` of the table's `get_details` schema.
+        columns: only convert these columns. Defaults to every column in the schema.
+        """
+        column_types = {
+            column["name"]: column["dataType"]["type"] for column in table_columns
+        }
+        column_types.setdefault("id", "string")
+        column_types.setdefault("_createdAt", "timestamp")
+        column_types.setdefault("_updatedAt", "timestamp")
+        if columns is not None:
+            column_types = {
+                column: column_types.get(column, "string") for column in columns
+            }
+
+        return TulipTableRecord._build_type(name, column_types)
+
+    @staticmethod
+    def _build_type(
+        name: str, column_types: Dict[str, str]
+    ) -> Type["TulipTableRecord"]:
+        # Like `collections.namedtuple`, the accessors are generated source, so reading a field
+        # costs a slot read and an identity check, instead of a chain of descriptor calls.
+        namespace: Dict[str, Any] = {"_UNSET": _UNSET}
+        slots = []
+        lines = []
+        getters = {}
+        for index, (field, column_type) in enumerate(column_types.items()):
+            convert = _converters.get(column_type)
+            if convert is None:
+                lines += [
+                    f"def _get_{index}(self):",
+                    f"    return self.raw.get({field!r})",
+                ]
+            else:
+                slot = f"_field_{index}"
+                slots.append(slot)
+                namespace[f"_convert_{index}"] = convert
+                lines += [
+                    f"def _get_{index}(self):",
+                    f"    value = self.{slot}",
+                    "    if value is _UNSET:",
+                    f"        value = self.raw.get({field!r})",
+                    "        if value is not None:",
+                    f"            value = _convert_{index}(value)",
+                    f"        self.{slot} = value",
+                    "    return value",
+                ]
+            getters[field] = f"_get_{index}"
+        lines += ["def __init__(self, raw):", "    self.raw = raw"]
+        if len(slots) > 0:
+            lines.append(f"    self.{' = self.'.join(slots)} = _UNSET")
+        exec("\n".join(lines), namespace)
+
+        attributes: Dict[str, Any] = {
+            "__slots__": tuple(slots),
+            "__init__": namespace["__init__"],
+            "_getters": {field: namespace[getter] for field, getter in getters.items()},
+        }
+        for field, getter in getters.items():
+            if (
+                field.isidentifier()
+                and not keyword.iskeyword(field)
+                and not hasattr(TulipTableRecord, field)
+            ):
+                attributes[field] = property(namespace[getter])
+        return type(name, (TulipTableRecord,), attributes)
+
+    def __getitem__(self, field: str) -> Any:
+        getter = self._getters.get(field)
+        if getter is None or field not in self.raw:
+            return self.raw[field]
+        return getter(self)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        if field not in self.raw:
+            return default
+        return self[field]
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def keys(self):
+        return self.raw.keys()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a new dict of every field, converted.
+        """
+        return {field: self[field] for field in self.raw}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TulipTableRecord):
+            return self.raw == other.raw
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.raw!r})"
+
+
+def _to_datetime(value: str) -> datetime:
+    try:
+        # Much faster than `dateutil`, and handles the API's own `2023-03-01T12:00:00.000Z` format.
+        converted = datetime.fromisoformat(
+            value[:-1] + "+00:00" if value[-1:] == "Z" else value
+        )
+    except ValueError:
+        converted = parser.isoparse(value)
+    if converted.tzinfo is timezone.utc:
+        return converted
+    if converted.tzinfo is None:
+        return converted.replace(tzinfo=timezone.utc)
+    return converted.astimezone(timezone.utc)
+
+
+_converters: Dict[str, Callable[[Any], Any]] = {
+    "timestamp": _to_datetime,
+    "integer": int,
+    "float": float,
+    "boolean": bool,
+}
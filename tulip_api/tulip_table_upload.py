@@ -0,0 +1,77 @@
+from typing import Dict, Iterator, Optional
+
+from tulip_api.tulip_table import TulipTable
+from tulip_api.tulip_table_dead_letter import DeadLetters
+from tulip_api.tulip_table_progress import ProgressReporting, TulipTableProgress
+from tulip_api.tulip_table_upload_source import TulipTableUploadSource
+
+
+class TulipTableUploader:
+    """
+    Creates a record in a Tulip Table for every record of a `TulipTableUploadSource`.
+
+    Records are read a batch at a time, and streamed into `TulipTable.create_records`,
+    so a TulipAPI with a `bulk_concurrency` uploads them concurrently with bounded memory.
+    """
+
+    tulip_table: TulipTable
+
+    def __init__(
+        self,
+        tulip_table: TulipTable,
+        source: TulipTableUploadSource,
+        batch_size: int = 1000,
+    ):
+        """
+        batch_size: the # of records read from the source at a time.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self.tulip_table = tulip_table
+        self.source = source
+        self.batch_size = batch_size
+
+    def execute(
+        self,
+        create_random_id=False,
+        warn_on_failure=False,
+        dead_letters: DeadLetters = None,
+        progress: ProgressReporting = None,
+    ) -> int:
+        """
+        Returns the # of successfully created records.
+
+        `warn_on_failure`: set to True if you want to continue with creating the rest of the records
+        , despite a malformed request.
+
+        `dead_letters`: receives each record that failed. See `TulipTable.create_records`.
+
+        `progress`: reports the progress. See `TulipTable.create_records`. The ETA is based on the source's `total`.
+        """
+        column_types = None
+        if not self.source.typed:
+            column_types = {
+                column["name"]: column["dataType"]["type"]
+                for column in self.tulip_table.get_details()["columns"]
+            }
+            self.source.validate(column_types)
+        tracker = TulipTableProgress.track(
+            progress, "upload", None if progress is None else self.source.total()
+        )
+        try:
+            return self.tulip_table.create_records(
+                self._yield_records(column_types),
+                create_random_id=create_random_id,
+                warn_on_failure=warn_on_failure,
+                dead_letters=dead_letters,
+                progress=tracker,
+            )
+        finally:
+            if tracker is not None:
+                tracker.finish()
+
+    def _yield_records(self, column_types: Optional[Dict[str, str]]) -> Iterator[dict]:
+        for batch in self.source.batches(self.batch_size):
+            if column_types is not None:
+                batch = self.source.coerce(batch, column_types)
+            yield from batch
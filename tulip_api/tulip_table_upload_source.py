@@ -0,0 +1,376 @@
+import gzip
+import io
+import os
+from abc import ABC, abstractmethod
+from csv import DictReader
+from datetime import date, datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    TextIO,
+    Union,
+)
+
+from dateutil import parser
+
+from tulip_api.exceptions import TulipAPIOptionalDependencyMissing
+from tulip_api.serializers import JSONSerializer, default_serializer
+
+
+class TulipTableUploadSource(ABC):
+    """
+    The records uploaded by a `TulipTableUploader`, read a batch at a time so memory stays bounded.
+
+    `typed` sources yield values that are already JSON types, and are uploaded as is.
+    Other sources yield strings, which are coerced to the table's column types with `coerce`.
+    Subclass it and implement `batches` to upload from another source.
+    """
+
+    typed: bool = True
+
+    @abstractmethod
+    def batches(self, batch_size: int) -> Iterator[List[dict]]:
+        """
+        Yields lists of at most `batch_size` records.
+        """
+
+    def total(self) -> Optional[int]:
+        """
+        Returns the # of records, or an estimate, if it is cheap to know. Used for the ETA of progress reports.
+        """
+        return None
+
+    def coerce(self, records: List[dict], column_types: Dict[str, str]) -> List[dict]:
+        """
+        Returns the records with their values converted to the table's column types. Only called for untyped sources.
+        """
+        return records
+
+    def validate(self, column_types: Dict[str, str]):
+        """
+        Raises if the source doesn't match the table's columns. Called before any record is uploaded, for untyped sources.
+        """
+        pass
+
+
+class CSVSource(TulipTableUploadSource):
+    """
+    Rows of a CSV file. The header must only contain the table's column ids, which is checked before any record is uploaded.
+
+    Every value is read as a string, and coerced to its column's type.
+    """
+
+    typed = False
+
+    def __init__(self, csv_file: Union[str, TextIO]):
+        self.csv_file = csv_file
+        # The header of a file object, once `validate` has read it.
+        self._fieldnames: Optional[List[str]] = None
+
+    def batches(self, batch_size: int) -> Iterator[List[dict]]:
+        if isinstance(self.csv_file, str):
+            with open(self.csv_file, "r") as csv_file:
+                yield from _batched(DictReader(csv_file), batch_size)
+        else:
+            yield from _batched(
+                DictReader(self.csv_file, fieldnames=self._fieldnames), batch_size
+            )
+
+    def validate(self, column_types: Dict[str, str]):
+        if isinstance(self.csv_file, str):
+            with open(self.csv_file, "r") as csv_file:
+                fieldnames = DictReader(csv_file).fieldnames
+        else:
+            # A file object can't be read twice, so `batches` reuses the header.
+            if self._fieldnames is None:
+                self._fieldnames = DictReader(self.csv_file).fieldnames
+            fieldnames = self._fieldnames
+        for fieldname in fieldnames or []:
+            if fieldname not in column_types:
+                raise Exception(
+                    f"Column {fieldname} is not found in the Tulip Table columns."
+                )
+
+    def total(self) -> Optional[int]:
+        if not isinstance(self.csv_file, str):
+            return None
+        # Less the header.
+        return max(0, _estimate_lines(self.csv_file) - 1)
+
+    def coerce(self, records: List[dict], column_types: Dict[str, str]) -> List[dict]:
+        return [
+            CSVSource._coerce_record_types(record, column_types) for record in records
+        ]
+
+    @staticmethod
+    def _coerce_type(value: Any, type: str):
+        if type == "string":
+            return str(value)
+        if type == "integer":
+            if isinstance(value, str):
+                return int(float(value))
+            return int(value)
+        if type == "float":
+            return float(value)
+        if type == "boolean":
+            return bool(value)
+        if type == "timestamp":
+            return parser.parse(value, ignoretz=True).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        raise Exception(f"Unsupported datatype: {type}. Value: {value}")
+
+    @staticmethod
+    def _coerce_record_types(record: Dict[str, Any], column_types: Dict[str, str]):
+        new_record = {}
+        for column_id, value in record.items():
+            if column_id not in column_types:
+                raise Exception(
+                    f"Column {column_id} found in record, but not in table."
+                )
+            new_record[column_id] = CSVSource._coerce_type(
+                value, column_types[column_id]
+            )
+        return new_record
+
+
+class NDJSONSource(TulipTableUploadSource):
+    """
+    One JSON record per line, as written by `TulipTable.export_records(file_format="ndjson")`.
+
+    Files ending in `.gz` are decompressed.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, TextIO],
+        serializer: Optional[JSONSerializer] = None,
+    ):
+        """
+        serializer: decodes the lines. Defaults to `default_serializer()`.
+        """
+        self.file = file
+        self.serializer = serializer or default_serializer()
+
+    def batches(self, batch_size: int) -> Iterator[List[dict]]:
+        if not isinstance(self.file, str):
+            yield from _batched(self._records(self.file), batch_size)
+        elif self.file.endswith(".gz"):
+            with io.TextIOWrapper(gzip.open(self.file, "rb"), encoding="utf-8") as file:
+                yield from _batched(self._records(file), batch_size)
+        else:
+            with open(self.file, "r", encoding="utf-8") as file:
+                yield from _batched(self._records(file), batch_size)
+
+    def total(self) -> Optional[int]:
+        if not isinstance(self.file, str) or self.file.endswith(".gz"):
+            return None
+        return _estimate_lines(self.file)
+
+    def _records(self, file: TextIO) -> Iterator[dict]:
+        for line in file:
+            if line.strip():
+                yield self.serializer.loads(line)
+
+
+class IterableSource(TulipTableUploadSource):
+    """
+    Records from any iterable of dicts, such as a list or a Generator.
+
+    Set `typed=False` if the values are strings that should be coerced to the table's column types.
+    """
+
+    def __init__(self, records: Iterable[dict], typed: bool = True):
+        self.records = records
+        self.typed = typed
+
+    def batches(self, batch_size: int) -> Iterator[List[dict]]:
+        yield from _batched(self.records, batch_size)
+
+    def total(self) -> Optional[int]:
+        return len(self.records) if isinstance(self.records, Sized) else None
+
+    def coerce(self, records: List[dict], column_types: Dict[str, str]) -> List[dict]:
+        return [
+            CSVSource._coerce_record_types(record, column_types) for record in records
+        ]
+
+
+class ArrowSource(TulipTableUploadSource):
+    """
+    Records from a `pyarrow.Table`, a `pyarrow.RecordBatch`, or an iterable of either. Requires `pyarrow`.
+
+    Only one batch of records is converted to Python at a time. Timestamps are uploaded as UTC.
+    """
+
+    def __init__(self, data: Any):
+        try:
+            import pyarrow
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("pyarrow", "parquet")
+        self._pyarrow = pyarrow
+        self.data = data
+
+    def batches(self, batch_size: int) -> Iterator[List[dict]]:
+        pyarrow = self._pyarrow
+        data = self.data
+        if isinstance(data, (pyarrow.Table, pyarrow.RecordBatch)):
+            data = [data]
+        for table in data:
+            yield from _arrow_batches(pyarrow, table, batch_size)
+
+    def total(self) -> Optional[int]:
+        if isinstance(self.data, (self._pyarrow.Table, self._pyarrow.RecordBatch)):
+            return self.data.num_rows
+        if isinstance(self.data, (list, tuple)):
+            return sum(table.num_rows for table in self.data)
+        return None
+
+
+class ParquetSource(TulipTableUploadSource):
+    """
+    Records of a Parquet file, such as one written by `TulipTable.export_records(file_format="parquet")`.
+    Requires `pyarrow`.
+
+    The file is read one row group at a time, and memory-mapped when `memory_map` is set,
+    so memory stays bounded by the size of a row group.
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        columns: Optional[List[str]] = None,
+        memory_map: bool = True,
+    ):
+        """
+        columns: only upload these columns. Defaults to every column of the file.
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("pyarrow", "parquet")
+        self._pyarrow = pyarrow
+        self.file = file
+        self.columns = columns
+        self.memory_map = memory_map
+
+    def batches(self, batch_size: int) -> Iterator[List[dict]]:
+        pyarrow = self._pyarrow
+        parquet_file = pyarrow.parquet.ParquetFile(
+            self.file, memory_map=self.memory_map
+        )
+        try:
+            for index in range(parquet_file.num_row_groups):
+                row_group = parquet_file.read_row_group(index, columns=self.columns)
+                yield from _arrow_batches(pyarrow, row_group, batch_size)
+        finally:
+            parquet_file.close()
+
+    def total(self) -> Optional[int]:
+        # Only reads the file's footer.
+        parquet_file = self._pyarrow.parquet.ParquetFile(
+            self.file, memory_map=self.memory_map
+        )
+        try:
+            return parquet_file.metadata.num_rows
+        finally:
+            parquet_file.close()
+
+
+class DataFrameSource(TulipTableUploadSource):
+    """
+    Rows of a pandas DataFrame, or of an iterable of DataFrames, such as `pandas.read_csv(..., chunksize=...)`.
+    Requires `pandas`.
+
+    Missing values are uploaded as null, and timestamps as UTC.
+    """
+
+    def __init__(self, data: Any):
+        try:
+            import pandas
+        except ImportError:
+            raise TulipAPIOptionalDependencyMissing("pandas", "dataframe")
+        self._pandas = pandas
+        self.data = data
+
+    def batches(self, batch_size: int) -> Iterator[List[dict]]:
+        data = self.data
+        if isinstance(data, self._pandas.DataFrame):
+            data = [data]
+        for dataframe in data:
+            for start in range(0, len(dataframe), batch_size):
+                yield self._records(dataframe.iloc[start : start + batch_size])
+
+    def total(self) -> Optional[int]:
+        if isinstance(self.data, self._pandas.DataFrame):
+            return len(self.data)
+        if isinstance(self.data, (list, tuple)):
+            return sum(len(dataframe) for dataframe in self.data)
+        return None
+
+    def _records(self, dataframe: Any) -> List[dict]:
+        pandas = self._pandas
+        columns = {}
+        for name, column in dataframe.items():
+            if pandas.api.types.is_datetime64_any_dtype(column.dtype):
+                if column.dt.tz is not None:
+                    column = column.dt.tz_convert("UTC")
+                column = column.dt.strftime("%Y-%m-%dT%H:%M:%S.%f").str[:-3] + "Z"
+            columns[name] = column.astype(object).where(column.notna(), None)
+        return pandas.DataFrame(columns).to_dict("records")
+
+
+def _batched(records: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+    batch: List[dict] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if len(batch) > 0:
+        yield batch
+
+
+def _estimate_lines(path: str, sample_size: int = 1 << 20) -> int:
+    """
+    Returns the # of lines of a file, estimated from its size and the lines of its first `sample_size` bytes.
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        sample = file.read(sample_size)
+    lines = sample.count(b"\n")
+    if len(sample) >= size:
+        return lines + (1 if sample and not sample.endswith(b"\n") else 0)
+    return round(size * lines / len(sample))
+
+
+def _arrow_batches(pyarrow: Any, table: Any, batch_size: int) -> Iterator[List[dict]]:
+    # Only timestamp and date values need converting, so the other columns are left as returned by `to_pylist`.
+    converted = [
+        field.name
+        for field in table.schema
+        if pyarrow.types.is_timestamp(field.type) or pyarrow.types.is_date(field.type)
+    ]
+    batches = [table] if isinstance(table, pyarrow.RecordBatch) else table.to_batches()
+    for record_batch in batches:
+        for start in range(0, record_batch.num_rows, batch_size):
+            records = record_batch.slice(start, batch_size).to_pylist()
+            for record in records:
+                for name in converted:
+                    record[name] = _format_timestamp(record[name])
+            yield records
+
+
+def _format_timestamp(value: Optional[date]) -> Optional[str]:
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        return value.isoformat()
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
@@ -0,0 +1,97 @@
+import json
+import os
+from typing import Dict, List, Optional, Set
+
+
+class TulipTableWatermark:
+    """
+    The position of a `TulipTable.watch` change feed: the latest `_updatedAt` seen,
+    and the ids of the records already seen at exactly that `_updatedAt`.
+
+    If `path` is set, the watermark is loaded from that file if it exists, and `save` atomically writes it back,
+    so a restarted watch resumes where it left off.
+    """
+
+    def __init__(self, path: Optional[str] = None, updated_at: Optional[str] = None):
+        """
+        updated_at: where a new watermark starts. Records updated at or after it are yielded.
+            Defaults to the beginning of the table. Ignored if the watermark is loaded from `path`.
+        """
+        self.path = path
+        self.updated_at = updated_at
+        self.ids: Set[str] = set()
+        if path is not None and os.path.exists(path):
+            with open(path, "r") as watermark:
+                state = json.load(watermark)
+            self.updated_at = state["updated_at"]
+            self.ids = set(state["ids"])
+
+    def filters(self) -> List[Dict]:
+        """
+        Returns the filter that selects records at or after the watermark.
+        """
+        if self.updated_at is None:
+            return []
+        return [
+            {
+                "field": "_updatedAt",
+                "functionType": "greaterThanOrEqual",
+                "arg": self.updated_at,
+            }
+        ]
+
+    def is_new(self, record: Dict) -> bool:
+        updated_at = record["_updatedAt"]
+        if self.updated_at is None or updated_at > self.updated_at:
+            return True
+        return updated_at == self.updated_at and record["id"] not in self.ids
+
+    def advance(self, record: Dict):
+        """
+        Moves the watermark past a record. Records must be advanced in `_updatedAt` order.
+        """
+        updated_at = record["_updatedAt"]
+        if self.updated_at is None or updated_at > self.updated_at:
+            self.updated_at = updated_at
+            self.ids = set()
+        self.ids.add(record["id"])
+
+    def save(self):
+        if self.path is None:
+            return
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as watermark:
+            json.dump(
+                {"updated_at": self.updated_at, "ids": sorted(self.ids)}, watermark
+            )
+        os.replace(temporary_path, self.path)
+
+
+class TulipTableWatchInterval:
+    """
+    The adaptive poll interval of a `TulipTable.watch` change feed.
+
+    Polls every `min_interval` seconds while changes are flowing,
+    and backs off by `backoff` after each idle poll, up to `max_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff = backoff
+        self.interval = min_interval
+
+    def next_interval(self, changes: int) -> float:
+        """
+        Returns the seconds to wait before the next poll, given the # of changes found by the last poll.
+        """
+        if changes > 0:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        return self.interval